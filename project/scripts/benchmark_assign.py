@@ -0,0 +1,88 @@
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import pairwise_distances_argmin
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from project.src.data.ai_analysis import AIAnalysis
+from project.src.data.cluster_model import ClusterModel
+
+def make_data(n_rows: int, n_cols: int, n_centers: int) -> pd.DataFrame:
+    """
+    Kümelenmiş rastgele sayısal veri üretir
+    
+    Args:
+        n_rows (int): Satır sayısı
+        n_cols (int): Sütun sayısı
+        n_centers (int): Gerçek küme sayısı
+        
+    Returns:
+        pd.DataFrame: Örnek veri
+    """
+    rng = np.random.default_rng(42)
+    centers = rng.normal(scale=5.0, size=(n_centers, n_cols))
+    values = centers[rng.integers(n_centers, size=n_rows)] + rng.normal(size=(n_rows, n_cols))
+    return pd.DataFrame(values * rng.uniform(1, 100, size=n_cols), columns=[f"x{i}" for i in range(n_cols)])
+
+def rate(func, n_rows: int, repeat: int = 3) -> tuple:
+    """
+    Fonksiyonun en iyi süresini ve saniyedeki satır sayısını ölçer
+    
+    Returns:
+        tuple: (sonuç, saniye, satır/saniye)
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best, n_rows / best
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="ClusterModel.assign verim ölçümü")
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--cols', type=int, default=32)
+    parser.add_argument('--clusters', type=int, default=16)
+    parser.add_argument('--fit-rows', type=int, default=50_000)
+    parser.add_argument('--batch', type=int, default=1024, help="Çevrimiçi istek başına satır sayısı")
+    args = parser.parse_args()
+    
+    data = make_data(args.rows, args.cols, args.clusters)
+    results = AIAnalysis().perform_clustering(data.iloc[:args.fit_rows], method='kmeans', n_clusters=args.clusters)
+    
+    # Diskten yüklenen model, servis tarafındaki kullanımla aynı
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/cluster_model.json"
+        ClusterModel.from_results(results).save(path)
+        models = {dtype: ClusterModel.load(path, dtype=dtype) for dtype in ('float32', 'float64')}
+    model = models['float64']
+    values = data.to_numpy()
+    print(f"Veri: {args.rows} x {args.cols}, k={args.clusters}")
+    
+    # Referans: tüm veriyi ölçekleyip mesafe argmin'i
+    reference, elapsed, speed = rate(
+        lambda: pairwise_distances_argmin((values - model.mean) / model.scale, model.centers), args.rows, repeat=1
+    )
+    print(f"{'sklearn argmin':>22}: {elapsed:7.3f} s, {speed:14,.0f} satır/s")
+    
+    for dtype, candidate in models.items():
+        labels, elapsed, speed = rate(lambda: candidate.assign(values), args.rows)
+        agreement = (labels == reference).mean()
+        print(f"{'assign ' + dtype:>22}: {elapsed:7.3f} s, {speed:14,.0f} satır/s, referansla uyum: {agreement:.6f}")
+        
+    # Küçük çevrimiçi istekler: DataFrame girdisi, sütun seçimi dahil
+    batches = [data.iloc[start:start + args.batch] for start in range(0, min(args.rows, 200 * args.batch), args.batch)]
+    n_batch_rows = sum(len(batch) for batch in batches)
+    _, elapsed, speed = rate(lambda: [models['float32'].assign(batch) for batch in batches], n_batch_rows)
+    print(f"{'çevrimiçi ' + str(args.batch) + ' satır':>22}: {elapsed / len(batches) * 1e3:7.3f} ms/istek, "
+          f"{speed:14,.0f} satır/s")
+
+if __name__ == "__main__":
+    main()
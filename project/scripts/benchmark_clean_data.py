@@ -0,0 +1,81 @@
+import sys
+import time
+import tracemalloc
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from project.src.data.data_operations import DataOperations
+
+def make_data(n_rows: int, n_cols: int, missing_ratio: float = 0.05) -> pd.DataFrame:
+    """
+    Eksik değerler içeren rastgele sayısal veri üretir
+    
+    Args:
+        n_rows (int): Satır sayısı
+        n_cols (int): Sütun sayısı
+        missing_ratio (float): Eksik hücre oranı
+        
+    Returns:
+        pd.DataFrame: Örnek veri
+    """
+    rng = np.random.default_rng(42)
+    values = rng.normal(size=(n_rows, n_cols))
+    values[rng.random(values.shape) < missing_ratio] = np.nan
+    return pd.DataFrame(values, columns=[f"x{i}" for i in range(n_cols)])
+
+def measure(ops: DataOperations, data: pd.DataFrame, config: dict) -> tuple:
+    """
+    clean_data çağrısının süresini ve tepe bellek artışını ölçer
+    
+    Returns:
+        tuple: (sonuç, saniye, tepe bellek baytı)
+    """
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = ops.clean_data(data, config)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="clean_data bellek karşılaştırması")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--cols', type=int, default=20)
+    parser.add_argument('--outliers', default='zscore', choices=['zscore', 'iqr'])
+    args = parser.parse_args()
+    
+    ops = DataOperations()
+    data = make_data(args.rows, args.cols)
+    config = {
+        'missing_values': {'strategy': 'mean'},
+        'outliers': {'method': args.outliers, 'threshold': 3}
+    }
+    frame_bytes = data.memory_usage(deep=True).sum()
+    print(f"Veri: {args.rows} x {args.cols} ({frame_bytes / 1024 ** 2:.1f} MiB)")
+    
+    reference, _, _ = measure(ops, data.copy(), config)
+    runs = [
+        ('pandas', config, data.copy()),
+        ('fused', dict(config, engine='fused'), data.copy()),
+        ('fused inplace', dict(config, engine='fused', inplace=True), data.copy())
+    ]
+    
+    for name, run_config, run_data in runs:
+        result, elapsed, peak = measure(ops, run_data, run_config)
+        same = result.shape == reference.shape and np.allclose(
+            result.to_numpy(), reference.to_numpy(), equal_nan=True
+        )
+        print(f"{name:>14}: {elapsed:7.3f} s, tepe bellek {peak / 1024 ** 2:8.1f} MiB "
+              f"({peak / frame_bytes:4.2f}x veri), sonuç aynı: {same}")
+
+if __name__ == "__main__":
+    main()
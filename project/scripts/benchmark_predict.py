@@ -0,0 +1,87 @@
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from project.src.data.regression import RegressionAnalysis
+from project.src.data.linear_predictor import LinearPredictor
+
+def make_data(n_rows: int, n_cols: int) -> tuple:
+    """
+    Doğrusal ilişkili rastgele sayısal veri üretir
+    
+    Args:
+        n_rows (int): Satır sayısı
+        n_cols (int): Sütun sayısı
+        
+    Returns:
+        tuple: (özellikler, hedef)
+    """
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(n_rows, n_cols)), columns=[f"x{i}" for i in range(n_cols)])
+    y = X.to_numpy() @ rng.normal(size=n_cols) + rng.normal(size=n_rows)
+    return X, y
+
+def latency(func, n_calls: int, repeat: int = 5) -> float:
+    """
+    Fonksiyonun çağrı başına en iyi süresini mikrosaniye olarak ölçer
+    
+    Returns:
+        float: Çağrı başına mikrosaniye
+    """
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(n_calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / n_calls * 1e6
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="LinearPredictor ile model.predict gecikme karşılaştırması")
+    parser.add_argument('--cols', type=int, default=32)
+    parser.add_argument('--train-rows', type=int, default=20_000)
+    parser.add_argument('--batches', type=int, nargs='+', default=[1, 16, 256, 4096, 65536])
+    parser.add_argument('--calls', type=int, default=2000, help="Toplu boyutu başına en fazla çağrı sayısı")
+    args = parser.parse_args()
+    
+    X, y = make_data(args.train_rows, args.cols)
+    regression = RegressionAnalysis()
+    models = {
+        'linear': regression.train_linear_regression(X, y)[0],
+        'ridge': regression.train_ridge_regression(X, y, alpha=1.0)[0],
+        'lasso': regression.train_lasso_regression(X, y, alpha=0.01)[0]
+    }
+    
+    # Diskten yüklenen tahminci, servis tarafındaki kullanımla aynı
+    predictors = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, model in models.items():
+            regression.export_predictor(model, f"{tmp}/{name}_predictor.json")
+            predictors[name] = LinearPredictor.load(f"{tmp}/{name}_predictor.json")
+            
+    rng = np.random.default_rng(0)
+    print(f"Özellik sayısı: {args.cols}")
+    print(f"{'model':>8} {'toplu':>7} {'predict µs':>12} {'ndarray µs':>12} {'DataFrame µs':>13} {'hızlanma':>9} {'en büyük fark':>14}")
+    for name, model in models.items():
+        predictor = predictors[name]
+        for batch in args.batches:
+            frame = pd.DataFrame(rng.normal(size=(batch, args.cols)), columns=X.columns)
+            values = frame.to_numpy()
+            n_calls = max(1, min(args.calls, 2_000_000 // batch))
+            
+            reference = latency(lambda: model.predict(frame), n_calls)
+            fast = latency(lambda: predictor.predict(values), n_calls)
+            fast_frame = latency(lambda: predictor.predict(frame), n_calls)
+            error = np.abs(predictor.predict(values) - model.predict(frame)).max()
+            print(f"{name:>8} {batch:>7} {reference:12.1f} {fast:12.1f} {fast_frame:13.1f} {reference / fast:8.1f}x {error:14.2e}")
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,194 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple, Union
 import logging
 from pathlib import Path
-from .data_operations import DataOperations
+from .data_operations import DataOperations, DataChunks
+from .mmap_dataset import MmapDataset
+from .online_stats import OnlineStatistics
+from .blocked_dbscan import BlockedDBSCAN
+from .correlation import CorrelationEngine
+from .result_store import ResultStore
+from .quantile_sketch import ColumnSketches
+from .stats_cache import StatisticsCache
 from .regression import RegressionAnalysis
-from sklearn.cluster import KMeans, DBSCAN
-from sklearn.decomposition import PCA
+from .cluster_model import ClusterModel
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn.preprocessing import StandardScaler
-import matplotlib.pyplot as plt
+from sklearn.metrics import silhouette_score, pairwise_distances_argmin_min
+from scipy.stats import norm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LogNorm
 import seaborn as sns
 import json
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _profile_block(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bir sütun bloğu için çeyrekleri ve IQR aykırı değer sayılarını hesaplar
+    
+    Süreç havuzunda çalıştırılabilmesi için modül seviyesinde tanımlıdır.
+    
+    Args:
+        values (np.ndarray): Satır x sütun sayısal blok (NaN eksik değer)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Q1, Q3 ve sütun başına aykırı değer sayısı
+    """
+    with np.errstate(invalid='ignore'):
+        if len(values):
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+        else:
+            q1 = q3 = np.full(values.shape[1], np.nan)
+        iqr = q3 - q1
+        counts = ((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)).sum(axis=0)
+    return q1, q3, counts
+
+
+def _kmeans_sweep(
+    X: np.ndarray,
+    ks: List[int],
+    sample_index: np.ndarray,
+    random_state: int = 42
+) -> List[Dict[str, Any]]:
+    """
+    Ardışık k değerleri için k-means'i sıcak başlangıçla çalıştırır
+    
+    İlk k soğuk (k-means++) başlar; sonraki her k, bir önceki çözümün
+    merkezlerine örneklemden D² ağırlıklı seçilen bir merkez eklenerek
+    başlatılır. Siluet skoru yalnızca sınırlı örneklem üzerinde hesaplanır.
+    Süreç havuzunda çalıştırılabilmesi için modül seviyesinde tanımlıdır.
+    
+    Args:
+        X (np.ndarray): Ölçeklenmiş veri
+        ks (List[int]): Artan sırada denenecek küme sayıları
+        sample_index (np.ndarray): Skorlama örnekleminin satır indeksleri
+        random_state (int): Rastgele tohum
+        
+    Returns:
+        List[Dict[str, Any]]: k başına merkezler, inertia ve siluet skoru
+    """
+    sample = X[sample_index]
+    rng = np.random.default_rng(random_state)
+    curve = []
+    centers = None
+    
+    for k in ks:
+        if centers is not None and len(centers) == k - 1:
+            _, distances = pairwise_distances_argmin_min(sample, centers)
+            weights = distances ** 2
+            total = weights.sum()
+            new_center = sample[rng.choice(len(sample), p=weights / total)] if total > 0 else sample[rng.integers(len(sample))]
+            model = KMeans(n_clusters=k, init=np.vstack([centers, new_center]), n_init=1, random_state=random_state)
+        else:
+            model = KMeans(n_clusters=k, random_state=random_state)
+        model.fit(X)
+        centers = model.cluster_centers_
+        
+        labels = model.labels_[sample_index]
+        n_labels = len(np.unique(labels))
+        silhouette = float(silhouette_score(sample, labels)) if 1 < n_labels < len(sample) else float('nan')
+        curve.append({
+            'k': k,
+            'centers': centers,
+            'inertia': float(model.inertia_),
+            'silhouette': silhouette,
+            'n_iter': int(model.n_iter_)
+        })
+    return curve
+
+
+def _density_grid(
+    x: np.ndarray,
+    y: np.ndarray,
+    bins: int = 200,
+    labels: Optional[np.ndarray] = None
+) -> Dict[str, Any]:
+    """
+    Noktaları 2B yoğunluk ızgarasına toplar
+    
+    Etiket verilirse her hücre için çoğunluk etiketi de hesaplanır. Bellek
+    kullanımı ızgara boyutu ve nokta sayısıyla doğrusaldır.
+    
+    Args:
+        x (np.ndarray): Yatay eksen değerleri
+        y (np.ndarray): Dikey eksen değerleri
+        bins (int): Eksen başına hücre sayısı
+        labels (Optional[np.ndarray]): Nokta etiketleri (kümeleme için)
+        
+    Returns:
+        Dict[str, Any]: 'counts' (y x x), 'extent' ve isteğe bağlı 'labels' ızgarası
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    
+    extent = []
+    for values in (x, y):
+        low, high = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        extent.extend([low, high])
+        
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=bins, range=[extent[:2], extent[2:]])
+    grid = {'counts': counts.T, 'extent': extent}
+    
+    if labels is not None:
+        labels = np.asarray(labels)[finite]
+        column = np.clip(np.searchsorted(x_edges, x, side='right') - 1, 0, bins - 1)
+        row = np.clip(np.searchsorted(y_edges, y, side='right') - 1, 0, bins - 1)
+        values, codes = np.unique(labels, return_inverse=True)
+        # Hücre ve etiket çiftleri sayılır, her hücrede en kalabalık etiket seçilir
+        pairs, pair_counts = np.unique((row * bins + column) * len(values) + codes, return_counts=True)
+        cells, pair_codes = pairs // len(values), pairs % len(values)
+        order = np.lexsort((pair_counts, cells))
+        last = np.r_[cells[order][1:] != cells[order][:-1], True]
+        majority = np.full(bins * bins, np.nan)
+        majority[cells[order][last]] = values[pair_codes[order][last]]
+        grid['labels'] = majority.reshape(bins, bins)
+    return grid
+
+
+def _render_plot(spec: Dict[str, Any]) -> str:
+    """
+    Tek bir grafiği başsız Agg tuvaline çizip kaydeder
+    
+    pyplot durumuna dokunmadığı için süreç havuzunda güvenle çalıştırılabilir.
+    
+    Args:
+        spec (Dict[str, Any]): Grafik tanımı ('kind', 'title', 'path' ve türe özgü veriler)
+        
+    Returns:
+        str: Kaydedilen dosya yolu
+    """
+    figure = Figure(figsize=(10, 8))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    
+    if spec['kind'] == 'heatmap':
+        sns.heatmap(spec['matrix'], annot=spec['annotate'], cmap='coolwarm', ax=ax)
+    elif spec['kind'] == 'scatter':
+        ax.scatter(spec['x'], spec['y'], c=spec.get('c'))
+    elif spec['kind'] == 'density':
+        grid = spec['grid']
+        if 'labels' in grid:
+            image = ax.imshow(grid['labels'], origin='lower', extent=grid['extent'],
+                              aspect='auto', interpolation='nearest', cmap='viridis')
+        else:
+            image = ax.imshow(np.ma.masked_equal(grid['counts'], 0), origin='lower', extent=grid['extent'],
+                              aspect='auto', interpolation='nearest', cmap='viridis', norm=LogNorm())
+        figure.colorbar(image, ax=ax)
+    else:
+        raise ValueError(f"Desteklenmeyen grafik türü: {spec['kind']}")
+        
+    ax.set_title(spec['title'])
+    figure.savefig(spec['path'])
+    return spec['path']
+
 
 class AIAnalysis:
     """
@@ -20,8 +198,20 @@ class AIAnalysis:
     yönetir ve görselleştirme sağlar.
     """
     
-    def __init__(self):
-        """AIAnalysis sınıfı başlatıcısı"""
+    def __init__(
+        self,
+        stats_cache: Optional[StatisticsCache] = None,
+        correlation: Optional[CorrelationEngine] = None,
+        keep_arrays: bool = False
+    ):
+        """
+        AIAnalysis sınıfı başlatıcısı
+        
+        Args:
+            stats_cache (Optional[StatisticsCache]): Aşamalar arasında paylaşılan özet önbelleği (None ise önbellek kapalı)
+            correlation (Optional[CorrelationEngine]): Korelasyon motoru (None ise pandas)
+            keep_arrays (bool): Satır başına sonuçları (etiketler, bileşenler) liste yerine NumPy dizisi olarak döndür
+        """
         # Loglama ayarları
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
@@ -37,36 +227,59 @@ class AIAnalysis:
         self.logger = logging.getLogger(__name__)
         
         # Alt sınıfları başlat
-        self.data_ops = DataOperations()
+        self.stats_cache = stats_cache if stats_cache is not None else StatisticsCache(max_frames=0)
+        self.correlation = correlation
+        self.keep_arrays = keep_arrays
+        self.data_ops = DataOperations(stats_cache=self.stats_cache)
         self.regression = RegressionAnalysis()
         
-    def analyze_data(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def analyze_data(
+        self,
+        data: Union[pd.DataFrame, DataChunks, MmapDataset],
+        quantiles: str = 'exact',
+        quantile_error: float = 0.01,
+        n_jobs: int = 1,
+        correlation_top_k: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Veriyi analiz eder
         
         Args:
-            data (pd.DataFrame): Analiz edilecek veri
+            data (Union[pd.DataFrame, DataChunks, MmapDataset]): Analiz edilecek veri, veri parçaları veya bellek eşlemeli veri seti
+            quantiles (str): Aykırı değer analizinde kantil hesabı (exact, approx)
+            quantile_error (float): approx modunda hedeflenen sıra hatası
+            n_jobs (int): Geniş tablolarda sütun profili için süreç sayısı
+            correlation_top_k (Optional[int]): Verilirse tam matris yerine sütun başına en güçlü k korelasyon
             
         Returns:
             Dict[str, Any]: Analiz sonuçları
         """
         try:
+            if isinstance(data, MmapDataset):
+                data = data.to_frame()
+            if isinstance(data, DataChunks):
+                return self._analyze_chunks(data, quantile_error)
+                
             # Temel istatistikler
-            stats = data.describe().to_dict()
+            stats = self.stats_cache.describe(data).to_dict()
             
             # Korelasyon analizi
-            corr = data.corr().to_dict()
+            if correlation_top_k is not None:
+                corr = (self.correlation or CorrelationEngine()).top_k(data, correlation_top_k)
+            else:
+                corr = self.correlation_matrix(data).to_dict()
             
             # Eksik değer analizi
-            missing = data.isnull().sum().to_dict()
+            missing = self.stats_cache.missing(data).to_dict()
             
             # Aykırı değer analizi
             outliers = {}
-            for col in data.select_dtypes(include=[np.number]).columns:
-                Q1 = data[col].quantile(0.25)
-                Q3 = data[col].quantile(0.75)
-                IQR = Q3 - Q1
-                outliers[col] = len(data[(data[col] < (Q1 - 1.5 * IQR)) | (data[col] > (Q3 + 1.5 * IQR))])
+            if quantiles == 'approx':
+                # Sıralama yerine birleştirilebilir KLL özetleriyle yaklaşık kantiller
+                bounds = self.data_ops.fit_quantile_sketches(data, quantile_error).iqr_bounds()
+                outliers = DataOperations._iqr_outliers(data, bounds).sum().astype(int).to_dict()
+            else:
+                outliers = self.profile_columns(data, n_jobs=n_jobs)['outliers']
                 
             results = {
                 'statistics': stats,
@@ -82,28 +295,239 @@ class AIAnalysis:
             self.logger.error(f"Veri analizi hatası: {e}")
             raise
             
-    def perform_clustering(
+    def _output_array(self, values: np.ndarray) -> Union[np.ndarray, List[Any]]:
+        """Satır başına sonucu keep_arrays ayarına göre dizi veya liste olarak döndürür"""
+        return values if self.keep_arrays else values.tolist()
+        
+    def correlation_matrix(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Korelasyon matrisini yapılandırılmış motorla, aşamalar arası önbellekli hesaplar
+        
+        Args:
+            data (pd.DataFrame): Veri seti
+            
+        Returns:
+            pd.DataFrame: Korelasyon matrisi
+        """
+        return self.stats_cache.corr(data, None if self.correlation is None else self.correlation.compute)
+        
+    def profile_columns(
         self,
         data: pd.DataFrame,
+        n_jobs: int = 1,
+        block_size: int = 256,
+        parallel_min_columns: int = 512
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Sayısal sütunların çeyreklerini ve IQR aykırı değer sayılarını hesaplar
+        
+        Sütunlar tek tek dolaşılmak yerine bloklar halinde matris işlemleriyle
+        profillenir. Geçici bellek blok boyutuyla sınırlıdır. Sütun sayısı
+        parallel_min_columns değerini aştığında ve n_jobs > 1 olduğunda bloklar
+        bir süreç havuzuna dağıtılır. Sonuçlar sütun bazlı döngüyle aynıdır.
+        
+        Args:
+            data (pd.DataFrame): Profillenecek veri
+            n_jobs (int): Süreç sayısı
+            block_size (int): Blok başına sütun sayısı
+            parallel_min_columns (int): Paralel çalışma için en az sütun sayısı
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 'q1', 'q3' ve 'outliers' sözlükleri
+        """
+        numeric = data.select_dtypes(include=[np.number])
+        columns = list(numeric.columns)
+        blocks = (
+            numeric.iloc[:, start:start + block_size].to_numpy(dtype=np.float64, na_value=np.nan)
+            for start in range(0, len(columns), block_size)
+        )
+        
+        if n_jobs > 1 and len(columns) >= max(parallel_min_columns, block_size + 1):
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                parts = list(executor.map(_profile_block, blocks))
+        else:
+            parts = [_profile_block(block) for block in blocks]
+            
+        q1 = np.concatenate([part[0] for part in parts]) if parts else np.empty(0)
+        q3 = np.concatenate([part[1] for part in parts]) if parts else np.empty(0)
+        counts = np.concatenate([part[2] for part in parts]) if parts else np.empty(0, dtype=int)
+        
+        return {
+            'q1': dict(zip(columns, q1.tolist())),
+            'q3': dict(zip(columns, q3.tolist())),
+            'outliers': dict(zip(columns, (int(count) for count in counts)))
+        }
+        
+    @staticmethod
+    def _coerce_numeric(chunk: pd.DataFrame, columns: List[Any]) -> pd.DataFrame:
+        """
+        Parçadan sütunları seçer; tipi ilk parçadan farklı çıkarılanları sayıya zorlar
+        
+        Args:
+            chunk (pd.DataFrame): Veri parçası
+            columns (List[Any]): İlk parçadaki sayısal sütunlar
+            
+        Returns:
+            pd.DataFrame: Sayısal sütunlar (sayı olmayan değerler NaN)
+        """
+        numeric = chunk[columns]
+        drifted = [col for col in columns if not pd.api.types.is_numeric_dtype(numeric[col])]
+        if drifted:
+            numeric = numeric.copy(deep=False)
+            for col in drifted:
+                numeric[col] = pd.to_numeric(numeric[col], errors='coerce')
+        return numeric
+        
+    def _analyze_chunks(self, chunks: DataChunks, quantile_error: float = 0.01) -> Dict[str, Any]:
+        """
+        Veri parçalarını analiz eder
+        
+        Sütun istatistikleri ve eksik değerler doğrudan, korelasyon ise ikili
+        tam gözlemler üzerinden biriktirilen çarpım toplamlarıyla hesaplanır.
+        Kantiller aynı geçişte KLL özetleriyle yaklaşık hesaplanır; aykırı
+        değerler ikinci bir geçişte sayılır. Bellek kullanımı satır sayısından
+        bağımsızdır.
+        
+        Args:
+            chunks (DataChunks): Analiz edilecek veri parçaları
+            quantile_error (float): Kantil özetleri için hedeflenen sıra hatası
+            
+        Returns:
+            Dict[str, Any]: Analiz sonuçları
+        """
+        missing = None
+        columns = None
+        shift = None
+        sums = {}
+        
+        for chunk in chunks:
+            chunk_missing = chunk.isnull().sum()
+            missing = chunk_missing if missing is None else missing.add(chunk_missing, fill_value=0)
+            
+            if columns is None:
+                columns = list(chunk.select_dtypes(include=[np.number]).columns)
+                sketches = ColumnSketches(quantile_error, columns)
+            # Sütunlar ilk parçadan sabitlenir
+            numeric = self._coerce_numeric(chunk, columns)
+            if shift is None:
+                # Sayısal kararlılık için ilk parçanın ortalamasına göre kaydırılır
+                shift = numeric.mean().fillna(0.0).to_numpy()
+            sketches.update(numeric)
+            values = numeric.to_numpy(dtype=float) - shift
+            mask = ~np.isnan(values)
+            values = np.where(mask, values, 0.0)
+            weights = mask.astype(float)
+            
+            parts = {
+                'n': weights.T @ weights,
+                'sx': values.T @ weights,
+                'sxx': (values ** 2).T @ weights,
+                'sxy': values.T @ values,
+                'min': np.where(mask, values, np.inf).min(axis=0, initial=np.inf),
+                'max': np.where(mask, values, -np.inf).max(axis=0, initial=-np.inf)
+            }
+            for key, value in parts.items():
+                if key not in sums:
+                    sums[key] = value
+                elif key == 'min':
+                    sums[key] = np.minimum(sums[key], value)
+                elif key == 'max':
+                    sums[key] = np.maximum(sums[key], value)
+                else:
+                    sums[key] = sums[key] + value
+                    
+        if columns is None:
+            raise ValueError("Analiz edilecek veri parçası bulunamadı")
+            
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = sums['n']
+            # sx[i, j]: i ve j birlikte gözlendiğinde i'nin toplamı
+            cov = sums['sxy'] - sums['sx'] * sums['sx'].T / n
+            var_i = sums['sxx'] - sums['sx'] ** 2 / n
+            corr = cov / np.sqrt(var_i * var_i.T)
+            
+            count = np.diag(n)
+            mean = np.diag(sums['sx']) / count
+            std = np.sqrt(np.diag(var_i) / (count - 1))
+            
+        stats = pd.DataFrame(
+            {
+                'count': count,
+                'mean': mean + shift,
+                'std': std,
+                'min': np.where(count > 0, sums['min'] + shift, np.nan),
+                '25%': sketches.quantile(0.25).to_numpy(),
+                '50%': sketches.quantile(0.5).to_numpy(),
+                '75%': sketches.quantile(0.75).to_numpy(),
+                'max': np.where(count > 0, sums['max'] + shift, np.nan)
+            },
+            index=columns
+        ).T
+        
+        # Aykırı değer analizi: sınırlar özetlerden, sayımlar ikinci geçişten
+        bounds = sketches.iqr_bounds()
+        outliers = pd.Series(0, index=columns)
+        for chunk in chunks:
+            outliers += DataOperations._iqr_outliers(self._coerce_numeric(chunk, columns), bounds).sum()
+            
+        results = {
+            'statistics': stats.to_dict(),
+            'correlation': pd.DataFrame(corr, index=columns, columns=columns).to_dict(),
+            'missing_values': missing.astype(int).to_dict(),
+            'outliers': outliers.astype(int).to_dict()
+        }
+        
+        self.logger.info("Veri parçaları üzerinde analiz başarıyla tamamlandı")
+        return results
+        
+    def perform_clustering(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks],
         method: str = 'kmeans',
         n_clusters: int = 3,
         eps: float = 0.5,
-        min_samples: int = 5
+        min_samples: int = 5,
+        batch_size: int = 4096,
+        max_epochs: int = 3,
+        index: str = 'kd_tree',
+        n_jobs: int = 1,
+        max_memory_bytes: int = 256 * 1024 ** 2,
+        k_range: Tuple[int, int] = (2, 10),
+        k_criterion: str = 'silhouette',
+        score_sample_size: int = 5000
     ) -> Dict[str, Any]:
         """
         Kümeleme analizi yapar
         
         Args:
-            data (pd.DataFrame): Kümeleme yapılacak veri
-            method (str): Kümeleme metodu (kmeans, dbscan)
+            data (Union[pd.DataFrame, MmapDataset, DataChunks]): Kümeleme yapılacak veri (DataChunks yalnızca minibatch_kmeans için)
+            method (str): Kümeleme metodu (kmeans, kmeans_auto, minibatch_kmeans, dbscan, dbscan_indexed)
             n_clusters (int): Küme sayısı (kmeans için)
             eps (float): Maksimum mesafe (dbscan için)
             min_samples (int): Minimum örnek sayısı (dbscan için)
+            batch_size (int): Mini yığın satır sayısı (minibatch_kmeans için)
+            max_epochs (int): Veri üzerinden en fazla geçiş sayısı (minibatch_kmeans için)
+            index (str): Uzamsal indeks (kd_tree, ball_tree; dbscan_indexed için)
+            n_jobs (int): Paralel süreç sayısı (dbscan_indexed ve kmeans_auto için)
+            max_memory_bytes (int): Komşuluk blokları için bellek sınırı (dbscan_indexed için)
+            k_range (Tuple[int, int]): Denenecek en küçük ve en büyük küme sayısı (kmeans_auto için)
+            k_criterion (str): k seçim ölçütü (silhouette, elbow; kmeans_auto için)
+            score_sample_size (int): Siluet skorunun hesaplandığı örneklem boyutu (kmeans_auto için)
             
         Returns:
             Dict[str, Any]: Kümeleme sonuçları
         """
         try:
+            if method == 'minibatch_kmeans':
+                return self._minibatch_kmeans(data, n_clusters, batch_size, max_epochs)
+            if isinstance(data, DataChunks):
+                raise ValueError(f"Veri parçaları yalnızca minibatch_kmeans ile kümelenebilir: {method}")
+            if method == 'kmeans_auto':
+                return self._kmeans_auto(data, k_range, k_criterion, score_sample_size, n_jobs)
+            columns = self._feature_columns(data)
+            if isinstance(data, MmapDataset):
+                data = data.values
+                
             # Veriyi ölçeklendir
             scaler = StandardScaler()
             scaled_data = scaler.fit_transform(data)
@@ -112,6 +536,14 @@ class AIAnalysis:
                 model = KMeans(n_clusters=n_clusters, random_state=42)
             elif method == 'dbscan':
                 model = DBSCAN(eps=eps, min_samples=min_samples)
+            elif method == 'dbscan_indexed':
+                model = BlockedDBSCAN(
+                    eps=eps,
+                    min_samples=min_samples,
+                    algorithm=index,
+                    n_jobs=n_jobs,
+                    max_memory_bytes=max_memory_bytes
+                )
             else:
                 raise ValueError(f"Desteklenmeyen kümeleme metodu: {method}")
                 
@@ -120,7 +552,7 @@ class AIAnalysis:
             
             # Sonuçları hazırla
             results = {
-                'labels': clusters.tolist(),
+                'labels': self._output_array(clusters),
                 'n_clusters': len(np.unique(clusters)),
                 'method': method
             }
@@ -128,6 +560,7 @@ class AIAnalysis:
             if method == 'kmeans':
                 results['centers'] = model.cluster_centers_.tolist()
                 results['inertia'] = model.inertia_
+                results['scaler'] = self._scaler_params(scaler.mean_, scaler.scale_, columns)
                 
             self.logger.info(f"{method} kümeleme analizi başarıyla tamamlandı")
             return results
@@ -136,33 +569,291 @@ class AIAnalysis:
             self.logger.error(f"Kümeleme analizi hatası: {e}")
             raise
             
+    def _kmeans_auto(
+        self,
+        data: Union[pd.DataFrame, MmapDataset],
+        k_range: Tuple[int, int] = (2, 10),
+        k_criterion: str = 'silhouette',
+        score_sample_size: int = 5000,
+        n_jobs: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Bir k aralığını tarayıp en iyi küme sayısını seçer
+        
+        Aralık n_jobs ardışık parçaya bölünür ve parçalar ayrı süreçlerde
+        taranır; her parçada k değerleri bir öncekinin merkezleriyle sıcak
+        başlatılır. Dirsek (inertia) eğrisi tam veriden, siluet skoru sabit
+        bir örneklemden hesaplanır.
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset]): Kümeleme yapılacak veri
+            k_range (Tuple[int, int]): Denenecek en küçük ve en büyük küme sayısı (dahil)
+            k_criterion (str): k seçim ölçütü (silhouette, elbow)
+            score_sample_size (int): Siluet örneklem boyutu
+            n_jobs (int): Paralel süreç sayısı
+            
+        Returns:
+            Dict[str, Any]: Seçilen modelin kümeleme sonuçları ve skor eğrisi
+        """
+        if k_criterion not in ('silhouette', 'elbow'):
+            raise ValueError(f"Desteklenmeyen k seçim ölçütü: {k_criterion}")
+        columns = self._feature_columns(data)
+        if isinstance(data, MmapDataset):
+            data = data.values
+        scaler = StandardScaler()
+        scaled_data = scaler.fit_transform(data)
+        
+        k_min, k_max = max(2, int(k_range[0])), min(int(k_range[1]), len(scaled_data) - 1)
+        if k_min > k_max:
+            raise ValueError(f"Geçersiz k aralığı: {k_range}")
+        ks = list(range(k_min, k_max + 1))
+        
+        rng = np.random.default_rng(42)
+        sample_index = np.sort(rng.choice(len(scaled_data), min(score_sample_size, len(scaled_data)), replace=False))
+        
+        segments = [list(segment) for segment in np.array_split(ks, min(max(1, n_jobs), len(ks)))]
+        if len(segments) > 1:
+            with ProcessPoolExecutor(max_workers=len(segments)) as executor:
+                parts = list(executor.map(
+                    _kmeans_sweep,
+                    [scaled_data] * len(segments),
+                    segments,
+                    [sample_index] * len(segments)
+                ))
+        else:
+            parts = [_kmeans_sweep(scaled_data, ks, sample_index)]
+        curve = [point for part in parts for point in part]
+        
+        inertia = np.array([point['inertia'] for point in curve])
+        silhouette = np.array([point['silhouette'] for point in curve])
+        if k_criterion == 'silhouette' and not np.isnan(silhouette).all():
+            best = int(np.nanargmax(silhouette))
+        else:
+            # Dirsek: normalize eğrinin uç noktaları birleştiren doğrudan en uzak noktası
+            span = inertia.max() - inertia.min()
+            normalized = (inertia - inertia.min()) / span if span > 0 else np.zeros_like(inertia)
+            position = np.linspace(0.0, 1.0, len(ks)) if len(ks) > 1 else np.zeros(1)
+            best = int(np.argmax((1.0 - position) - normalized))
+            
+        chosen = curve[best]
+        labels, _ = pairwise_distances_argmin_min(scaled_data, chosen['centers'])
+        
+        results = {
+            'labels': self._output_array(labels),
+            'n_clusters': len(np.unique(labels)),
+            'method': 'kmeans_auto',
+            'centers': chosen['centers'].tolist(),
+            'inertia': chosen['inertia'],
+            'scaler': self._scaler_params(scaler.mean_, scaler.scale_, columns),
+            'k_selection': {
+                'criterion': k_criterion,
+                'chosen_k': chosen['k'],
+                'k': ks,
+                'inertia': inertia.tolist(),
+                'silhouette': silhouette.tolist(),
+                'n_iter': [point['n_iter'] for point in curve],
+                'score_sample_size': len(sample_index)
+            }
+        }
+        
+        self.logger.info(f"kmeans_auto kümeleme analizi tamamlandı, seçilen k: {chosen['k']}")
+        return results
+        
+    @staticmethod
+    def _feature_columns(data: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]) -> Optional[List[str]]:
+        """Kümeleme özelliklerinin sütun adlarını döndürür (dizilerde None)"""
+        if isinstance(data, DataChunks):
+            return [str(col) for col in next(iter(data)).select_dtypes(include=[np.number]).columns]
+        if isinstance(data, (pd.DataFrame, MmapDataset)):
+            return [str(col) for col in data.columns]
+        return None
+        
+    @staticmethod
+    def _scaler_params(mean: np.ndarray, scale: np.ndarray, columns: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Ölçekleme parametrelerini ClusterModel için sözlüğe çevirir
+        
+        Args:
+            mean (np.ndarray): Ölçekleme ortalaması
+            scale (np.ndarray): Ölçekleme çarpanı
+            columns (Optional[List[str]]): Özellik sütunları
+            
+        Returns:
+            Dict[str, Any]: Ortalama, ölçek ve sütunlar
+        """
+        return {'mean': np.asarray(mean).tolist(), 'scale': np.asarray(scale).tolist(), 'columns': columns}
+        
+    @staticmethod
+    def _row_blocks(
+        data: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray],
+        block_rows: int
+    ) -> Callable[[], Iterator[np.ndarray]]:
+        """
+        Veriyi satır blokları halinde tekrar tekrar okunabilir hale getirir
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]): Veri
+            block_rows (int): Bellekteki veri için blok satır sayısı
+            
+        Returns:
+            Callable[[], Iterator[np.ndarray]]: Her çağrıda yeni bir blok yineleyicisi döndüren fonksiyon
+        """
+        if isinstance(data, DataChunks):
+            columns = list(next(iter(data)).select_dtypes(include=[np.number]).columns)
+            return lambda: (chunk[columns].to_numpy(dtype=np.float64) for chunk in data)
+            
+        values = data.values if isinstance(data, MmapDataset) else data
+        n_rows = len(values)
+        
+        def blocks() -> Iterator[np.ndarray]:
+            for start in range(0, n_rows, block_rows):
+                block = values[start:start + block_rows]
+                yield block.to_numpy(dtype=np.float64) if isinstance(block, pd.DataFrame) else np.asarray(block, dtype=np.float64)
+        return blocks
+        
+    @staticmethod
+    def _scaling_stats(blocks: Callable[[], Iterator[np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Bloklar üzerinden StandardScaler ile aynı ortalama ve ölçeği hesaplar
+        
+        Args:
+            blocks (Callable[[], Iterator[np.ndarray]]): Blok yineleyicisi üreten fonksiyon
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Ortalama ve ölçek (ddof=0, sabit sütunlarda 1)
+        """
+        stats = OnlineStatistics()
+        for block in blocks():
+            stats.update(pd.DataFrame(block, copy=False))
+        count = stats.count.to_numpy()
+        mean = stats.mean.to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.sqrt(stats.var.to_numpy() * (count - 1) / count)
+        scale[~(scale > 0)] = 1.0
+        return mean, scale
+        
+    def _minibatch_kmeans(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks],
+        n_clusters: int,
+        batch_size: int = 4096,
+        max_epochs: int = 3,
+        tol: float = 1e-4
+    ) -> Dict[str, Any]:
+        """
+        Mini yığın k-means ile sınırlı bellekte kümeleme yapar
+        
+        İlk geçişte ölçekleme için ortalama ve standart sapma biriktirilir;
+        sonraki geçişlerde her blok ölçeklenip partial_fit ile modele verilir.
+        Merkezler bir geçişte tol değerinden az değişirse durulur. Son geçişte
+        etiketler ve inertia blok blok hesaplanır. Bellekte aynı anda yalnızca
+        bir blok ve ölçeklenmiş kopyası bulunur; ilk partial_fit en az
+        n_clusters satır gerektirdiğinden bundan kısa ilk bloklar birleştirilir.
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks]): Kümeleme yapılacak veri
+            n_clusters (int): Küme sayısı
+            batch_size (int): Bellekteki veri için mini yığın satır sayısı
+            max_epochs (int): Veri üzerinden en fazla eğitim geçişi
+            tol (float): Merkez değişimi için durma eşiği
+            
+        Returns:
+            Dict[str, Any]: Kümeleme sonuçları
+        """
+        if max_epochs < 1:
+            raise ValueError(f"Geçersiz eğitim geçişi sayısı: {max_epochs}")
+        blocks = self._row_blocks(data, batch_size)
+        mean, scale = self._scaling_stats(blocks)
+        
+        model = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, random_state=42, n_init=3)
+        pending = None
+        for epoch in range(max_epochs):
+            previous = getattr(model, 'cluster_centers_', None)
+            previous = None if previous is None else previous.copy()
+            for block in blocks():
+                scaled = (block - mean) / scale
+                if not hasattr(model, 'cluster_centers_'):
+                    pending = scaled if pending is None else np.vstack([pending, scaled])
+                    if len(pending) < n_clusters:
+                        continue
+                    scaled, pending = pending, None
+                if len(scaled):
+                    model.partial_fit(scaled)
+            if pending is not None:
+                raise ValueError(f"Küme sayısı satır sayısından büyük: {n_clusters} > {len(pending)}")
+            if previous is not None and np.abs(model.cluster_centers_ - previous).max() < tol:
+                break
+                
+        labels = []
+        inertia = 0.0
+        for block in blocks():
+            if not len(block):
+                continue
+            distances = model.transform((block - mean) / scale)
+            block_labels = distances.argmin(axis=1)
+            inertia += float((distances[np.arange(len(block_labels)), block_labels] ** 2).sum())
+            labels.append(block_labels.astype(np.int32))
+        labels = np.concatenate(labels) if labels else np.empty(0, dtype=np.int32)
+        
+        results = {
+            'labels': self._output_array(labels),
+            'n_clusters': len(np.unique(labels)),
+            'method': 'minibatch_kmeans',
+            'centers': model.cluster_centers_.tolist(),
+            'inertia': inertia,
+            'epochs': epoch + 1,
+            'scaler': self._scaler_params(mean, scale, self._feature_columns(data))
+        }
+        
+        self.logger.info("minibatch_kmeans kümeleme analizi başarıyla tamamlandı")
+        return results
+        
     def perform_pca(
         self,
-        data: pd.DataFrame,
-        n_components: int = 2
+        data: Union[pd.DataFrame, MmapDataset, DataChunks],
+        n_components: int = 2,
+        method: str = 'exact',
+        batch_size: int = 4096
     ) -> Dict[str, Any]:
         """
         Temel bileşen analizi yapar
         
         Args:
-            data (pd.DataFrame): Analiz edilecek veri
+            data (Union[pd.DataFrame, MmapDataset, DataChunks]): Analiz edilecek veri (DataChunks yalnızca incremental için)
             n_components (int): Bileşen sayısı
+            method (str): PCA metodu (exact, randomized, incremental)
+            batch_size (int): Bellekteki veri için blok satır sayısı (randomized ve incremental için)
             
         Returns:
             Dict[str, Any]: PCA sonuçları
         """
         try:
-            # Veriyi ölçeklendir
-            scaler = StandardScaler()
-            scaled_data = scaler.fit_transform(data)
-            
-            # PCA uygula
-            pca = PCA(n_components=n_components)
+            if method == 'incremental':
+                return self._incremental_pca(data, n_components, batch_size)
+            if method not in ('exact', 'randomized'):
+                raise ValueError(f"Desteklenmeyen PCA metodu: {method}")
+            if isinstance(data, DataChunks):
+                raise ValueError(f"Veri parçaları yalnızca incremental PCA ile işlenebilir: {method}")
+            if isinstance(data, MmapDataset):
+                data = data.values
+                
+            # PCA uygula (randomized: istatistikler bloklar halinde hesaplanır,
+            # float32 kopya yerinde ölçeklenir ve yalnızca ilk bileşenler için
+            # rastgele SVD yapılır)
+            if method == 'randomized':
+                mean, scale = self._scaling_stats(self._row_blocks(data, batch_size))
+                scaled_data = np.array(data, dtype=np.float32)
+                scaled_data -= mean.astype(np.float32)
+                scaled_data /= scale.astype(np.float32)
+                pca = PCA(n_components=n_components, svd_solver='randomized', random_state=42, copy=False)
+            else:
+                scaled_data = StandardScaler().fit_transform(data)
+                pca = PCA(n_components=n_components)
             components = pca.fit_transform(scaled_data)
             
             # Sonuçları hazırla
             results = {
-                'components': components.tolist(),
+                'components': self._output_array(components),
                 'explained_variance_ratio': pca.explained_variance_ratio_.tolist(),
                 'explained_variance': pca.explained_variance_.tolist()
             }
@@ -174,47 +865,407 @@ class AIAnalysis:
             self.logger.error(f"PCA analizi hatası: {e}")
             raise
             
+    def _incremental_pca(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks],
+        n_components: int,
+        batch_size: int = 4096
+    ) -> Dict[str, Any]:
+        """
+        Veriyi bloklar halinde okuyarak artımlı PCA uygular
+        
+        İlk geçişte ölçekleme istatistikleri, ikinci geçişte partial_fit,
+        üçüncü geçişte bileşen skorları hesaplanır. n_components satırdan kısa
+        bloklar (son blok dahil) komşu blokla birleştirilir; bunun için her blok
+        bir adım geride tutulduğundan bellekte en fazla iki blok bulunur.
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks]): Analiz edilecek veri
+            n_components (int): Bileşen sayısı
+            batch_size (int): Bellekteki veri için blok satır sayısı
+            
+        Returns:
+            Dict[str, Any]: PCA sonuçları
+        """
+        blocks = self._row_blocks(data, batch_size)
+        mean, scale = self._scaling_stats(blocks)
+        
+        pca = IncrementalPCA(n_components=n_components)
+        pending = None
+        for block in blocks():
+            scaled = (block - mean) / scale
+            if pending is not None and len(pending) >= n_components and len(scaled) >= n_components:
+                pca.partial_fit(pending)
+                pending = scaled
+            else:
+                pending = scaled if pending is None else np.vstack([pending, scaled])
+        if pending is not None:
+            pca.partial_fit(pending)
+            
+        components = [pca.transform((block - mean) / scale) for block in blocks() if len(block)]
+        components = np.vstack(components) if components else np.empty((0, n_components))
+        
+        results = {
+            'components': self._output_array(components),
+            'explained_variance_ratio': pca.explained_variance_ratio_.tolist(),
+            'explained_variance': pca.explained_variance_.tolist()
+        }
+        
+        self.logger.info("Artımlı PCA analizi başarıyla tamamlandı")
+        return results
+        
+    def sample_data(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks],
+        sample_size: int = 10000,
+        method: str = 'reservoir',
+        stratify_column: Optional[str] = None,
+        random_state: int = 42
+    ) -> Tuple[pd.DataFrame, int]:
+        """
+        Veriden tek geçişte sabit boyutlu örneklem alır
+        
+        Her satıra rastgele bir anahtar verilir ve en küçük anahtarlı satırlar
+        tutulur (rezervuar örneklemesi); veri parçaları akarken bellekte en
+        fazla sample_size satır (tabakalıda tabaka başına) bulunur. Tabakalı
+        örneklemede tabakalar stratify_column değerleridir ve örneklem
+        tabaka büyüklükleriyle orantılı dağıtılır; böylece örneklem kendi
+        kendini ağırlıklandırır.
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks]): Veri veya veri parçaları
+            sample_size (int): Örneklem boyutu
+            method (str): Örnekleme metodu (reservoir, stratified)
+            stratify_column (Optional[str]): Tabaka sütunu (stratified için)
+            random_state (int): Rastgelelik tohumu
+            
+        Returns:
+            Tuple[pd.DataFrame, int]: Örneklem ve toplam satır sayısı
+        """
+        if method not in ('reservoir', 'stratified'):
+            raise ValueError(f"Desteklenmeyen örnekleme metodu: {method}")
+        if method == 'stratified' and stratify_column is None:
+            raise ValueError("Tabakalı örnekleme için stratify_column gereklidir")
+        if isinstance(data, MmapDataset):
+            data = data.to_frame()
+            
+        rng = np.random.default_rng(random_state)
+        kept: Dict[Any, Tuple[np.ndarray, pd.DataFrame]] = {}
+        counts: Dict[Any, int] = {}
+        population = 0
+        for chunk in (data if isinstance(data, DataChunks) else [data]):
+            population += len(chunk)
+            if method == 'reservoir':
+                groups = [(None, chunk)]
+            else:
+                groups = chunk.groupby(stratify_column, sort=False, dropna=False, observed=True)
+            for stratum, part in groups:
+                stratum = stratum if pd.notna(stratum) else None
+                counts[stratum] = counts.get(stratum, 0) + len(part)
+                keys = rng.random(len(part))
+                if stratum in kept:
+                    keys = np.concatenate([kept[stratum][0], keys])
+                    part = pd.concat([kept[stratum][1], part])
+                if len(part) > sample_size:
+                    top = np.argpartition(keys, sample_size - 1)[:sample_size]
+                    keys, part = keys[top], part.iloc[top]
+                kept[stratum] = (keys, part)
+                
+        if not kept:
+            return (data.head(0) if isinstance(data, pd.DataFrame) else pd.DataFrame()), population
+            
+        if method == 'stratified':
+            # En büyük kalan yöntemiyle orantılı dağıtım
+            target = min(sample_size, population)
+            quotas = {stratum: target * count / population for stratum, count in counts.items()}
+            allocation = {stratum: int(quota) for stratum, quota in quotas.items()}
+            remainder = target - sum(allocation.values())
+            for stratum in sorted(quotas, key=lambda s: quotas[s] - allocation[s], reverse=True)[:remainder]:
+                allocation[stratum] += 1
+            parts = [part.iloc[np.argsort(keys)[:allocation[stratum]]] for stratum, (keys, part) in kept.items()]
+        else:
+            parts = [part for _, part in kept.values()]
+            
+        sample = pd.concat(parts).sort_index()
+        self.logger.info(f"Örneklem alındı: {len(sample)} / {population} satır ({method})")
+        return sample, population
+        
+    @staticmethod
+    def _sample_errors(sample: pd.DataFrame, population: int, confidence: float = 0.95) -> Dict[str, Any]:
+        """
+        Örneklem istatistikleri için güven aralıklarını hesaplar
+        
+        Ortalama ve eksik oranı için sonlu anakütle düzeltmeli normal
+        yaklaşım, standart sapma için normal yaklaşım, kantiller için
+        dağılımdan bağımsız sıra istatistiği aralığı, korelasyonlar için
+        Fisher z dönüşümü kullanılır.
+        
+        Args:
+            sample (pd.DataFrame): Örneklem
+            population (int): Toplam satır sayısı
+            confidence (float): Güven düzeyi
+            
+        Returns:
+            Dict[str, Any]: Hata payları ve aralıklar
+        """
+        n = len(sample)
+        z = float(norm.ppf(0.5 + confidence / 2))
+        fpc = np.sqrt((population - n) / (population - 1)) if population > 1 else 0.0
+        numeric = sample.select_dtypes(include=[np.number])
+        counts = numeric.count()
+        std = numeric.std()
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_margin = z * std / np.sqrt(counts) * fpc
+            std_margin = z * std / np.sqrt(2 * (counts - 1))
+            
+        quantiles = {}
+        for q in (0.25, 0.5, 0.75):
+            bounds = {}
+            for col in numeric.columns:
+                values = np.sort(numeric[col].dropna().to_numpy())
+                m = len(values)
+                if not m:
+                    bounds[col] = [None, None]
+                    continue
+                half = z * np.sqrt(m * q * (1 - q))
+                lower = int(np.clip(np.floor(m * q - half), 0, m - 1))
+                upper = int(np.clip(np.ceil(m * q + half), 0, m - 1))
+                bounds[col] = [float(values[lower]), float(values[upper])]
+            quantiles[f"{int(q * 100)}%"] = bounds
+            
+        missing_ratio = sample.isnull().mean()
+        missing_margin = z * np.sqrt(missing_ratio * (1 - missing_ratio) / max(n, 1)) * fpc
+        
+        corr = numeric.corr().to_numpy()
+        pairs = numeric.notnull().astype(np.float64)
+        pairs = (pairs.T @ pairs).to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fisher = np.arctanh(np.clip(corr, -0.999999, 0.999999))
+            width = z / np.sqrt(pairs - 3)
+            lower = np.tanh(fisher - width)
+            upper = np.tanh(fisher + width)
+        columns = numeric.columns
+        
+        return {
+            'confidence': confidence,
+            'mean': mean_margin.to_dict(),
+            'std': std_margin.to_dict(),
+            'quantiles': quantiles,
+            'missing_ratio': {
+                col: {
+                    'estimate': float(missing_ratio[col]),
+                    'margin': float(missing_margin[col]),
+                    'population_count': float(missing_ratio[col] * population)
+                }
+                for col in sample.columns
+            },
+            'correlation': {
+                'lower': pd.DataFrame(lower, index=columns, columns=columns).to_dict(),
+                'upper': pd.DataFrame(upper, index=columns, columns=columns).to_dict()
+            }
+        }
+        
+    def preview(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks],
+        sample_size: int = 10000,
+        method: str = 'reservoir',
+        stratify_column: Optional[str] = None,
+        confidence: float = 0.95,
+        prepare: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        clustering_method: str = 'kmeans',
+        n_clusters: int = 3,
+        clustering_params: Optional[Dict[str, Any]] = None,
+        n_components: int = 2,
+        n_bootstrap: int = 20,
+        random_state: int = 42
+    ) -> Dict[str, Any]:
+        """
+        Analiz, kümeleme ve PCA'yı örneklem üzerinde hızlı önizleme olarak çalıştırır
+        
+        Her sonuç, tam veri için tahmin olarak hata payı veya güven aralığıyla
+        döner: analiz istatistikleri için analitik aralıklar, küme oranları
+        için oran aralıkları, PCA açıklanan varyans oranları için bootstrap
+        aralıkları. Analiz ham örneklem üzerinde yapılır (eksik değer oranları
+        ve istatistikler özgün birimlerde tahmin edilir); hazırlık yalnızca
+        kümeleme ve PCA'dan önce uygulanır. Örneklemin min-max değerleri tam
+        verininkinden dar olduğundan hazırlanmış örneklemin istatistikleri
+        tam veriyle karşılaştırılabilir değildir; ölçekten bağımsız kümeleme
+        ve PCA ise karşılaştırılabilir.
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks]): Veri veya veri parçaları
+            sample_size (int): Örneklem boyutu
+            method (str): Örnekleme metodu (reservoir, stratified)
+            stratify_column (Optional[str]): Tabaka sütunu (stratified için)
+            confidence (float): Güven düzeyi
+            prepare (Optional[Callable[[pd.DataFrame], pd.DataFrame]]): Kümeleme ve PCA öncesi örnekleme uygulanacak hazırlık (temizleme, normalizasyon)
+            clustering_method (str): Kümeleme metodu
+            n_clusters (int): Küme sayısı
+            clustering_params (Optional[Dict[str, Any]]): perform_clustering'e iletilecek ek parametreler
+            n_components (int): PCA bileşen sayısı
+            n_bootstrap (int): PCA aralıkları için yeniden örnekleme sayısı
+            random_state (int): Rastgelelik tohumu
+            
+        Returns:
+            Dict[str, Any]: Önizleme sonuçları
+        """
+        try:
+            sample, population = self.sample_data(data, sample_size, method, stratify_column, random_state)
+            n = len(sample)
+            z = float(norm.ppf(0.5 + confidence / 2))
+            fpc = np.sqrt((population - n) / (population - 1)) if population > 1 else 0.0
+            
+            results = {
+                'sample': {
+                    'size': n,
+                    'population': population,
+                    'method': method,
+                    'confidence': confidence
+                }
+            }
+            
+            analysis = self.analyze_data(sample.select_dtypes(include=[np.number]))
+            analysis['error'] = self._sample_errors(sample, population, confidence)
+            results['analysis'] = analysis
+            
+            prepared = prepare(sample) if prepare is not None else sample
+            numeric = prepared.select_dtypes(include=[np.number])
+            n = len(numeric)
+            results['sample']['prepared_size'] = n
+            clustering = self.perform_clustering(
+                numeric,
+                method=clustering_method,
+                n_clusters=n_clusters,
+                **(clustering_params or {})
+            )
+            labels = np.asarray(clustering['labels'])
+            share = pd.Series(labels).value_counts(normalize=True).sort_index()
+            clustering['error'] = {
+                'cluster_share': {
+                    int(label): {
+                        'estimate': float(p),
+                        'margin': float(z * np.sqrt(p * (1 - p) / n) * fpc)
+                    }
+                    for label, p in share.items()
+                }
+            }
+            if 'centers' in clustering and 'scaler' in clustering:
+                # Tam verideki inertia, satır başına kare mesafenin ortalamasından tahmin edilir
+                _, distances = ClusterModel.from_results(clustering).assign(numeric, return_distance=True)
+                squared = distances ** 2
+                clustering['error']['population_inertia'] = {
+                    'estimate': float(squared.mean() * population),
+                    'margin': float(z * squared.std(ddof=1) / np.sqrt(n) * fpc * population) if n > 1 else None
+                }
+            results['clustering'] = clustering
+            
+            pca = self.perform_pca(numeric, n_components=n_components)
+            rng = np.random.default_rng(random_state)
+            ratios = []
+            for _ in range(n_bootstrap):
+                resample = numeric.to_numpy(dtype=np.float64)[rng.integers(n, size=n)]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    eigenvalues = np.linalg.eigvalsh(np.nan_to_num(np.corrcoef(resample, rowvar=False)))[::-1]
+                ratios.append(eigenvalues[:n_components] / eigenvalues.sum())
+            if ratios:
+                lower, upper = np.percentile(ratios, [50 * (1 - confidence), 50 * (1 + confidence)], axis=0)
+                pca['error'] = {
+                    'explained_variance_ratio': {
+                        'lower': lower.tolist(),
+                        'upper': upper.tolist(),
+                        'n_bootstrap': n_bootstrap
+                    }
+                }
+            results['pca'] = pca
+            
+            self.logger.info(f"Önizleme tamamlandı: {n} satırlık örneklem")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Önizleme hatası: {e}")
+            raise
+            
     def visualize_results(
         self,
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, MmapDataset],
         results: Dict[str, Any],
-        output_path: str
+        output_path: str,
+        render: str = 'auto',
+        density_threshold: int = 50000,
+        bins: int = 200,
+        annotate_max_cells: int = 400,
+        n_jobs: int = 1
     ) -> bool:
         """
         Analiz sonuçlarını görselleştirir
         
+        Büyük veride saçılım grafikleri NumPy ile 2B yoğunluk ızgarasına
+        toplanarak çizilir; büyük korelasyon matrislerinde hücre değerleri
+        yazılmaz. Grafikler pyplot yerine doğrudan Agg tuvaline çizilir ve
+        n_jobs > 1 ise ayrı süreçlerde paralel oluşturulur.
+        
         Args:
-            data (pd.DataFrame): Veri seti
-            results (Dict[str, Any]): Analiz sonuçları
+            data (Union[pd.DataFrame, MmapDataset]): Veri seti
+            results (Dict[str, Any]): Analiz sonuçları (pipeline sonuçları veya tek bir analiz sonucu)
             output_path (str): Çıktı dosyası yolu
+            render (str): Saçılım çizim modu (auto, scatter, density)
+            density_threshold (int): auto modunda yoğunluk çizimine geçilen nokta sayısı
+            bins (int): Yoğunluk ızgarasında eksen başına hücre sayısı
+            annotate_max_cells (int): Korelasyon değerlerinin yazılacağı en fazla hücre sayısı
+            n_jobs (int): Grafikleri çizen süreç sayısı
             
         Returns:
             bool: İşlem başarılı ise True
         """
         try:
+            if render not in ('auto', 'scatter', 'density'):
+                raise ValueError(f"Desteklenmeyen çizim modu: {render}")
+            if isinstance(data, MmapDataset):
+                data = data.to_frame()
+                
+            def scatter_spec(x, y, labels, title, name):
+                spec = {'title': title, 'path': f"{output_path}/{name}"}
+                if render == 'density' or (render == 'auto' and len(x) > density_threshold):
+                    spec.update(kind='density', grid=_density_grid(x, y, bins, labels))
+                else:
+                    spec.update(kind='scatter', x=np.asarray(x), y=np.asarray(y), c=labels)
+                return spec
+                
             # Korelasyon matrisi
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(data.corr(), annot=True, cmap='coolwarm')
-            plt.title('Korelasyon Matrisi')
-            plt.savefig(f"{output_path}/correlation_matrix.png")
-            plt.close()
+            corr = self.correlation_matrix(data)
+            specs = [{
+                'kind': 'heatmap',
+                'matrix': corr,
+                'annotate': corr.size <= annotate_max_cells,
+                'title': 'Korelasyon Matrisi',
+                'path': f"{output_path}/correlation_matrix.png"
+            }]
             
             # Kümeleme sonuçları
-            if 'labels' in results:
-                plt.figure(figsize=(10, 8))
-                plt.scatter(data.iloc[:, 0], data.iloc[:, 1], c=results['labels'])
-                plt.title('Kümeleme Sonuçları')
-                plt.savefig(f"{output_path}/clustering_results.png")
-                plt.close()
+            clustering = results.get('clustering', results)
+            if 'labels' in clustering:
+                specs.append(scatter_spec(
+                    data.iloc[:, 0].to_numpy(), data.iloc[:, 1].to_numpy(), np.asarray(clustering['labels']),
+                    'Kümeleme Sonuçları', 'clustering_results.png'
+                ))
                 
             # PCA sonuçları
-            if 'components' in results:
-                plt.figure(figsize=(10, 8))
-                plt.scatter(results['components'][:, 0], results['components'][:, 1])
-                plt.title('PCA Sonuçları')
-                plt.savefig(f"{output_path}/pca_results.png")
-                plt.close()
+            pca = results.get('pca', results)
+            if 'components' in pca:
+                components = np.asarray(pca['components'])
+                specs.append(scatter_spec(
+                    components[:, 0], components[:, 1], None, 'PCA Sonuçları', 'pca_results.png'
+                ))
                 
+            if n_jobs > 1 and len(specs) > 1:
+                with ProcessPoolExecutor(max_workers=min(n_jobs, len(specs))) as executor:
+                    list(executor.map(_render_plot, specs))
+            else:
+                for spec in specs:
+                    _render_plot(spec)
+                    
             self.logger.info(f"Görselleştirmeler başarıyla kaydedildi: {output_path}")
             return True
             
@@ -226,7 +1277,9 @@ class AIAnalysis:
         self,
         data: pd.DataFrame,
         results: Dict[str, Any],
-        output_path: str
+        output_path: str,
+        result_format: str = 'json',
+        store: Optional[ResultStore] = None
     ) -> bool:
         """
         Analiz raporu oluşturur
@@ -235,6 +1288,8 @@ class AIAnalysis:
             data (pd.DataFrame): Veri seti
             results (Dict[str, Any]): Analiz sonuçları
             output_path (str): Çıktı dosyası yolu
+            result_format (str): Rapor biçimi (json, npz: büyük diziler ikili yan dosyada)
+            store (Optional[ResultStore]): npz biçimi için sonuç deposu
             
         Returns:
             bool: İşlem başarılı ise True
@@ -247,8 +1302,13 @@ class AIAnalysis:
             }
             
             # Raporu kaydet
-            with open(f"{output_path}/analysis_report.json", 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=4)
+            if result_format == 'npz':
+                (store or ResultStore()).save(report, f"{output_path}/analysis_report.json")
+            elif result_format == 'json':
+                with open(f"{output_path}/analysis_report.json", 'w', encoding='utf-8') as f:
+                    json.dump(report, f, ensure_ascii=False, indent=4, default=ResultStore.json_default)
+            else:
+                raise ValueError(f"Desteklenmeyen sonuç biçimi: {result_format}")
                 
             self.logger.info(f"Rapor başarıyla oluşturuldu: {output_path}")
             return True
@@ -3,9 +3,22 @@ import numpy as np
 from typing import Dict, Any, Optional
 import logging
 from pathlib import Path
+import json
 from .data_operations import DataOperations
+from .data_cache import DataCache
+from .stats_cache import StatisticsCache
+from .correlation import CorrelationEngine
+from .result_store import ResultStore
+from .transformers import TransformerPipeline
+from .incremental import IncrementalAnalysis
+from .cluster_model import ClusterModel
 from .regression import RegressionAnalysis
 from .ai_analysis import AIAnalysis
+from concurrent.futures import Future, ProcessPoolExecutor
+
+def _run_full_pipeline(config: Dict[str, Any], data_path: str, file_type: str) -> Dict[str, Any]:
+    """Önizlemeden sonra tam analizi ayrı bir süreçte çalıştırır"""
+    return AnalysisPipeline(config).run_pipeline(data_path, file_type)
 
 class AnalysisPipeline:
     """
@@ -39,40 +52,105 @@ class AnalysisPipeline:
         self.logger = logging.getLogger(__name__)
         
         # Alt sınıfları başlat
-        self.data_ops = DataOperations()
+        cache = None
+        cache_config = config.get('cache', {})
+        if cache_config.get('enabled', False):
+            cache = DataCache(
+                cache_dir=cache_config.get('path', 'cache/data'),
+                max_bytes=cache_config.get('max_bytes', 2 * 1024 ** 3)
+            )
+        # describe/corr/eksik değer özetleri tüm aşamalarca paylaşılır
+        self.stats_cache = StatisticsCache(
+            max_frames=config.get('stats_cache', {}).get('max_frames', 4)
+        )
+        self.data_ops = DataOperations(cache=cache, stats_cache=self.stats_cache)
         self.regression = RegressionAnalysis()
-        self.ai_analysis = AIAnalysis()
+        correlation = None
+        correlation_config = config.get('analysis', {}).get('correlation', {})
+        if correlation_config.get('engine', 'pandas') == 'blas':
+            correlation = CorrelationEngine(
+                dtype=correlation_config.get('dtype', 'float32'),
+                block_size=correlation_config.get('block_size', 1024)
+            )
+        # npz biçiminde etiketler ve bileşenler NumPy dizisi olarak kalır
+        results_config = config.get('results', {})
+        self.result_format = results_config.get('format', 'json')
+        self.result_store = ResultStore(
+            compress=results_config.get('compress', True),
+            min_array_size=results_config.get('min_array_size', 1024)
+        )
+        self.ai_analysis = AIAnalysis(
+            stats_cache=self.stats_cache,
+            correlation=correlation,
+            keep_arrays=self.result_format == 'npz'
+        )
+        # run_preview ile arka planda başlatılan tam analiz
+        self.full_run: Optional[Future] = None
+        # Son çalıştırmada eğitilen regresyon modelleri (JSON sonuçlarının dışında tutulur)
+        self.models: Dict[str, Any] = {}
         
-    def run_pipeline(self, data_path: str) -> Dict[str, Any]:
+    def run_pipeline(self, data_path: str, file_type: str = 'csv') -> Dict[str, Any]:
         """
         Analiz pipeline'ını çalıştırır
         
         Args:
             data_path (str): Veri dosyası yolu
+            file_type (str): Dosya tipi (csv, excel, json, mmap)
             
         Returns:
             Dict[str, Any]: Analiz sonuçları
         """
         try:
             results = {}
+            self.models = {}
+            self.stats_cache.clear()
             
             # 1. Veri yükleme
             self.logger.info("Veri yükleniyor...")
-            data = self.data_ops.load_data(data_path)
+            data = self.data_ops.load_data(
+                data_path,
+                file_type,
+                optimize_dtypes=self.config.get('loading', {}).get('optimize_dtypes', False)
+            )
             if data is None:
                 raise ValueError("Veri yüklenemedi")
                 
-            # 2. Veri temizleme
-            self.logger.info("Veri temizleniyor...")
-            data = self.data_ops.clean_data(data, self.config['cleaning'])
-            
-            # 3. Veri normalizasyonu
-            self.logger.info("Veri normalize ediliyor...")
-            data = self.data_ops.normalize_data(data, self.config['normalization']['method'])
-            
+            transformer_config = self.config.get('transformers', {})
+            if transformer_config.get('enabled', False):
+                # 2-3. Temizleme ve normalizasyon parametreleri bir kez uydurulup saklanır
+                self.logger.info("Veri dönüştürücüleri uyduruluyor...")
+                transformers = TransformerPipeline.from_config(
+                    self.config['cleaning'],
+                    self.config['normalization']['method']
+                )
+                data = transformers.fit_transform(data)
+                transformers.save(transformer_config.get('path', 'output/analysis/transformers.json'))
+            else:
+                # 2. Veri temizleme
+                self.logger.info("Veri temizleniyor...")
+                data = self.data_ops.clean_data(data, self.config['cleaning'])
+                
+                # 3. Veri normalizasyonu
+                self.logger.info("Veri normalize ediliyor...")
+                data = self.data_ops.normalize_data(data, self.config['normalization']['method'])
+                
+            # Hazırlanan veri bir kez yazılır, sonraki adımlar ve işçiler aynı sayfaları paylaşır
+            mmap_config = self.config.get('mmap', {})
+            if mmap_config.get('enabled', False):
+                mmap_path = mmap_config.get('path', 'cache/prepared.mmap')
+                if self.data_ops.save_data(data, mmap_path, 'mmap'):
+                    data = self.data_ops.load_data(mmap_path, 'mmap')
+                    
             # 4. Veri analizi
             self.logger.info("Veri analizi yapılıyor...")
-            analysis_results = self.ai_analysis.analyze_data(data)
+            analysis_config = self.config.get('analysis', {})
+            analysis_results = self.ai_analysis.analyze_data(
+                data,
+                quantiles=analysis_config.get('quantiles', 'exact'),
+                quantile_error=analysis_config.get('quantile_error', 0.01),
+                n_jobs=analysis_config.get('n_jobs', 1),
+                correlation_top_k=analysis_config.get('correlation', {}).get('top_k')
+            )
             results['analysis'] = analysis_results
             
             # 5. Kümeleme analizi
@@ -81,16 +159,33 @@ class AnalysisPipeline:
                 clustering_results = self.ai_analysis.perform_clustering(
                     data,
                     method=self.config['clustering']['method'],
-                    n_clusters=self.config['clustering']['n_clusters']
+                    n_clusters=self.config['clustering']['n_clusters'],
+                    eps=self.config['clustering'].get('eps', 0.5),
+                    min_samples=self.config['clustering'].get('min_samples', 5),
+                    batch_size=self.config['clustering'].get('batch_size', 4096),
+                    max_epochs=self.config['clustering'].get('max_epochs', 3),
+                    index=self.config['clustering'].get('index', 'kd_tree'),
+                    n_jobs=self.config['clustering'].get('n_jobs', 1),
+                    max_memory_bytes=self.config['clustering'].get('max_memory_bytes', 256 * 1024 ** 2),
+                    k_range=tuple(self.config['clustering'].get('k_range', (2, 10))),
+                    k_criterion=self.config['clustering'].get('k_criterion', 'silhouette'),
+                    score_sample_size=self.config['clustering'].get('score_sample_size', 5000)
                 )
                 results['clustering'] = clustering_results
                 
+                # Yeni noktaları yeniden uydurmadan atamak için merkezler ve ölçekleme saklanır
+                model_path = self.config['clustering'].get('model_path')
+                if model_path and 'centers' in clustering_results:
+                    ClusterModel.from_results(clustering_results).save(model_path)
+                
             # 6. PCA analizi
             if self.config['pca']['enabled']:
                 self.logger.info("PCA analizi yapılıyor...")
                 pca_results = self.ai_analysis.perform_pca(
                     data,
-                    n_components=self.config['pca']['n_components']
+                    n_components=self.config['pca']['n_components'],
+                    method=self.config['pca'].get('method', 'exact'),
+                    batch_size=self.config['pca'].get('batch_size', 4096)
                 )
                 results['pca'] = pca_results
                 
@@ -102,46 +197,112 @@ class AnalysisPipeline:
                     self.config['regression']['target_column'],
                     test_size=self.config['regression']['test_size']
                 )
+                results['regression'] = {}
                 
-                # Doğrusal regresyon
-                linear_model, linear_metrics = self.regression.train_linear_regression(X_train, y_train)
-                linear_eval = self.regression.evaluate_model(linear_model, X_test, y_test)
-                results['regression']['linear'] = {
-                    'metrics': linear_metrics,
-                    'evaluation': linear_eval
-                }
-                
-                # Ridge regresyon
-                ridge_model, ridge_metrics = self.regression.train_ridge_regression(
-                    X_train,
-                    y_train,
-                    alpha=self.config['regression']['ridge_alpha']
-                )
-                ridge_eval = self.regression.evaluate_model(ridge_model, X_test, y_test)
-                results['regression']['ridge'] = {
-                    'metrics': ridge_metrics,
-                    'evaluation': ridge_eval
-                }
+                # Modeller aynı eğitim verisi üzerinde bağımsızdır; model_n_jobs > 1 ise
+                # veri paylaşımlı belleğe bir kez kopyalanıp eşzamanlı eğitilir
+                regression_config = self.config['regression']
+                model_n_jobs = regression_config.get('model_n_jobs', 1)
                 
+                # Doğrusal ve ridge regresyon (streaming: XᵀX/Xᵀy toplamlarıyla tek geçiş)
+                if regression_config.get('trainer', 'sklearn') == 'streaming':
+                    streaming_params = {
+                        # İşçi süreçleri içinde yeni süreç havuzu açılmaz
+                        'n_jobs': 1 if model_n_jobs > 1 else regression_config.get('n_jobs', 1),
+                        'block_rows': regression_config.get('block_rows', 65536)
+                    }
+                    models = {
+                        'linear': ('train_streaming_regression', streaming_params),
+                        'ridge': ('train_streaming_regression', dict(streaming_params, alpha=regression_config['ridge_alpha']))
+                    }
+                else:
+                    models = {
+                        'linear': ('train_linear_regression', {}),
+                        'ridge': ('train_ridge_regression', {'alpha': regression_config['ridge_alpha']})
+                    }
                 # Lasso regresyon
-                lasso_model, lasso_metrics = self.regression.train_lasso_regression(
-                    X_train,
-                    y_train,
-                    alpha=self.config['regression']['lasso_alpha']
-                )
-                lasso_eval = self.regression.evaluate_model(lasso_model, X_test, y_test)
-                results['regression']['lasso'] = {
-                    'metrics': lasso_metrics,
-                    'evaluation': lasso_eval
-                }
+                models['lasso'] = ('train_lasso_regression', {'alpha': regression_config['lasso_alpha']})
+                
+                trained = self.regression.train_models(X_train, y_train, models, n_jobs=model_n_jobs)
+                for name, fit in trained.items():
+                    self.models[name] = fit['model']
+                    results['regression'][name] = {
+                        'metrics': fit['metrics'],
+                        'evaluation': self.regression.evaluate_model(fit['model'], X_test, y_test),
+                        'training_seconds': fit['seconds']
+                    }
+                    
+                # Servis tarafı için sklearn'süz katsayı tahmincileri
+                predictor_dir = regression_config.get('predictor_dir')
+                if predictor_dir:
+                    feature_columns = list(X_train.columns) if isinstance(X_train, pd.DataFrame) else None
+                    for name, fit in trained.items():
+                        self.regression.export_predictor(
+                            fit['model'],
+                            f"{predictor_dir}/{name}_predictor.json",
+                            columns=feature_columns
+                        )
+                        
+                # Tekrarlı k-katlı çapraz doğrulama: tek bölmenin gürültüsü yerine ortalama ve varyans
+                cv_config = regression_config.get('cv', {})
+                if cv_config.get('enabled', False):
+                    cv_results = self.regression.cross_validate(
+                        X_train,
+                        y_train,
+                        models,
+                        n_splits=cv_config.get('n_splits', 5),
+                        n_repeats=cv_config.get('n_repeats', 1),
+                        n_jobs=model_n_jobs
+                    )
+                    for name, cv_result in cv_results.items():
+                        results['regression'][name]['cross_validation'] = cv_result
+                        
+                # Regularizasyon yolları: ridge tek SVD'den, lasso sıcak başlatmalı koordinat inişiyle
+                path_config = self.config['regression'].get('path', {})
+                if path_config.get('enabled', False):
+                    paths = self.regression.regularization_paths(
+                        X_train,
+                        y_train,
+                        validation_size=path_config.get('validation_size', 0.2),
+                        n_alphas=path_config.get('n_alphas', 50),
+                        ridge_alphas=path_config.get('ridge_alphas'),
+                        lasso_alphas=path_config.get('lasso_alphas')
+                    )
+                    for name, (path_model, path) in paths.items():
+                        self.models[f"{name}_path"] = path_model
+                        results['regression'][f"{name}_path"] = {
+                            'metrics': {
+                                'coefficients': path_model.coef_.tolist(),
+                                'intercept': path_model.intercept_,
+                                'alpha': path['best_alpha']
+                            },
+                            'evaluation': self.regression.evaluate_model(path_model, X_test, y_test),
+                            'path': path
+                        }
                 
             # 8. Görselleştirme
             self.logger.info("Sonuçlar görselleştiriliyor...")
-            self.ai_analysis.visualize_results(data, results, self.config['output_path'])
+            visualization_config = self.config.get('visualization', {})
+            self.ai_analysis.visualize_results(
+                data,
+                results,
+                self.config['output_path'],
+                render=visualization_config.get('render', 'auto'),
+                density_threshold=visualization_config.get('density_threshold', 50000),
+                bins=visualization_config.get('bins', 200),
+                annotate_max_cells=visualization_config.get('annotate_max_cells', 400),
+                n_jobs=visualization_config.get('n_jobs', 1)
+            )
             
             # 9. Rapor oluşturma
             self.logger.info("Rapor oluşturuluyor...")
-            self.ai_analysis.generate_report(data, results, self.config['output_path'])
+            self.ai_analysis.generate_report(
+                data,
+                results,
+                self.config['output_path'],
+                result_format=self.result_format,
+                store=self.result_store
+            )
             
             self.logger.info("Pipeline başarıyla tamamlandı")
             return results
@@ -150,32 +311,201 @@ class AnalysisPipeline:
             self.logger.error(f"Pipeline hatası: {e}")
             raise
             
-    def save_results(self, results: Dict[str, Any], output_path: str) -> bool:
+    def run_incremental(self, data_path: str, file_type: str = 'csv') -> Dict[str, Any]:
+        """
+        Dosyaya eklenen satırlarla analizi artımlı olarak günceller
+        
+        Kaydedilmiş durumdan sonra gelen satırlar saklanan dönüştürücülerle
+        hazırlanır ve istatistik, korelasyon, PCA ve küme merkezleri
+        birleştirilebilir durumdan güncellenir. Durum yoksa, dosya kısalmışsa
+        veya yeni satırların kayması eşiği aşıyorsa her şey baştan hesaplanır.
+        
+        Args:
+            data_path (str): Veri dosyası yolu (öncekinin sonuna satır eklenmiş)
+            file_type (str): Dosya tipi (csv, excel, json, mmap)
+            
+        Returns:
+            Dict[str, Any]: Analiz, kümeleme ve PCA sonuçları ile artımlı çalışma bilgisi
+        """
+        try:
+            incremental_config = self.config.get('incremental', {})
+            state_path = incremental_config.get('state_path', 'output/analysis/incremental_state.json')
+            threshold = incremental_config.get('drift_threshold', 0.25)
+            
+            data = self.data_ops.load_data(
+                data_path,
+                file_type,
+                optimize_dtypes=self.config.get('loading', {}).get('optimize_dtypes', False)
+            )
+            if data is None:
+                raise ValueError("Veri yüklenemedi")
+                
+            state = IncrementalAnalysis.load(state_path)
+            mode, drift, new_rows, labels = 'full', None, len(data), None
+            if state is not None and state.transformers is not None and len(data) >= state.n_rows:
+                new_rows = len(data) - state.n_rows
+                prepared = state.transformers.transform(data.iloc[state.n_rows:])
+                if not new_rows:
+                    mode, drift = 'unchanged', 0.0
+                else:
+                    drift = state.drift(prepared)
+                    if drift <= threshold:
+                        mode = 'update'
+                        self.logger.info(f"Artımlı güncelleme: {new_rows} yeni satır (kayma {drift:.3f})")
+                        labels = state.update(prepared)
+                    else:
+                        self.logger.info(f"Kayma eşiği aşıldı ({drift:.3f} > {threshold}), baştan hesaplanıyor")
+                        
+            if mode == 'full':
+                transformers = TransformerPipeline.from_config(
+                    self.config['cleaning'],
+                    self.config['normalization']['method']
+                )
+                prepared = transformers.fit_transform(data)
+                state = IncrementalAnalysis(
+                    n_clusters=self.config['clustering']['n_clusters'],
+                    n_components=self.config['pca']['n_components'],
+                    quantile_error=self.config.get('analysis', {}).get('quantile_error', 0.01),
+                    drift_threshold=threshold
+                ).fit(prepared)
+                state.transformers = transformers
+                
+            state.n_rows = len(data)
+            state.save(state_path)
+            
+            results = state.results()
+            if labels is not None:
+                results['clustering']['new_labels'] = labels.tolist()
+            results['incremental'] = {'mode': mode, 'drift': drift, 'new_rows': new_rows, 'total_rows': state.n_rows}
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Artımlı analiz hatası: {e}")
+            raise
+            
+    def run_preview(self, data_path: str, file_type: str = 'csv', background: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Örneklem üzerinde hızlı önizleme yapar, tam analizi arka planda başlatır
+        
+        Dosya parçalar halinde tek geçişte okunarak örneklem alınır; yalnızca
+        örneklem temizlenip normalize edilir ve analiz, kümeleme ve PCA
+        hata paylarıyla birlikte hesaplanır. background etkinse tam pipeline
+        ayrı bir süreçte çalışmaya başlar; sonucu wait_full_run ile alınır.
+        
+        Args:
+            data_path (str): Veri dosyası yolu
+            file_type (str): Dosya tipi (csv, excel, json, mmap)
+            background (Optional[bool]): Tam analizi arka planda başlat (None ise yapılandırmadan)
+            
+        Returns:
+            Dict[str, Any]: Önizleme sonuçları
+        """
+        try:
+            preview_config = self.config.get('preview', {})
+            if background is None:
+                background = preview_config.get('background', True)
+                
+            if background:
+                executor = ProcessPoolExecutor(max_workers=1)
+                self.full_run = executor.submit(_run_full_pipeline, self.config, data_path, file_type)
+                executor.shutdown(wait=False)
+                
+            # Bellek eşlemeli veri zaten kopyasız açıldığından parçalanmaz
+            chunk_rows = None if file_type == 'mmap' else preview_config.get('chunk_rows', 100000)
+            data = self.data_ops.load_data(data_path, file_type, chunk_rows=chunk_rows)
+            if data is None:
+                raise ValueError("Veri yüklenemedi")
+                
+            def prepare(sample: pd.DataFrame) -> pd.DataFrame:
+                sample = self.data_ops.clean_data(sample, self.config['cleaning'])
+                return self.data_ops.normalize_data(sample, self.config['normalization']['method'])
+                
+            results = self.ai_analysis.preview(
+                data,
+                sample_size=preview_config.get('sample_size', 10000),
+                method=preview_config.get('method', 'reservoir'),
+                stratify_column=preview_config.get('stratify_column'),
+                confidence=preview_config.get('confidence', 0.95),
+                prepare=prepare,
+                clustering_method=self.config['clustering']['method'],
+                n_clusters=self.config['clustering']['n_clusters'],
+                clustering_params={
+                    key: self.config['clustering'][key]
+                    for key in ('eps', 'min_samples', 'batch_size', 'index', 'k_range', 'k_criterion')
+                    if key in self.config['clustering']
+                },
+                n_components=self.config['pca']['n_components'],
+                n_bootstrap=preview_config.get('n_bootstrap', 20)
+            )
+            results['sample']['full_run'] = 'running' if background else None
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Önizleme hatası: {e}")
+            raise
+            
+    def wait_full_run(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        run_preview ile başlatılan tam analizin sonucunu bekler
+        
+        Args:
+            timeout (Optional[float]): En fazla bekleme süresi (saniye)
+            
+        Returns:
+            Dict[str, Any]: Tam analiz sonuçları
+        """
+        if self.full_run is None:
+            raise ValueError("Arka planda çalışan tam analiz yok")
+        return self.full_run.result(timeout=timeout)
+        
+    def save_results(self, results: Dict[str, Any], output_path: str, models: Optional[Dict[str, Any]] = None) -> bool:
         """
         Analiz sonuçlarını kaydeder
         
         Args:
             results (Dict[str, Any]): Kaydedilecek sonuçlar
             output_path (str): Kayıt yolu
+            models (Optional[Dict[str, Any]]): Model adı -> eğitilmiş model (None ise son run_pipeline modelleri)
             
         Returns:
             bool: İşlem başarılı ise True
         """
         try:
-            # Sonuçları JSON olarak kaydet
-            import json
-            with open(f"{output_path}/results.json", 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=4)
-                
+            # Sonuçları kaydet (npz: büyük diziler sıkıştırılmış yan dosyada, JSON manifest)
+            if self.result_format == 'npz':
+                self.result_store.save(results, f"{output_path}/results.json")
+            else:
+                import json
+                with open(f"{output_path}/results.json", 'w', encoding='utf-8') as f:
+                    json.dump(results, f, ensure_ascii=False, indent=4, default=ResultStore.json_default)
+                    
             # Modelleri kaydet
-            if 'regression' in results:
-                for model_name, model_data in results['regression'].items():
-                    model_path = f"{output_path}/{model_name}_model.joblib"
-                    self.regression.save_model(model_data['model'], model_path)
+            models = self.models if models is None else models
+            for model_name, model in models.items():
+                model_path = f"{output_path}/{model_name}_model.joblib"
+                self.regression.save_model(model, model_path)
                     
             self.logger.info(f"Sonuçlar başarıyla kaydedildi: {output_path}")
             return True
             
         except Exception as e:
             self.logger.error(f"Sonuç kaydetme hatası: {e}")
-            return False 
\ No newline at end of file
+            return False
+            
+    def load_results(self, output_path: str, lazy: bool = True) -> Dict[str, Any]:
+        """
+        save_results ile kaydedilen sonuçları okur
+        
+        Args:
+            output_path (str): Kayıt yolu
+            lazy (bool): npz biçiminde dizileri ilk erişime kadar okuma
+            
+        Returns:
+            Dict[str, Any]: Sonuçlar
+        """
+        path = Path(output_path) / "results.json"
+        with open(path, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+        if isinstance(results, dict) and results.get('format') in ('npz', 'npy') and 'sidecar' in results:
+            return ResultStore.load(str(path), lazy=lazy)
+        return results 
\ No newline at end of file
@@ -0,0 +1,306 @@
+import numpy as np
+from typing import Iterator, Optional, Tuple
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from sklearn.neighbors import KDTree, BallTree
+
+
+# İşçi süreç başına bir kez kurulan indeks
+_WORKER_STATE = {}
+
+
+def _build_tree(X: np.ndarray, algorithm: str, leaf_size: int):
+    """Uzamsal indeksi kurar"""
+    tree_class = KDTree if algorithm == 'kd_tree' else BallTree
+    return tree_class(X, leaf_size=leaf_size)
+
+
+def _init_worker(X: np.ndarray, algorithm: str, leaf_size: int) -> None:
+    """İşçi sürecinde veriyi ve indeksi hazırlar"""
+    _WORKER_STATE['X'] = X
+    _WORKER_STATE['tree'] = _build_tree(X, algorithm, leaf_size)
+
+
+def _query_block(tree, X: np.ndarray, start: int, stop: int, eps: float, count_only: bool) -> Tuple[int, int, np.ndarray]:
+    """
+    Bir satır bloğunun komşu sayılarını veya düz komşu indekslerini döndürür
+    
+    Args:
+        tree: Uzamsal indeks
+        X (np.ndarray): Veri matrisi
+        start (int): Blok başlangıcı
+        stop (int): Blok bitişi
+        eps (float): Komşuluk yarıçapı
+        count_only (bool): Yalnızca komşu sayılarını döndür
+        
+    Returns:
+        Tuple[int, int, np.ndarray]: (başlangıç, bitiş, sayılar veya düz komşu indeksleri)
+    """
+    if count_only:
+        return start, stop, tree.query_radius(X[start:stop], eps, count_only=True)
+    neighbors = tree.query_radius(X[start:stop], eps)
+    return start, stop, np.concatenate(neighbors) if len(neighbors) else np.empty(0, dtype=np.intp)
+
+
+def _worker_query_block(start: int, stop: int, eps: float, count_only: bool) -> Tuple[int, int, np.ndarray]:
+    """İşçi sürecindeki indeks üzerinde _query_block çalıştırır"""
+    return _query_block(_WORKER_STATE['tree'], _WORKER_STATE['X'], start, stop, eps, count_only)
+
+
+class BlockedDBSCAN:
+    """
+    Uzamsal indeks üzerinde, sınırlı bellekle çalışan DBSCAN.
+    
+    Noktalar bir KD/ball ağacına yerleştirilir. İlk geçişte her noktanın
+    komşu sayısı yalnızca sayılarak çekirdek noktalar bulunur. İkinci
+    geçişte komşuluk listeleri, toplam boyutu bellek sınırını aşmayacak
+    bloklar halinde sorgulanır; çekirdek-çekirdek kenarları blok blok
+    bağlı bileşenlere katılır ve sınır noktaları komşu bir çekirdeğe
+    bağlanır. Tüm komşuluk grafiği hiçbir zaman bellekte tutulmaz. n_jobs > 1
+    ise bloklar, ağacı bir kez kuran işçi süreçlerinde paralel sorgulanır.
+    """
+    
+    # Komşu başına (sorgu sonucu, düz kopya ve kenar dizileri) ve satır başına bayt tahmini
+    BYTES_PER_NEIGHBOR = 48
+    BYTES_PER_ROW = 160
+    
+    def __init__(
+        self,
+        eps: float = 0.5,
+        min_samples: int = 5,
+        algorithm: str = 'kd_tree',
+        leaf_size: int = 40,
+        n_jobs: int = 1,
+        max_memory_bytes: int = 256 * 1024 ** 2,
+        count_block_rows: int = 65536
+    ):
+        """
+        BlockedDBSCAN sınıfı başlatıcısı
+        
+        Args:
+            eps (float): Maksimum mesafe
+            min_samples (int): Çekirdek nokta için minimum komşu sayısı (nokta kendisi dahil)
+            algorithm (str): Uzamsal indeks (kd_tree, ball_tree)
+            leaf_size (int): Ağaç yaprak boyutu
+            n_jobs (int): Blokları sorgulayan işçi süreç sayısı
+            max_memory_bytes (int): Eşzamanlı komşuluk bloklarının toplam bellek sınırı (veri ve indeks hariç)
+            count_block_rows (int): Komşu sayma geçişinde blok satır sayısı
+        """
+        if algorithm not in ('kd_tree', 'ball_tree'):
+            raise ValueError(f"Desteklenmeyen uzamsal indeks: {algorithm}")
+            
+        self.eps = eps
+        self.min_samples = min_samples
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.n_jobs = max(1, n_jobs)
+        self.max_memory_bytes = max_memory_bytes
+        self.count_block_rows = count_block_rows
+        self.logger = logging.getLogger(__name__)
+        
+        self.labels_: Optional[np.ndarray] = None
+        self.core_sample_indices_: Optional[np.ndarray] = None
+        self.n_blocks_ = 0
+        
+    def _blocks(self, counts: np.ndarray) -> Iterator[Tuple[int, int]]:
+        """
+        Komşu sayılarına göre bellek sınırını aşmayan satır aralıkları üretir
+        
+        Args:
+            counts (np.ndarray): Nokta başına komşu sayıları
+            
+        Returns:
+            Iterator[Tuple[int, int]]: (başlangıç, bitiş) aralıkları
+        """
+        # Bir blok birleştirilirken n_jobs blok daha sorgulanıyor olabilir
+        budget = max(1, self.max_memory_bytes // (self.n_jobs + 1))
+        cost = np.cumsum(counts * self.BYTES_PER_NEIGHBOR + self.BYTES_PER_ROW)
+        start = 0
+        while start < len(counts):
+            offset = cost[start - 1] if start else 0
+            stop = int(np.searchsorted(cost, offset + budget, side='right'))
+            stop = max(stop, start + 1)
+            yield start, stop
+            start = stop
+            
+    def _map_blocks(
+        self,
+        executor: Optional[ProcessPoolExecutor],
+        tree,
+        X: np.ndarray,
+        blocks: Iterator[Tuple[int, int]],
+        count_only: bool
+    ) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Blokları sırayla sorgular; işçi varsa en fazla n_jobs + 1 blok bekletilir
+        
+        Args:
+            executor (Optional[ProcessPoolExecutor]): İşçi havuzu (None ise bu süreçte)
+            tree: Bu süreçteki uzamsal indeks (executor None ise)
+            X (np.ndarray): Veri matrisi
+            blocks (Iterator[Tuple[int, int]]): (başlangıç, bitiş) aralıkları
+            count_only (bool): Yalnızca komşu sayılarını döndür
+            
+        Returns:
+            Iterator[Tuple[int, int, np.ndarray]]: Blok sonuçları
+        """
+        if executor is None:
+            for start, stop in blocks:
+                yield _query_block(tree, X, start, stop, self.eps, count_only)
+            return
+            
+        pending = deque()
+        for start, stop in blocks:
+            pending.append(executor.submit(_worker_query_block, start, stop, self.eps, count_only))
+            if len(pending) > self.n_jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+            
+    def fit(self, X: np.ndarray) -> 'BlockedDBSCAN':
+        """
+        Kümeleri bulur
+        
+        Args:
+            X (np.ndarray): Satır x özellik veri matrisi
+            
+        Returns:
+            BlockedDBSCAN: Uydurulmuş model
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        n_rows = len(X)
+        counts = np.empty(n_rows, dtype=np.int64)
+        parent = np.arange(n_rows)
+        anchor = np.full(n_rows, -1, dtype=np.int64)
+        self.n_blocks_ = 0
+        
+        executor = None
+        tree = None
+        if self.n_jobs > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_worker,
+                initargs=(X, self.algorithm, self.leaf_size)
+            )
+        else:
+            tree = _build_tree(X, self.algorithm, self.leaf_size)
+            
+        try:
+            # 1. Geçiş: yalnızca komşu sayıları (bellek O(blok))
+            count_blocks = ((start, min(start + self.count_block_rows, n_rows))
+                            for start in range(0, n_rows, self.count_block_rows))
+            for start, stop, block_counts in self._map_blocks(executor, tree, X, count_blocks, True):
+                counts[start:stop] = block_counts
+            core = counts >= self.min_samples
+            
+            # 2. Geçiş: bloklar halinde komşuluklar, bileşenler ve sınır noktaları
+            for block in self._map_blocks(executor, tree, X, self._blocks(counts), False):
+                self._merge_block(block, counts, core, parent, anchor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+                
+        # Etiketler: çekirdek bileşenleri ilk görülme sırasına göre numaralanır
+        labels = np.full(n_rows, -1, dtype=np.int64)
+        core_index = np.flatnonzero(core)
+        if len(core_index):
+            component = self._find(parent, core_index)
+            roots, first, inverse = np.unique(component, return_index=True, return_inverse=True)
+            order = np.empty(len(roots), dtype=np.int64)
+            order[np.argsort(first, kind='stable')] = np.arange(len(roots))
+            labels[core_index] = order[inverse]
+            border = np.flatnonzero(~core & (anchor >= 0))
+            labels[border] = labels[anchor[border]]
+            
+        self.labels_ = labels
+        self.core_sample_indices_ = core_index
+        self.logger.info(
+            f"Blok DBSCAN tamamlandı: {n_rows} nokta, {len(core_index)} çekirdek, {self.n_blocks_} blok"
+        )
+        return self
+        
+    @staticmethod
+    def _find(parent: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """
+        Birleşim-bul ormanında düğümlerin köklerini bulur ve yolları kısaltır
+        
+        Args:
+            parent (np.ndarray): Ebeveyn dizisi (güncellenir)
+            nodes (np.ndarray): Kökleri aranan düğümler
+            
+        Returns:
+            np.ndarray: Düğüm kökleri
+        """
+        roots = parent[nodes]
+        while True:
+            upper = parent[roots]
+            if np.array_equal(upper, roots):
+                break
+            roots = upper
+        parent[nodes] = roots
+        return roots
+        
+    def _merge_block(
+        self,
+        block: Tuple[int, int, np.ndarray],
+        counts: np.ndarray,
+        core: np.ndarray,
+        parent: np.ndarray,
+        anchor: np.ndarray
+    ) -> None:
+        """
+        Bir bloğun komşuluklarını bileşenlere ve sınır noktalarına işler
+        
+        Yalnızca bloğun dokunduğu düğümler güncellenir; maliyet toplam nokta
+        sayısına değil blok boyutuna bağlıdır.
+        
+        Args:
+            block (Tuple[int, int, np.ndarray]): (başlangıç, bitiş, düz komşu indeksleri)
+            counts (np.ndarray): Nokta başına komşu sayıları
+            core (np.ndarray): Çekirdek nokta maskesi
+            parent (np.ndarray): Çekirdek noktaların birleşim-bul ormanı (güncellenir)
+            anchor (np.ndarray): Sınır noktaları için bağlı çekirdek nokta (güncellenir)
+        """
+        start, stop, neighbors = block
+        self.n_blocks_ += 1
+        source = np.repeat(np.arange(start, stop), counts[start:stop])
+        to_core = core[neighbors]
+        source, neighbors = source[to_core], neighbors[to_core]
+        
+        # Sınır noktaları herhangi bir çekirdek komşuya bağlanır
+        is_border = ~core[source]
+        anchor[source[is_border]] = neighbors[is_border]
+        
+        # Çekirdek-çekirdek kenarları (simetrik olduğundan tek yönde) mevcut
+        # kökler üzerinden birleştirilir; zaten aynı bileşendekiler atlanır
+        one_way = ~is_border & (source < neighbors)
+        source, neighbors = source[one_way], neighbors[one_way]
+        a, b = self._find(parent, source), self._find(parent, neighbors)
+        differ = a != b
+        a, b = a[differ], b[differ]
+        if not len(a):
+            return
+        roots, inverse = np.unique(np.concatenate([a, b]), return_inverse=True)
+        graph = coo_matrix(
+            (np.ones(len(a), dtype=np.int8), (inverse[:len(a)], inverse[len(a):])),
+            shape=(len(roots), len(roots))
+        )
+        _, groups = connected_components(graph, directed=False)
+        representative = np.full(groups.max() + 1, len(parent), dtype=np.int64)
+        np.minimum.at(representative, groups, roots)
+        parent[roots] = representative[groups]
+        
+    def fit_predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Kümeleri bulur ve etiketleri döndürür
+        
+        Args:
+            X (np.ndarray): Satır x özellik veri matrisi
+            
+        Returns:
+            np.ndarray: Küme etiketleri (-1 gürültü)
+        """
+        return self.fit(X).labels_
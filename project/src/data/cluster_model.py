@@ -0,0 +1,214 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple, Union
+import logging
+from pathlib import Path
+import json
+from .mmap_dataset import MmapDataset
+
+class ClusterModel:
+    """
+    Yeniden uydurmadan yeni noktaları kümelere atayan kalıcı model.
+    
+    Ölçekleme parametreleri (StandardScaler ortalaması ve ölçeği) ile
+    ölçeklenmiş uzaydaki merkezler saklanır. Ölçek, yükleme sırasında bir kez
+    merkezlere katlanır; böylece atama her satır bloğu için yalnızca
+    ortalamadan arındırma ve tek bir matris çarpımıdır, ölçeklenmiş kopya ve
+    tam mesafe matrisi oluşturulmaz.
+    """
+    
+    def __init__(
+        self,
+        centers: Union[np.ndarray, List[List[float]]],
+        mean: Union[np.ndarray, List[float]],
+        scale: Union[np.ndarray, List[float]],
+        columns: Optional[List[Any]] = None,
+        method: str = 'kmeans',
+        block_rows: int = 65536,
+        dtype: Union[str, np.dtype] = 'float32'
+    ):
+        """
+        ClusterModel sınıfı başlatıcısı
+        
+        Args:
+            centers (Union[np.ndarray, List[List[float]]]): Ölçeklenmiş uzaydaki küme merkezleri (k x p)
+            mean (Union[np.ndarray, List[float]]): Ölçekleme ortalaması
+            scale (Union[np.ndarray, List[float]]): Ölçekleme çarpanı (sabit sütunlarda 1)
+            columns (Optional[List[Any]]): Özellik sütunları (DataFrame girdilerinde bu sırayla seçilir)
+            method (str): Modeli üreten kümeleme metodu
+            block_rows (int): Atamada satır bloğu boyutu
+            dtype (Union[str, np.dtype]): Matris çarpımlarının tipi (float32, float64)
+        """
+        self.centers = np.asarray(centers, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        if self.centers.ndim != 2 or self.centers.shape[1] != len(self.mean) or len(self.scale) != len(self.mean):
+            raise ValueError("Merkezler ile ölçekleme parametrelerinin boyutları uyuşmuyor")
+        self.columns = list(columns) if columns is not None else None
+        self.method = method
+        self.block_rows = block_rows
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.dtype('float32'), np.dtype('float64')):
+            raise ValueError(f"Desteklenmeyen atama tipi: {dtype}")
+        self.logger = logging.getLogger(__name__)
+        
+        # ||(x - m) / s - c||^2 = ||(x - m) / s||^2 - 2 (x - m) . (c / s) + ||c||^2
+        # İlk terim satır içinde sabit olduğundan argmin için gerekmez
+        self._weights = np.ascontiguousarray((-2.0 * self.centers / self.scale).T, dtype=self.dtype)
+        self._offsets = (self.centers ** 2).sum(axis=1).astype(self.dtype)
+        
+    @classmethod
+    def from_results(cls, results: Dict[str, Any], **kwargs) -> 'ClusterModel':
+        """
+        perform_clustering sonuçlarından model oluşturur
+        
+        Args:
+            results (Dict[str, Any]): Merkezleri ve ölçekleme parametrelerini içeren kümeleme sonuçları
+            **kwargs: ClusterModel başlatıcısına iletilecek ek parametreler
+            
+        Returns:
+            ClusterModel: Küme modeli
+        """
+        if 'centers' not in results or 'scaler' not in results:
+            raise ValueError(f"Kümeleme sonucunda merkez bulunmuyor: {results.get('method')}")
+        scaler = results['scaler']
+        return cls(
+            results['centers'],
+            scaler['mean'],
+            scaler['scale'],
+            columns=scaler.get('columns'),
+            method=results.get('method', 'kmeans'),
+            **kwargs
+        )
+        
+    @property
+    def n_clusters(self) -> int:
+        """Küme sayısı"""
+        return len(self.centers)
+        
+    def _values(self, data: Union[pd.DataFrame, MmapDataset, np.ndarray]) -> Tuple[Any, Optional[np.ndarray]]:
+        """
+        Girdiyi satır dilimlenebilir veriye ve model sütunlarının konumlarına çevirir
+        
+        Sütunlar blok başına seçilir; böylece tüm verinin sütun alt kümesi kopyalanmaz.
+        """
+        if isinstance(data, (pd.DataFrame, MmapDataset)):
+            available = list(data.columns)
+            if self.columns is not None:
+                columns = [str(col) for col in available]
+                missing = [col for col in self.columns if col not in columns]
+                if missing:
+                    raise ValueError(f"Küme modelinin sütunları veride bulunamadı: {missing}")
+                positions = np.array([columns.index(col) for col in self.columns])
+            elif isinstance(data, pd.DataFrame):
+                positions = np.flatnonzero([pd.api.types.is_numeric_dtype(dtype) for dtype in data.dtypes])
+            else:
+                positions = np.arange(len(available))
+            if np.array_equal(positions, np.arange(len(available))):
+                positions = None
+            values = data.values if isinstance(data, MmapDataset) else data
+            return values, positions
+        values = np.asarray(data)
+        return (values.reshape(1, -1) if values.ndim == 1 else values), None
+        
+    def assign(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, np.ndarray],
+        return_distance: bool = False
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Noktaları en yakın küme merkezine atar
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, np.ndarray]): Ham (ölçeklenmemiş) veri
+            return_distance (bool): Ölçeklenmiş uzaydaki mesafeleri de döndür
+            
+        Returns:
+            Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]: Küme etiketleri (ve mesafeler)
+        """
+        values, positions = self._values(data)
+        n_features = values.shape[1] if positions is None else len(positions)
+        if n_features != len(self.mean):
+            raise ValueError(f"Özellik sayısı uyuşmuyor: {n_features} != {len(self.mean)}")
+            
+        n_rows = len(values)
+        labels = np.empty(n_rows, dtype=np.int32)
+        distances = np.empty(n_rows, dtype=np.float64) if return_distance else None
+        mean = self.mean.astype(self.dtype)
+        for start in range(0, n_rows, self.block_rows):
+            if isinstance(values, pd.DataFrame):
+                block = values.iloc[start:start + self.block_rows]
+                block = (block if positions is None else block.iloc[:, positions]).to_numpy(dtype=self.dtype, copy=True)
+            else:
+                block = values[start:start + self.block_rows]
+                block = np.array(block if positions is None else block[:, positions], dtype=self.dtype)
+            block -= mean
+            scores = block @ self._weights
+            scores += self._offsets
+            block_labels = scores.argmin(axis=1)
+            labels[start:start + len(block)] = block_labels
+            if return_distance:
+                block /= self.scale.astype(self.dtype)
+                squared = np.einsum('ij,ij->i', block, block, dtype=np.float64)
+                squared += scores[np.arange(len(block_labels)), block_labels]
+                distances[start:start + len(block)] = np.sqrt(np.maximum(squared, 0.0))
+                
+        if return_distance:
+            return labels, distances
+        return labels
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Modeli JSON uyumlu sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Serileştirilmiş model
+        """
+        return {
+            'method': self.method,
+            'columns': [str(col) for col in self.columns] if self.columns is not None else None,
+            'centers': self.centers.tolist(),
+            'mean': self.mean.tolist(),
+            'scale': self.scale.tolist()
+        }
+        
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any], **kwargs) -> 'ClusterModel':
+        """
+        Sözlükten model oluşturur
+        
+        Args:
+            state (Dict[str, Any]): to_dict çıktısı
+            **kwargs: ClusterModel başlatıcısına iletilecek ek parametreler
+            
+        Returns:
+            ClusterModel: Küme modeli
+        """
+        return cls(state['centers'], state['mean'], state['scale'], state['columns'], state['method'], **kwargs)
+        
+    def save(self, file_path: str) -> None:
+        """
+        Modeli JSON dosyasına kaydeder
+        
+        Args:
+            file_path (str): Kayıt yolu
+        """
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        self.logger.info(f"Küme modeli kaydedildi: {file_path}")
+        
+    @classmethod
+    def load(cls, file_path: str, **kwargs) -> 'ClusterModel':
+        """
+        Modeli JSON dosyasından yükler
+        
+        Args:
+            file_path (str): Dosya yolu
+            **kwargs: ClusterModel başlatıcısına iletilecek ek parametreler
+            
+        Returns:
+            ClusterModel: Küme modeli
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), **kwargs)
@@ -6,14 +6,30 @@ Veri analizi pipeline'ı için yapılandırma ayarları.
 BASE_CONFIG = {
     'output_path': 'output/analysis',
     
+    # Veri yükleme ayarları
+    'loading': {
+        'optimize_dtypes': False  # Sayısal tipleri küçült, düşük kardinaliteli metinleri kategoriye çevir
+    },
+    
+    # Veri önbelleği ayarları
+    'cache': {
+        'enabled': False,
+        'path': 'cache/data',
+        'max_bytes': 2 * 1024 ** 3  # En fazla disk kullanımı (bayt)
+    },
+    
     # Veri temizleme ayarları
     'cleaning': {
+        'engine': 'pandas',  # pandas, fused
+        'inplace': False,  # fused motorda eksik değerleri yerinde doldur
         'missing_values': {
             'strategy': 'mean'  # mean, median, mode, drop
         },
         'outliers': {
             'method': 'zscore',  # zscore, iqr
-            'threshold': 3
+            'threshold': 3,
+            'quantiles': 'exact',  # exact, approx (iqr için KLL özeti)
+            'quantile_error': 0.01  # approx modunda hedeflenen sıra hatası
         },
         'categorical': {
             'method': 'onehot',  # onehot, label
@@ -21,6 +37,36 @@ BASE_CONFIG = {
         }
     },
     
+    # Uydurulmuş dönüştürücü ayarları
+    'transformers': {
+        'enabled': False,  # Temizleme/normalizasyon parametrelerini bir kez uydur ve kaydet
+        'path': 'output/analysis/transformers.json'
+    },
+    
+    # Özet istatistik önbelleği ayarları
+    'stats_cache': {
+        'max_frames': 4  # Özetleri tutulacak en fazla çerçeve sayısı (0 = kapalı)
+    },
+    
+    # Bellek eşlemeli veri seti ayarları
+    'mmap': {
+        'enabled': False,  # Temizlenmiş veriyi diske yazıp sonraki adımlarda paylaşımlı aç
+        'path': 'cache/prepared.mmap'
+    },
+    
+    # Veri analizi ayarları
+    'analysis': {
+        'quantiles': 'exact',  # exact, approx (aykırı değer analizi için KLL özeti)
+        'quantile_error': 0.01,
+        'n_jobs': 1,  # Geniş tablolarda sütun profili için süreç sayısı
+        'correlation': {
+            'engine': 'pandas',  # pandas, blas (bir kez standartlaştırıp bloklu matris çarpımı)
+            'dtype': 'float32',  # blas motorunda çarpım tipi (float32, float64)
+            'block_size': 1024,  # blas motorunda sütun bloğu genişliği
+            'top_k': None  # Verilirse tam matris yerine sütun başına en güçlü k korelasyon
+        }
+    },
+    
     # Normalizasyon ayarları
     'normalization': {
         'method': 'minmax'  # minmax, standard
@@ -29,16 +75,60 @@ BASE_CONFIG = {
     # Kümeleme ayarları
     'clustering': {
         'enabled': True,
-        'method': 'kmeans',  # kmeans, dbscan
+        'method': 'kmeans',  # kmeans, kmeans_auto, minibatch_kmeans, dbscan, dbscan_indexed
         'n_clusters': 3,
         'eps': 0.5,  # DBSCAN için
-        'min_samples': 5  # DBSCAN için
+        'min_samples': 5,  # DBSCAN için
+        'batch_size': 4096,  # minibatch_kmeans için mini yığın satır sayısı
+        'max_epochs': 3,  # minibatch_kmeans için en fazla geçiş sayısı
+        'index': 'kd_tree',  # dbscan_indexed için uzamsal indeks (kd_tree, ball_tree)
+        'n_jobs': 1,  # dbscan_indexed ve kmeans_auto için paralel süreç sayısı
+        'max_memory_bytes': 256 * 1024 ** 2,  # dbscan_indexed komşuluk blokları için bellek sınırı
+        'k_range': [2, 10],  # kmeans_auto için denenecek küme sayıları (dahil)
+        'k_criterion': 'silhouette',  # kmeans_auto için seçim ölçütü (silhouette, elbow)
+        'score_sample_size': 5000,  # kmeans_auto siluet skoru için örneklem boyutu
+        'model_path': None  # Verilirse merkezler ve ölçekleme ClusterModel olarak kaydedilir (ör. output/models/cluster_model.json)
     },
     
     # PCA ayarları
     'pca': {
         'enabled': True,
-        'n_components': 2
+        'n_components': 2,
+        'method': 'exact',  # exact, randomized, incremental
+        'batch_size': 4096  # incremental için blok satır sayısı
+    },
+    
+    # Görselleştirme ayarları
+    'visualization': {
+        'render': 'auto',  # auto, scatter, density
+        'density_threshold': 50000,  # auto modunda yoğunluk ızgarasına geçilen nokta sayısı
+        'bins': 200,  # Yoğunluk ızgarasında eksen başına hücre sayısı
+        'annotate_max_cells': 400,  # Korelasyon değerlerinin yazılacağı en fazla hücre sayısı
+        'n_jobs': 1  # Grafikleri paralel çizen süreç sayısı
+    },
+    
+    # Sonuç kaydetme ayarları
+    'results': {
+        'format': 'json',  # json, npz (büyük diziler ikili yan dosyada, JSON manifest)
+        'compress': True,  # npz biçiminde sıkıştırılmış .npz (False: bellek eşlemeli .npy dosyaları)
+        'min_array_size': 1024  # Yan dosyaya yazılacak en küçük dizi boyutu
+    },
+    
+    # Hızlı önizleme ayarları (run_preview)
+    'preview': {
+        'sample_size': 10000,  # Örneklem boyutu
+        'method': 'reservoir',  # reservoir, stratified
+        'stratify_column': None,  # stratified için tabaka sütunu (kategorik veya az değerli)
+        'confidence': 0.95,  # Hata payları için güven düzeyi
+        'n_bootstrap': 20,  # PCA aralıkları için yeniden örnekleme sayısı
+        'chunk_rows': 100000,  # Örnekleme sırasında okunan parça boyutu
+        'background': True  # Tam analizi ayrı süreçte arka planda başlat
+    },
+    
+    # Artımlı analiz ayarları (run_incremental)
+    'incremental': {
+        'state_path': 'output/analysis/incremental_state.json',  # Birleştirilebilir analiz durumu
+        'drift_threshold': 0.25  # Yeni satırlarda baştan hesaplamayı tetikleyen kayma (std birimi / log std oranı)
     },
     
     # Regresyon ayarları
@@ -47,7 +137,24 @@ BASE_CONFIG = {
         'target_column': 'target',
         'test_size': 0.2,
         'ridge_alpha': 1.0,
-        'lasso_alpha': 1.0
+        'lasso_alpha': 1.0,
+        'trainer': 'sklearn',  # sklearn, streaming (doğrusal ve ridge için tek geçişte XᵀX/Xᵀy toplamları)
+        'n_jobs': 1,  # streaming eğitimde paralel süreç sayısı
+        'block_rows': 65536,  # streaming eğitimde blok satır sayısı
+        'model_n_jobs': 1,  # > 1 ise modeller paylaşımlı bellekteki veri üzerinde eşzamanlı eğitilir
+        'predictor_dir': None,  # Verilirse her model LinearPredictor olarak kaydedilir (ör. output/models)
+        'cv': {
+            'enabled': False,  # Eğitim verisinde tekrarlı k-katlı çapraz doğrulama (doğrusal/ridge katlama momentlerinden)
+            'n_splits': 5,
+            'n_repeats': 1
+        },
+        'path': {
+            'enabled': False,  # Ridge ve lasso için alpha yolu hesapla, doğrulamada en iyisini seç
+            'validation_size': 0.2,  # Eğitim verisinden ayrılan doğrulama oranı
+            'n_alphas': 50,  # Otomatik alpha ızgarası boyutu
+            'ridge_alphas': None,  # Verilirse otomatik ızgara yerine kullanılır
+            'lasso_alphas': None
+        }
     }
 }
 
@@ -0,0 +1,225 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+import logging
+from .data_chunks import DataChunks
+from .mmap_dataset import MmapDataset
+
+class CorrelationEngine:
+    """
+    Geniş veri çerçeveleri için bloklu BLAS korelasyon motoru.
+    
+    Eksik değer yoksa veri bir kez standartlaştırılır ve korelasyon matrisi
+    sütun blokları halinde tek bir matris çarpımıyla hesaplanır. Eksik değer
+    varsa veya veri parçalar halinde geliyorsa, ikili tam gözlemler için
+    gereken toplamlar maske çarpımlarıyla biriktirilir; sonuç pandas'ın
+    pairwise yöntemiyle aynıdır. Çarpımlar seçilen tipte (varsayılan
+    float32), biriktirme float64 ile yapılır.
+    """
+    
+    def __init__(
+        self,
+        dtype: Union[str, np.dtype] = 'float32',
+        block_size: int = 1024,
+        chunk_rows: int = 65536
+    ):
+        """
+        CorrelationEngine sınıfı başlatıcısı
+        
+        Args:
+            dtype (Union[str, np.dtype]): Matris çarpımlarının tipi (float32, float64)
+            block_size (int): Sütun bloğu genişliği
+            chunk_rows (int): Eksik değerli bellek içi veride satır bloğu boyutu
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.dtype('float32'), np.dtype('float64')):
+            raise ValueError(f"Desteklenmeyen korelasyon tipi: {dtype}")
+        self.block_size = block_size
+        self.chunk_rows = chunk_rows
+        self.logger = logging.getLogger(__name__)
+        
+    def _source(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]
+    ) -> Tuple[List[Any], Any, Optional[Iterator[np.ndarray]]]:
+        """
+        Veriyi sütun adları ve bellekteki matris ya da parça yineleyicisine çevirir
+        
+        Returns:
+            Tuple[List[Any], Any, Optional[Iterator[np.ndarray]]]: Sütunlar, bellekteki veri (DataFrame veya dizi), parçalar
+        """
+        if isinstance(data, DataChunks):
+            iterator = iter(data)
+            first = next(iterator, None)
+            if first is None:
+                raise ValueError("Korelasyon için veri parçası bulunamadı")
+            columns = list(first.select_dtypes(include=[np.number]).columns)
+            
+            def chunks() -> Iterator[np.ndarray]:
+                yield first[columns].to_numpy(dtype=np.float64)
+                for chunk in iterator:
+                    yield chunk[columns].to_numpy(dtype=np.float64)
+            return columns, None, chunks()
+            
+        if isinstance(data, MmapDataset):
+            return list(data.columns), data.values, None
+        if isinstance(data, pd.DataFrame):
+            numeric = data.select_dtypes(include=[np.number, 'bool'])
+            return list(numeric.columns), numeric, None
+        values = np.asarray(data)
+        return list(range(values.shape[1])), values, None
+        
+    def _standardize(self, values: np.ndarray) -> np.ndarray:
+        """
+        Sütunları ortalamadan arındırıp birim normlu hale getirir
+        
+        Sabit sütunlar NaN olur; böylece korelasyonları pandas'taki gibi NaN çıkar.
+        
+        Args:
+            values (np.ndarray): Eksik değersiz veri matrisi veya veri çerçevesi
+            
+        Returns:
+            np.ndarray: Standartlaştırılmış matris (seçilen tipte)
+        """
+        # Tek kopya: pandas blokları zaten sütun sıralı olduğundan F sırası ucuzdur
+        z = np.array(values, dtype=self.dtype, order='F', copy=True)
+        z -= z.mean(axis=0, dtype=np.float64).astype(self.dtype)
+        norm = np.sqrt(np.einsum('ij,ij->j', z, z, dtype=np.float64))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.where(norm > 0, 1.0 / norm, np.nan).astype(self.dtype)
+        z *= scale
+        return z
+        
+    def _accumulate(self, chunks: Iterator[np.ndarray], n_columns: int) -> Dict[str, np.ndarray]:
+        """
+        İkili tam gözlem korelasyonu için toplamları parçalar üzerinde biriktirir
+        
+        Args:
+            chunks (Iterator[np.ndarray]): Veri parçaları
+            n_columns (int): Sütun sayısı
+            
+        Returns:
+            Dict[str, np.ndarray]: n, sx, sxx ve sxy toplamları
+        """
+        sums = {key: np.zeros((n_columns, n_columns)) for key in ('n', 'sx', 'sxx', 'sxy')}
+        shift = None
+        for values in chunks:
+            if not len(values):
+                continue
+            if shift is None:
+                # Sayısal kararlılık için ilk parçanın ortalamasına göre kaydırılır
+                with np.errstate(invalid='ignore'):
+                    shift = np.nan_to_num(np.nanmean(values, axis=0))
+            values = values - shift
+            mask = ~np.isnan(values)
+            values = np.where(mask, values, 0.0).astype(self.dtype)
+            weights = mask.astype(self.dtype)
+            sums['n'] += weights.T @ weights
+            sums['sx'] += values.T @ weights
+            sums['sxx'] += (values * values).T @ weights
+            sums['sxy'] += values.T @ values
+        return sums
+        
+    @staticmethod
+    def _from_sums(sums: Dict[str, np.ndarray]) -> np.ndarray:
+        """Biriktirilen toplamlardan korelasyon matrisini hesaplar"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = sums['n']
+            # sx[i, j]: i ve j birlikte gözlendiğinde i'nin toplamı
+            cov = sums['sxy'] - sums['sx'] * sums['sx'].T / n
+            var_i = sums['sxx'] - sums['sx'] ** 2 / n
+            corr = cov / np.sqrt(var_i * var_i.T)
+        return np.clip(corr, -1.0, 1.0)
+        
+    def _column_blocks(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]
+    ) -> Tuple[List[Any], Iterator[Tuple[int, np.ndarray]]]:
+        """
+        Korelasyon matrisini sütun blokları halinde üretir
+        
+        Returns:
+            Tuple[List[Any], Iterator[Tuple[int, np.ndarray]]]: Sütunlar ve (başlangıç, p x blok) blokları
+        """
+        columns, values, chunks = self._source(data)
+        n_columns = len(columns)
+        
+        if values is not None:
+            missing = values.isna().to_numpy() if isinstance(values, pd.DataFrame) else np.isnan(values)
+            if missing.any():
+                # Eksik değerli bellek içi veri satır blokları halinde biriktirilir
+                source, values = values, None
+                chunks = (np.asarray(source[start:start + self.chunk_rows], dtype=np.float64)
+                          for start in range(0, len(source), self.chunk_rows))
+            del missing
+            
+        if values is not None:
+            z = self._standardize(values)
+            
+            def blocks() -> Iterator[Tuple[int, np.ndarray]]:
+                for start in range(0, n_columns, self.block_size):
+                    stop = min(start + self.block_size, n_columns)
+                    block = np.clip(z.T @ z[:, start:stop], -1.0, 1.0)
+                    offsets = np.arange(stop - start)
+                    offsets = offsets[np.isfinite(block[start + offsets, offsets])]
+                    block[start + offsets, offsets] = 1.0
+                    yield start, block
+            return columns, blocks()
+            
+        corr = self._from_sums(self._accumulate(chunks, n_columns))
+        return columns, ((start, corr[:, start:start + self.block_size])
+                         for start in range(0, n_columns, self.block_size))
+                         
+    def compute(self, data: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]) -> pd.DataFrame:
+        """
+        Sayısal sütunların korelasyon matrisini hesaplar
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]): Veri veya veri parçaları
+            
+        Returns:
+            pd.DataFrame: Korelasyon matrisi
+        """
+        columns, blocks = self._column_blocks(data)
+        corr = np.empty((len(columns), len(columns)), dtype=np.float64)
+        for start, block in blocks:
+            corr[:, start:start + block.shape[1]] = block
+        return pd.DataFrame(corr, index=columns, columns=columns)
+        
+    def top_k(
+        self,
+        data: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray],
+        k: int = 10
+    ) -> Dict[Any, Dict[Any, float]]:
+        """
+        Her sütun için mutlak değerce en yüksek k korelasyonu döndürür
+        
+        Eksik değersiz bellek içi veride tam matris hiçbir zaman oluşturulmaz;
+        her sütun bloğundan yalnızca ilk k değer saklanır.
+        
+        Args:
+            data (Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]): Veri veya veri parçaları
+            k (int): Sütun başına saklanacak korelasyon sayısı (sütunun kendisi hariç)
+            
+        Returns:
+            Dict[Any, Dict[Any, float]]: Sütun -> {diğer sütun: korelasyon}
+        """
+        columns, blocks = self._column_blocks(data)
+        k = min(k, len(columns) - 1)
+        result = {}
+        for start, block in blocks:
+            strength = np.abs(block)
+            strength[np.isnan(strength)] = -1.0
+            for offset in range(block.shape[1]):
+                strength[start + offset, offset] = -1.0
+            if k <= 0:
+                result.update({columns[start + offset]: {} for offset in range(block.shape[1])})
+                continue
+            top = np.argpartition(-strength, k - 1, axis=0)[:k]
+            for offset in range(block.shape[1]):
+                rows = top[:, offset]
+                rows = rows[np.argsort(-strength[rows, offset], kind='stable')]
+                result[columns[start + offset]] = {
+                    columns[row]: float(block[row, offset]) for row in rows if strength[row, offset] >= 0
+                }
+        return result
@@ -0,0 +1,215 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional
+import logging
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import time
+
+class DataCache:
+    """
+    Yüklenen veri setleri için disk üzerinde sütunlu önbellek.
+    
+    Her veri seti, sütun başına bir .npy dosyası ve bir meta dosyası olarak
+    saklanır. Kayıtlar dosya yolu, boyutu, değişiklik zamanı ve içerik özeti
+    ile anahtarlanır; toplam boyut sınırı aşıldığında en uzun süredir
+    kullanılmayan kayıtlar silinir.
+    """
+    
+    INDEX_FILE = "index.json"
+    META_FILE = "meta.json"
+    
+    def __init__(self, cache_dir: str = 'cache/data', max_bytes: int = 2 * 1024 ** 3):
+        """
+        DataCache sınıfı başlatıcısı
+        
+        Args:
+            cache_dir (str): Önbellek dizini
+            max_bytes (int): Önbelleğin kullanabileceği en fazla disk alanı
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        
+    def make_key(self, file_path: str, file_type: str, hash_content: bool = True) -> str:
+        """
+        Kaynak dosya için önbellek anahtarı üretir
+        
+        Args:
+            file_path (str): Kaynak dosya yolu
+            file_type (str): Dosya tipi
+            hash_content (bool): Dosya içeriğinin özetini anahtara ekle
+            
+        Returns:
+            str: Önbellek anahtarı
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        parts = [str(path), file_type, str(stat.st_size), str(stat.st_mtime_ns)]
+        
+        if hash_content:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            parts.append(digest.hexdigest())
+            
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+        
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Önbellekteki veri setini okur
+        
+        Args:
+            key (str): Önbellek anahtarı
+            
+        Returns:
+            Optional[pd.DataFrame]: Önbellekteki veri, yoksa None
+        """
+        entry_dir = self.cache_dir / key
+        meta_file = entry_dir / self.META_FILE
+        if not meta_file.exists():
+            return None
+            
+        try:
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+                
+            columns = {}
+            for i, column in enumerate(meta['columns']):
+                values = np.load(entry_dir / f"{i}.npy", allow_pickle=column['kind'] == 'object')
+                if column['kind'] == 'category':
+                    categories = np.load(entry_dir / f"{i}.categories.npy", allow_pickle=True)
+                    columns[column['name']] = pd.Categorical.from_codes(
+                        values, categories=categories, ordered=column['ordered']
+                    )
+                elif column['kind'] == 'object':
+                    columns[column['name']] = pd.Series(values, dtype=column['dtype'])
+                else:
+                    columns[column['name']] = values
+                    
+            data = pd.DataFrame(columns, columns=[c['name'] for c in meta['columns']])
+            
+        except Exception as e:
+            self.logger.warning(f"Bozuk önbellek kaydı siliniyor: {key} ({e})")
+            self._remove(key)
+            return None
+            
+        self._touch(key)
+        self.logger.info(f"Veri önbellekten yüklendi: {key}")
+        return data
+        
+    def put(self, key: str, data: pd.DataFrame) -> bool:
+        """
+        Veri setini önbelleğe yazar
+        
+        Args:
+            key (str): Önbellek anahtarı
+            data (pd.DataFrame): Saklanacak veri
+            
+        Returns:
+            bool: İşlem başarılı ise True
+        """
+        entry_dir = self.cache_dir / key
+        tmp_dir = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        
+        try:
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            meta = {'columns': []}
+            
+            for i, name in enumerate(data.columns):
+                series = data.iloc[:, i]
+                column = {'name': name, 'dtype': str(series.dtype)}
+                
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    column.update(kind='category', ordered=bool(series.cat.ordered))
+                    np.save(tmp_dir / f"{i}.npy", series.cat.codes.to_numpy())
+                    np.save(tmp_dir / f"{i}.categories.npy",
+                            np.asarray(series.cat.categories, dtype=object), allow_pickle=True)
+                elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufcmM':
+                    column['kind'] = 'numpy'
+                    np.save(tmp_dir / f"{i}.npy", series.to_numpy())
+                else:
+                    column['kind'] = 'object'
+                    np.save(tmp_dir / f"{i}.npy", series.to_numpy(dtype=object), allow_pickle=True)
+                    
+                meta['columns'].append(column)
+                
+            with open(tmp_dir / self.META_FILE, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False)
+                
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir)
+            tmp_dir.rename(entry_dir)
+            
+        except Exception as e:
+            self.logger.error(f"Önbelleğe yazma hatası: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+            
+        size = sum(f.stat().st_size for f in entry_dir.iterdir())
+        index = self._read_index()
+        index[key] = {'size': size, 'last_access': time.time()}
+        self._evict(index, keep=key)
+        self._write_index(index)
+        
+        self.logger.info(f"Veri önbelleğe yazıldı: {key} ({size} bayt)")
+        return True
+        
+    def clear(self) -> None:
+        """Önbellekteki tüm kayıtları siler"""
+        for key in list(self._read_index()):
+            self._remove(key)
+        self._write_index({})
+        
+    def _evict(self, index: Dict[str, Any], keep: Optional[str] = None) -> None:
+        """
+        Boyut sınırı aşıldığında en eski kayıtları siler
+        
+        Args:
+            index (Dict[str, Any]): Önbellek dizini
+            keep (Optional[str]): Silinmeyecek kayıt
+        """
+        total = sum(entry['size'] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]['last_access']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= index.pop(key)['size']
+            self._remove(key)
+            self.logger.info(f"Önbellek kaydı silindi: {key}")
+            
+    def _touch(self, key: str) -> None:
+        """Kaydın son erişim zamanını günceller"""
+        index = self._read_index()
+        if key in index:
+            index[key]['last_access'] = time.time()
+            self._write_index(index)
+            
+    def _remove(self, key: str) -> None:
+        """Kaydı diskten siler"""
+        shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+        
+    def _read_index(self) -> Dict[str, Any]:
+        """Önbellek dizinini okur"""
+        index_file = self.cache_dir / self.INDEX_FILE
+        if not index_file.exists():
+            return {}
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+            
+    def _write_index(self, index: Dict[str, Any]) -> None:
+        """Önbellek dizinini atomik olarak yazar"""
+        index_file = self.cache_dir / self.INDEX_FILE
+        tmp_file = index_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_file, index_file)
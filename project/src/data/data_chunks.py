@@ -0,0 +1,44 @@
+import pandas as pd
+from typing import Callable, Iterator
+
+class DataChunks:
+    """
+    Yeniden okunabilir veri parçaları kaynağı.
+    
+    Her yinelemede kaynağı baştan okur; böylece global istatistikler için
+    birden fazla geçiş yapılabilir ve bellek kullanımı dosya boyutuna değil
+    parça boyutuna bağlı kalır.
+    """
+    
+    def __init__(self, factory: Callable[[], Iterator[pd.DataFrame]]):
+        """
+        DataChunks sınıfı başlatıcısı
+        
+        Args:
+            factory (Callable[[], Iterator[pd.DataFrame]]): Her çağrıda yeni bir parça yineleyicisi döndüren fonksiyon
+        """
+        self._factory = factory
+        
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter(self._factory())
+        
+    def map(self, func: Callable[[pd.DataFrame], pd.DataFrame]) -> 'DataChunks':
+        """
+        Her parçaya tembel olarak uygulanacak bir dönüşüm ekler
+        
+        Args:
+            func (Callable[[pd.DataFrame], pd.DataFrame]): Parça dönüşümü
+            
+        Returns:
+            DataChunks: Dönüştürülmüş parça kaynağı
+        """
+        return DataChunks(lambda: (func(chunk) for chunk in self))
+        
+    def collect(self) -> pd.DataFrame:
+        """
+        Tüm parçaları tek bir DataFrame olarak birleştirir
+        
+        Returns:
+            pd.DataFrame: Birleştirilmiş veri
+        """
+        return pd.concat(list(self), ignore_index=True)
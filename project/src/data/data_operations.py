@@ -1,9 +1,17 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Union
 import logging
 from pathlib import Path
 import json
+import weakref
+from .data_cache import DataCache
+from .stats_cache import StatisticsCache
+from .online_stats import OnlineStatistics
+from .mmap_dataset import MmapDataset
+from .quantile_sketch import ColumnSketches
+from .data_chunks import DataChunks
+from .transformers import TransformerPipeline
 
 class DataOperations:
     """
@@ -12,8 +20,14 @@ class DataOperations:
     Bu sınıf, veri temizleme, dönüştürme ve hazırlama işlemlerini yönetir.
     """
     
-    def __init__(self):
-        """DataOperations sınıfı başlatıcısı"""
+    def __init__(self, cache: Optional[DataCache] = None, stats_cache: Optional[StatisticsCache] = None):
+        """
+        DataOperations sınıfı başlatıcısı
+        
+        Args:
+            cache (Optional[DataCache]): Yüklenen veriler için disk önbelleği
+            stats_cache (Optional[StatisticsCache]): Aşamalar arasında paylaşılan özet önbelleği (None ise önbellek kapalı)
+        """
         # Loglama ayarları
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
@@ -27,19 +41,54 @@ class DataOperations:
             ]
         )
         self.logger = logging.getLogger(__name__)
+        self.cache = cache
+        self.stats_cache = stats_cache if stats_cache is not None else StatisticsCache(max_frames=0)
+        # Son optimize_dtypes raporu ve ait olduğu çerçeve (türetilmiş çerçevelere taşınmaz)
+        self.memory_optimization: Optional[Dict[str, Any]] = None
+        self._optimized_frame: Optional[weakref.ref] = None
         
-    def load_data(self, file_path: str, file_type: str = 'csv') -> Optional[pd.DataFrame]:
+    def load_data(
+        self,
+        file_path: str,
+        file_type: str = 'csv',
+        chunk_rows: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        optimize_dtypes: bool = False
+    ) -> Optional[Union[pd.DataFrame, DataChunks]]:
         """
         Veri dosyasını yükler
         
+        chunk_rows veya chunk_bytes verilirse dosya belleğe alınmaz; bunun yerine
+        sınırlı boyutlu parçalar üreten bir DataChunks kaynağı döndürülür.
+        Önbellek tanımlıysa değişmemiş dosyalar yeniden ayrıştırılmadan önbellekten okunur.
+        
         Args:
             file_path (str): Dosya yolu
-            file_type (str): Dosya tipi (csv, excel, json)
+            file_type (str): Dosya tipi (csv, excel, json, mmap)
+            chunk_rows (Optional[int]): Parça başına satır sayısı (akış modu)
+            chunk_bytes (Optional[int]): Parça başına yaklaşık bellek bütçesi (akış modu)
+            optimize_dtypes (bool): Yüklenen veriye optimize_dtypes uygula (akış modunda kullanılmaz)
             
         Returns:
-            Optional[pd.DataFrame]: Yüklenen veri
+            Optional[Union[pd.DataFrame, DataChunks]]: Yüklenen veri veya veri parçaları
         """
         try:
+            if chunk_rows is not None or chunk_bytes is not None:
+                return self._load_chunks(file_path, file_type, chunk_rows, chunk_bytes)
+                
+            if file_type == 'mmap':
+                # Bellek eşlemeli veri seti kopyasız açılır, önbelleğe gerek yoktur
+                data = MmapDataset(file_path).to_frame()
+                self.logger.info(f"Veri bellek eşlemeli olarak açıldı: {file_path}")
+                return data
+                
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(file_path, file_type)
+                data = self.cache.get(cache_key)
+                if data is not None:
+                    return self.optimize_dtypes(data) if optimize_dtypes else data
+                    
             if file_type == 'csv':
                 data = pd.read_csv(file_path)
             elif file_type == 'excel':
@@ -49,6 +98,12 @@ class DataOperations:
             else:
                 raise ValueError(f"Desteklenmeyen dosya tipi: {file_type}")
                 
+            if cache_key is not None:
+                self.cache.put(cache_key, data)
+                
+            if optimize_dtypes:
+                data = self.optimize_dtypes(data)
+                
             self.logger.info(f"Veri başarıyla yüklendi: {file_path}")
             return data
             
@@ -56,18 +111,216 @@ class DataOperations:
             self.logger.error(f"Veri yükleme hatası: {e}")
             return None
             
-    def clean_data(self, data: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
+    def optimize_dtypes(self, data: pd.DataFrame, category_ratio: float = 0.5) -> pd.DataFrame:
+        """
+        Sütun tiplerini bellek kullanımını azaltacak şekilde dönüştürür
+        
+        Tamsayılar değer aralığına sığan en küçük tipe, ondalıklı sayılar yalnızca
+        float32'ye kayıpsız dönüşebiliyorsa float32'ye indirilir. Benzersiz değer
+        oranı category_ratio altındaki metin sütunları 'category' tipine çevrilir.
+        Önceki ve sonraki bellek kullanımı self.memory_optimization altında
+        saklanır; get_data_info raporu yalnızca bu çerçeve için döndürür.
+        
+        Args:
+            data (pd.DataFrame): Dönüştürülecek veri
+            category_ratio (float): Kategoriye çevirme için en yüksek benzersiz değer oranı
+            
+        Returns:
+            pd.DataFrame: Tipleri optimize edilmiş veri
+        """
+        before = data.memory_usage(index=True, deep=True)
+        optimized = data.copy(deep=False)
+        changes = {}
+        
+        for i, dtype in enumerate(data.dtypes):
+            series = data.iloc[:, i]
+            if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+                continue
+            elif pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+                downcast = 'unsigned' if len(series) and series.min() >= 0 else 'integer'
+                converted = pd.to_numeric(series, downcast=downcast)
+            elif pd.api.types.is_float_dtype(dtype) and dtype == np.float64:
+                values = series.to_numpy()
+                narrowed = values.astype(np.float32)
+                with np.errstate(over='ignore', invalid='ignore'):
+                    lossless = np.array_equal(narrowed.astype(np.float64), values, equal_nan=True)
+                if not lossless:
+                    continue
+                converted = pd.Series(narrowed, index=series.index, name=series.name)
+            elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+                if not len(series) or series.nunique(dropna=True) / len(series) > category_ratio:
+                    continue
+                converted = series.astype('category')
+            else:
+                continue
+                
+            if converted.dtype != dtype:
+                optimized.isetitem(i, converted)
+                changes[str(data.columns[i])] = {'from': str(dtype), 'to': str(converted.dtype)}
+                
+        after = optimized.memory_usage(index=True, deep=True)
+        self.memory_optimization = {
+            'before_bytes': int(before.sum()),
+            'after_bytes': int(after.sum()),
+            'saved_bytes': int(before.sum() - after.sum()),
+            'columns': changes
+        }
+        self._optimized_frame = weakref.ref(optimized)
+        
+        self.logger.info(
+            f"Veri tipleri optimize edildi: {before.sum() / 1024 ** 2:.1f} MiB -> {after.sum() / 1024 ** 2:.1f} MiB"
+        )
+        return optimized
+        
+    def _load_chunks(
+        self,
+        file_path: str,
+        file_type: str,
+        chunk_rows: Optional[int],
+        chunk_bytes: Optional[int]
+    ) -> DataChunks:
+        """
+        Dosyayı sınırlı boyutlu parçalar halinde okuyan kaynağı oluşturur
+        
+        CSV dosyaları gerçekten akış olarak okunur. Excel ve JSON okuyucuları
+        parça desteği sunmadığından bu tiplerde dosya bir kez okunup dilimlenir.
+        
+        Args:
+            file_path (str): Dosya yolu
+            file_type (str): Dosya tipi (csv, excel, json)
+            chunk_rows (Optional[int]): Parça başına satır sayısı
+            chunk_bytes (Optional[int]): Parça başına yaklaşık bellek bütçesi
+            
+        Returns:
+            DataChunks: Veri parçaları
+        """
+        if file_type not in ('csv', 'excel', 'json'):
+            raise ValueError(f"Desteklenmeyen dosya tipi: {file_type}")
+            
+        if chunk_rows is None:
+            chunk_rows = self._rows_for_budget(file_path, file_type, chunk_bytes)
+        chunk_rows = max(1, int(chunk_rows))
+        
+        if file_type == 'csv':
+            def factory() -> Iterator[pd.DataFrame]:
+                with pd.read_csv(file_path, chunksize=chunk_rows) as reader:
+                    yield from reader
+        else:
+            self.logger.warning(
+                f"{file_type} dosyaları akış olarak okunamıyor, dosya tamamen okunup parçalanacak"
+            )
+            
+            def factory() -> Iterator[pd.DataFrame]:
+                data = pd.read_excel(file_path) if file_type == 'excel' else pd.read_json(file_path)
+                for start in range(0, len(data), chunk_rows):
+                    yield data.iloc[start:start + chunk_rows]
+                    
+        self.logger.info(f"Veri akış modunda açıldı: {file_path} (parça başına {chunk_rows} satır)")
+        return DataChunks(factory)
+        
+    def _rows_for_budget(self, file_path: str, file_type: str, chunk_bytes: int, sample_rows: int = 1000) -> int:
+        """
+        Bellek bütçesini örnek satırların boyutuna göre satır sayısına çevirir
+        
+        Args:
+            file_path (str): Dosya yolu
+            file_type (str): Dosya tipi
+            chunk_bytes (int): Parça başına bellek bütçesi
+            sample_rows (int): Satır boyutunu tahmin etmek için okunacak satır sayısı
+            
+        Returns:
+            int: Parça başına satır sayısı
+        """
+        if file_type == 'csv':
+            sample = pd.read_csv(file_path, nrows=sample_rows)
+        elif file_type == 'excel':
+            sample = pd.read_excel(file_path, nrows=sample_rows)
+        else:
+            sample = pd.read_json(file_path).head(sample_rows)
+            
+        if sample.empty:
+            return sample_rows
+        bytes_per_row = sample.memory_usage(index=True, deep=True).sum() / len(sample)
+        return max(1, int(chunk_bytes // max(bytes_per_row, 1)))
+        
+    def fit_statistics(self, data: Union[pd.DataFrame, DataChunks, Iterable[pd.DataFrame]]) -> OnlineStatistics:
+        """
+        Sayısal sütunlar için birleştirilebilir çevrimiçi istatistikleri hesaplar
+        
+        Veri çerçevesi, DataChunks kaynağı veya herhangi bir parça dizisi
+        (ör. bir işçiye düşen bölümler) kabul edilir. Farklı işçilerde hesaplanan
+        sonuçlar OnlineStatistics.merge ile birleştirilebilir.
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks, Iterable[pd.DataFrame]]): Veri veya veri parçaları
+            
+        Returns:
+            OnlineStatistics: Sütun istatistikleri
+        """
+        if isinstance(data, pd.DataFrame):
+            return OnlineStatistics().update(data)
+        return OnlineStatistics().fit(data)
+        
+    def fit_quantile_sketches(
+        self,
+        data: Union[pd.DataFrame, DataChunks, Iterable[pd.DataFrame]],
+        error: float = 0.01
+    ) -> ColumnSketches:
+        """
+        Sayısal sütunlar için birleştirilebilir yaklaşık kantil özetleri hesaplar
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks, Iterable[pd.DataFrame]]): Veri veya veri parçaları
+            error (float): Hedeflenen normalize sıra hatası
+            
+        Returns:
+            ColumnSketches: Sütun kantil özetleri
+        """
+        if isinstance(data, pd.DataFrame):
+            return ColumnSketches(error).update(data)
+        return ColumnSketches(error).fit(data)
+        
+    @staticmethod
+    def _iqr_outliers(data: pd.DataFrame, bounds: Dict[str, pd.Series]) -> pd.DataFrame:
+        """
+        IQR sınırları dışında kalan hücreleri işaretler
+        
+        Args:
+            data (pd.DataFrame): Veri
+            bounds (Dict[str, pd.Series]): ColumnSketches.iqr_bounds çıktısı
+            
+        Returns:
+            pd.DataFrame: Aykırı hücreler için True içeren maske
+        """
+        numeric = data[bounds['lower'].index]
+        return (numeric < bounds['lower']) | (numeric > bounds['upper'])
+        
+    def clean_data(
+        self,
+        data: Union[pd.DataFrame, DataChunks],
+        config: Dict[str, Any]
+    ) -> Union[pd.DataFrame, DataChunks]:
         """
         Veriyi temizler
         
         Args:
-            data (pd.DataFrame): Temizlenecek veri
+            data (Union[pd.DataFrame, DataChunks]): Temizlenecek veri veya veri parçaları
             config (Dict[str, Any]): Temizleme ayarları
-            
+                ('engine': 'pandas' veya 'fused', 'inplace': fused motorda yerinde doldurma)
+                
         Returns:
-            pd.DataFrame: Temizlenmiş veri
+            Union[pd.DataFrame, DataChunks]: Temizlenmiş veri veya tembel temizlenmiş parçalar
         """
         try:
+            if isinstance(data, DataChunks):
+                return self._clean_chunks(data, config)
+                
+            if config.get('engine', 'pandas') == 'fused':
+                data = self._clean_fused(data, config, inplace=config.get('inplace', False))
+                data = self._encode_categorical(data, config)
+                self.logger.info("Veri başarıyla temizlendi")
+                return data
+                
             # Eksik değerleri işle
             if 'missing_values' in config:
                 strategy = config['missing_values'].get('strategy', 'mean')
@@ -88,6 +341,12 @@ class DataOperations:
                 if method == 'zscore':
                     z_scores = np.abs((data - data.mean()) / data.std())
                     data = data[(z_scores < threshold).all(axis=1)]
+                elif method == 'iqr' and config['outliers'].get('quantiles', 'exact') == 'approx':
+                    # Sıralama yerine birleştirilebilir KLL özetleriyle yaklaşık kantiller
+                    bounds = self.fit_quantile_sketches(
+                        data, config['outliers'].get('quantile_error', 0.01)
+                    ).iqr_bounds()
+                    data = data[~self._iqr_outliers(data, bounds).any(axis=1)]
                 elif method == 'iqr':
                     Q1 = data.quantile(0.25)
                     Q3 = data.quantile(0.75)
@@ -95,16 +354,8 @@ class DataOperations:
                     data = data[~((data < (Q1 - 1.5 * IQR)) | (data > (Q3 + 1.5 * IQR))).any(axis=1)]
                     
             # Kategorik değişkenleri dönüştür
-            if 'categorical' in config:
-                method = config['categorical'].get('method', 'onehot')
-                columns = config['categorical'].get('columns', [])
-                
-                if method == 'onehot':
-                    data = pd.get_dummies(data, columns=columns)
-                elif method == 'label':
-                    for col in columns:
-                        data[col] = data[col].astype('category').cat.codes
-                        
+            data = self._encode_categorical(data, config)
+            
             self.logger.info("Veri başarıyla temizlendi")
             return data
             
@@ -112,25 +363,194 @@ class DataOperations:
             self.logger.error(f"Veri temizleme hatası: {e}")
             return data
             
-    def normalize_data(self, data: pd.DataFrame, method: str = 'minmax') -> pd.DataFrame:
+    def _encode_categorical(self, data: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Kategorik değişkenleri dönüştürür
+        
+        Args:
+            data (pd.DataFrame): Dönüştürülecek veri
+            config (Dict[str, Any]): Temizleme ayarları
+            
+        Returns:
+            pd.DataFrame: Dönüştürülmüş veri
+        """
+        if 'categorical' in config:
+            method = config['categorical'].get('method', 'onehot')
+            columns = config['categorical'].get('columns', [])
+            
+            if method == 'onehot':
+                data = pd.get_dummies(data, columns=columns)
+            elif method == 'label':
+                for col in columns:
+                    data[col] = data[col].astype('category').cat.codes
+                    
+        return data
+        
+    def _clean_fused(self, data: pd.DataFrame, config: Dict[str, Any], inplace: bool = False) -> pd.DataFrame:
+        """
+        Eksik değer ve aykırı değer adımlarını tek istatistik geçişinde uygular
+        
+        Her sayısal sütun için gözlenen değerlerin sayısı, ortalaması ve kare
+        sapma toplamı bir kez hesaplanır. Doldurma sonrası z-skor istatistikleri
+        bu momentlerden analitik olarak türetilir; böylece tam boyutlu ara
+        tablolar yerine yalnızca sütun boyutunda geçici diziler ve tek bir satır
+        maskesi kullanılır. Sayısal olmayan sütunlar yalnızca 'mode' ve 'drop'
+        stratejilerinden etkilenir.
+        
+        Args:
+            data (pd.DataFrame): Temizlenecek veri
+            config (Dict[str, Any]): Temizleme ayarları
+            inplace (bool): Eksik değerleri verilen tabloda yerinde doldur
+            
+        Returns:
+            pd.DataFrame: Temizlenmiş veri
+        """
+        strategy = config['missing_values'].get('strategy', 'mean') if 'missing_values' in config else None
+        method = config['outliers'].get('method', 'zscore') if 'outliers' in config else None
+        threshold = config['outliers'].get('threshold', 3) if 'outliers' in config else None
+        
+        if strategy not in (None, 'mean', 'median', 'mode', 'drop'):
+            raise ValueError(f"Desteklenmeyen eksik değer stratejisi: {strategy}")
+        if method not in (None, 'zscore', 'iqr'):
+            raise ValueError(f"Desteklenmeyen aykırı değer metodu: {method}")
+            
+        # rows: eksik değer adımından sonra kalan satırlar, keep: bu satırlardan aykırı olmayanlar
+        rows = np.ones(len(data), dtype=bool)
+        if strategy == 'drop':
+            for i in range(data.shape[1]):
+                rows &= data.iloc[:, i].notna().to_numpy()
+        keep = np.ones(int(rows.sum()), dtype=bool)
+        
+        fills = {}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for i, dtype in enumerate(data.dtypes):
+                # Sütun görünümleri saklanmaz; aksi halde yerinde doldurma kopya tetikler
+                if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                    if strategy == 'mode' and data.iloc[:, i].hasnans:
+                        modes = data.iloc[:, i].mode()
+                        if len(modes):
+                            fills[i] = modes.iloc[0]
+                    continue
+                    
+                values = np.asarray(data.iloc[:, i], dtype=np.float64)
+                if strategy == 'drop':
+                    values = values[rows]
+                nan_mask = np.isnan(values)
+                n_missing = int(nan_mask.sum())
+                observed = values[~nan_mask] if n_missing else values
+                
+                # Tek geçişte gözlenen değerlerin momentleri
+                n_obs = len(observed)
+                mean = observed.mean() if n_obs else np.nan
+                m2 = np.dot(observed - mean, observed - mean) if n_obs else np.nan
+                
+                fill = np.nan
+                if n_missing and strategy in ('mean', 'median', 'mode') and n_obs:
+                    if strategy == 'mean':
+                        fill = mean
+                    elif strategy == 'median':
+                        fill = np.median(observed)
+                    else:
+                        uniques, counts = np.unique(observed, return_counts=True)
+                        fill = uniques[np.argmax(counts)]
+                    fills[i] = fill
+                    
+                if method is None:
+                    continue
+                    
+                # Doldurma sonrası momentler: eksik hücreler 'fill' değerini alır
+                filled_n = n_obs + (n_missing if not np.isnan(fill) else 0)
+                if filled_n == n_obs:
+                    filled_mean, filled_m2 = mean, m2
+                else:
+                    filled_mean = (n_obs * mean + n_missing * fill) / filled_n
+                    filled_m2 = (m2 + n_obs * (mean - filled_mean) ** 2
+                                 + n_missing * (fill - filled_mean) ** 2)
+                                 
+                if method == 'zscore':
+                    std = np.sqrt(filled_m2 / (filled_n - 1)) if filled_n > 1 else np.nan
+                    column_ok = np.abs(values - filled_mean) / std < threshold
+                    if not np.isnan(fill) and abs(fill - filled_mean) / std < threshold:
+                        column_ok |= nan_mask
+                else:
+                    sample = np.where(nan_mask, fill, values) if n_missing else values
+                    q1, q3 = np.nanquantile(sample, [0.25, 0.75]) if filled_n else (np.nan, np.nan)
+                    iqr = q3 - q1
+                    column_ok = ~((sample < q1 - 1.5 * iqr) | (sample > q3 + 1.5 * iqr))
+                    
+                keep &= column_ok
+                
+        # Eksik değerleri doldur: yalnızca değişen sütunlar için bellek ayrılır
+        if fills:
+            if inplace:
+                data.fillna({data.columns[i]: value for i, value in fills.items()}, inplace=True)
+                self.stats_cache.forget(data)
+            else:
+                data = data.copy(deep=False)
+                for i, value in fills.items():
+                    data.isetitem(i, data.iloc[:, i].fillna(value))
+                    
+        rows[rows] = keep
+        if not rows.all():
+            data = data[rows]
+            
+        return data
+        
+    def _clean_chunks(self, chunks: DataChunks, config: Dict[str, Any]) -> DataChunks:
+        """
+        Veri parçalarını temizler
+        
+        Her adım bir uydurulmuş dönüştürücüdür: önceki adımların çıktısı üzerinde
+        bir istatistik geçişi yapar ve ardından parçalara tembel bir dönüşüm ekler.
+        
+        Args:
+            chunks (DataChunks): Temizlenecek veri parçaları
+            config (Dict[str, Any]): Temizleme ayarları
+            
+        Returns:
+            DataChunks: Temizlenmiş veri parçaları
+        """
+        chunks = TransformerPipeline.from_config(config).fit_transform(chunks)
+        
+        self.logger.info("Veri parçaları için temizleme adımları hazırlandı")
+        return chunks
+        
+    def normalize_data(
+        self,
+        data: Union[pd.DataFrame, DataChunks],
+        method: str = 'minmax',
+        stats: Optional[OnlineStatistics] = None
+    ) -> Union[pd.DataFrame, DataChunks]:
         """
         Veriyi normalize eder
         
+        stats verilirse önceden (ör. parçalar veya paralel işçiler üzerinde)
+        hesaplanmış istatistikler kullanılır ve veri yeniden taranmaz.
+        
         Args:
-            data (pd.DataFrame): Normalize edilecek veri
+            data (Union[pd.DataFrame, DataChunks]): Normalize edilecek veri veya veri parçaları
             method (str): Normalizasyon metodu (minmax, standard)
+            stats (Optional[OnlineStatistics]): Önceden hesaplanmış sütun istatistikleri
             
         Returns:
-            pd.DataFrame: Normalize edilmiş veri
+            Union[pd.DataFrame, DataChunks]: Normalize edilmiş veri veya tembel normalize edilmiş parçalar
         """
         try:
-            if method == 'minmax':
-                return (data - data.min()) / (data.max() - data.min())
-            elif method == 'standard':
-                return (data - data.mean()) / data.std()
-            else:
+            if method not in ('minmax', 'standard'):
                 raise ValueError(f"Desteklenmeyen normalizasyon metodu: {method}")
                 
+            if isinstance(data, DataChunks):
+                if stats is None:
+                    stats = self.fit_statistics(data)
+                return data.map(lambda chunk: stats.normalize(chunk, method))
+                
+            if stats is not None:
+                return stats.normalize(data, method)
+                
+            if method == 'minmax':
+                return (data - data.min()) / (data.max() - data.min())
+            return (data - data.mean()) / data.std()
+            
         except Exception as e:
             self.logger.error(f"Veri normalizasyon hatası: {e}")
             return data
@@ -142,7 +562,7 @@ class DataOperations:
         Args:
             data (pd.DataFrame): Kaydedilecek veri
             file_path (str): Kayıt yolu
-            file_type (str): Dosya tipi (csv, excel, json)
+            file_type (str): Dosya tipi (csv, excel, json, mmap)
             
         Returns:
             bool: İşlem başarılı ise True
@@ -154,6 +574,8 @@ class DataOperations:
                 data.to_excel(file_path, index=False)
             elif file_type == 'json':
                 data.to_json(file_path, orient='records')
+            elif file_type == 'mmap':
+                MmapDataset.write(data, file_path)
             else:
                 raise ValueError(f"Desteklenmeyen dosya tipi: {file_type}")
                 
@@ -179,10 +601,15 @@ class DataOperations:
                 'shape': data.shape,
                 'columns': list(data.columns),
                 'dtypes': data.dtypes.to_dict(),
-                'missing_values': data.isnull().sum().to_dict(),
-                'descriptive_stats': data.describe().to_dict()
+                'missing_values': self.stats_cache.missing(data).to_dict(),
+                'descriptive_stats': self.stats_cache.describe(data).to_dict(),
+                'memory_usage': data.memory_usage(index=False, deep=True).to_dict(),
+                'total_memory_bytes': int(data.memory_usage(index=True, deep=True).sum())
             }
             
+            if self._optimized_frame is not None and self._optimized_frame() is data:
+                info['memory_optimization'] = self.memory_optimization
+                
             self.logger.info("Veri bilgileri başarıyla oluşturuldu")
             return info
             
@@ -0,0 +1,381 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, List, Optional
+import logging
+from pathlib import Path
+from sklearn.cluster import KMeans
+from sklearn.metrics import pairwise_distances_argmin_min
+from .online_stats import OnlineStatistics
+from .quantile_sketch import ColumnSketches
+from .transformers import FittedTransformer, TransformerPipeline
+from .result_store import ResultStore
+
+class CovarianceAccumulator:
+    """
+    Parçalar üzerinde güncellenebilen ve birleştirilebilen kovaryans matrisi.
+    
+    Satır sayısı, ortalama vektörü ve ortak moment matrisi Chan formülüyle
+    biriktirilir. Yalnızca tüm sütunları dolu satırlar kullanılır.
+    """
+    
+    def __init__(self, columns: Optional[List[str]] = None):
+        """
+        CovarianceAccumulator sınıfı başlatıcısı
+        
+        Args:
+            columns (Optional[List[str]]): İzlenecek sütunlar (None ise ilk parçanın sayısal sütunları)
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.count = 0
+        self.mean: Optional[np.ndarray] = None
+        self.comoment: Optional[np.ndarray] = None
+        if self.columns is not None:
+            self._reset()
+            
+    def _reset(self) -> None:
+        """Biriktiricileri sıfırlar"""
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+        
+    def update(self, chunk: pd.DataFrame) -> 'CovarianceAccumulator':
+        """
+        Kovaryansı yeni bir veri parçasıyla günceller
+        
+        Args:
+            chunk (pd.DataFrame): Veri parçası
+            
+        Returns:
+            CovarianceAccumulator: Güncellenmiş nesne
+        """
+        if self.columns is None:
+            self.columns = list(chunk.select_dtypes(include=[np.number]).columns)
+            self._reset()
+        values = chunk[self.columns].to_numpy(dtype=np.float64)
+        values = values[np.isfinite(values).all(axis=1)]
+        if len(values):
+            mean = values.mean(axis=0)
+            centered = values - mean
+            self._combine(len(values), mean, centered.T @ centered)
+        return self
+        
+    def merge(self, other: 'CovarianceAccumulator') -> 'CovarianceAccumulator':
+        """
+        Başka bir işçide hesaplanan kovaryansı birleştirir
+        
+        Args:
+            other (CovarianceAccumulator): Birleştirilecek kovaryans
+            
+        Returns:
+            CovarianceAccumulator: Güncellenmiş nesne
+        """
+        if other.columns is None or not other.count:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self._reset()
+        if list(other.columns) != self.columns:
+            raise ValueError("Birleştirilen kovaryansların sütunları aynı olmalıdır")
+        self._combine(other.count, other.mean, other.comoment)
+        return self
+        
+    def _combine(self, count: int, mean: np.ndarray, comoment: np.ndarray) -> None:
+        """Chan formülüyle kısmi ortak momentleri birleştirir"""
+        total = self.count + count
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * self.count * count / total
+        self.mean = self.mean + delta * count / total
+        self.count = total
+        
+    @property
+    def covariance(self) -> np.ndarray:
+        """Örneklem kovaryans matrisi (ddof=1)"""
+        if self.count < 2:
+            return np.full_like(self.comoment, np.nan)
+        return self.comoment / (self.count - 1)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Kovaryansı aktarılabilir sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Serileştirilmiş kovaryans
+        """
+        return {'columns': self.columns, 'count': self.count, 'mean': self.mean, 'comoment': self.comoment}
+        
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'CovarianceAccumulator':
+        """
+        Sözlükten kovaryans nesnesi oluşturur
+        
+        Args:
+            state (Dict[str, Any]): to_dict çıktısı
+            
+        Returns:
+            CovarianceAccumulator: Kovaryans nesnesi
+        """
+        accumulator = cls(state['columns'])
+        if state['columns'] is not None:
+            accumulator.count = int(state['count'])
+            accumulator.mean = np.asarray(state['mean'], dtype=np.float64)
+            accumulator.comoment = np.asarray(state['comoment'], dtype=np.float64)
+        return accumulator
+
+
+class IncrementalAnalysis:
+    """
+    Eklenen satırlarla güncellenebilen analiz durumu.
+    
+    Momentler, KLL kantil özetleri, kovaryans matrisi ve k-means merkezleri
+    birleştirilebilir biçimde saklanır. Yeni satırlar geldiğinde istatistikler,
+    korelasyon, PCA (standartlaştırılmış kovaryansın özdeğerleri) ve küme
+    merkezleri bu durumdan güncellenir; yeni satırların dağılımı eşikten fazla
+    kaymışsa durum baştan kurulmalıdır. Veri hazırlığında kullanılan uydurulmuş
+    dönüştürücüler de durumla birlikte saklanır.
+    """
+    
+    def __init__(
+        self,
+        n_clusters: int = 3,
+        n_components: int = 2,
+        quantile_error: float = 0.01,
+        drift_threshold: float = 0.25
+    ):
+        """
+        IncrementalAnalysis sınıfı başlatıcısı
+        
+        Args:
+            n_clusters (int): Küme sayısı
+            n_components (int): PCA bileşen sayısı
+            quantile_error (float): Kantil özetleri için hedeflenen sıra hatası
+            drift_threshold (float): Baştan hesaplamayı gerektiren kayma eşiği
+        """
+        self.n_clusters = n_clusters
+        self.n_components = n_components
+        self.quantile_error = quantile_error
+        self.drift_threshold = drift_threshold
+        self.logger = logging.getLogger(__name__)
+        
+        self.stats = OnlineStatistics()
+        self.sketches = ColumnSketches(quantile_error)
+        self.covariance = CovarianceAccumulator()
+        self.centers: Optional[np.ndarray] = None
+        self.cluster_counts: Optional[np.ndarray] = None
+        self.inertia = 0.0
+        self.transformers: Optional[TransformerPipeline] = None
+        self.n_rows = 0
+        
+    def _scaling(self) -> tuple:
+        """StandardScaler ile aynı ortalama ve ölçeği (ddof=0) döndürür"""
+        count = self.stats.count.to_numpy()
+        mean = self.stats.mean.to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.sqrt(self.stats.var.to_numpy() * (count - 1) / count)
+        scale[~(scale > 0)] = 1.0
+        return mean, scale
+        
+    def fit(self, data: pd.DataFrame) -> 'IncrementalAnalysis':
+        """
+        Durumu hazırlanmış verinin tamamından baştan kurar
+        
+        Args:
+            data (pd.DataFrame): Temizlenmiş ve normalize edilmiş veri
+            
+        Returns:
+            IncrementalAnalysis: Kurulan durum
+        """
+        numeric = data.select_dtypes(include=[np.number])
+        self.stats = OnlineStatistics().update(numeric)
+        self.sketches = ColumnSketches(self.quantile_error).update(numeric)
+        self.covariance = CovarianceAccumulator().update(numeric)
+        
+        mean, scale = self._scaling()
+        model = KMeans(n_clusters=self.n_clusters, random_state=42)
+        labels = model.fit_predict((numeric.to_numpy(dtype=np.float64) - mean) / scale)
+        self.centers = model.cluster_centers_ * scale + mean
+        self.cluster_counts = np.bincount(labels, minlength=self.n_clusters).astype(np.float64)
+        self.inertia = float(model.inertia_)
+        
+        self.logger.info(f"Artımlı analiz durumu baştan kuruldu: {len(numeric)} satır")
+        return self
+        
+    def drift(self, data: pd.DataFrame) -> float:
+        """
+        Yeni satırların mevcut duruma göre kaymasını ölçer
+        
+        Sütun başına ortalama kayması (mevcut standart sapma biriminde) ve
+        standart sapma oranının logaritmasının en büyüğü döndürülür.
+        
+        Args:
+            data (pd.DataFrame): Hazırlanmış yeni satırlar
+            
+        Returns:
+            float: Kayma skoru
+        """
+        new = OnlineStatistics(self.stats.columns).update(data)
+        old_std = self.stats.std.to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shift = np.abs(new.mean.to_numpy() - self.stats.mean.to_numpy()) / old_std
+            spread = np.abs(np.log(new.std.to_numpy() / old_std))
+        scores = np.concatenate([shift, spread])
+        scores = scores[~np.isnan(scores)]
+        return float(scores.max()) if len(scores) else 0.0
+        
+    def update(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Durumu yeni satırlarla günceller
+        
+        Merkezler ham uzayda tutulur; yeni satırlar güncel ölçekle en yakın
+        merkeze atanır ve merkezler ağırlıklı ortalamayla güncellenir.
+        
+        Args:
+            data (pd.DataFrame): Hazırlanmış yeni satırlar
+            
+        Returns:
+            np.ndarray: Yeni satırların küme etiketleri
+        """
+        numeric = data[self.stats.columns]
+        self.stats.update(numeric)
+        self.sketches.update(numeric)
+        self.covariance.update(numeric)
+        
+        values = numeric.to_numpy(dtype=np.float64)
+        if not len(values):
+            return np.empty(0, dtype=np.int64)
+        mean, scale = self._scaling()
+        labels, distances = pairwise_distances_argmin_min((values - mean) / scale, (self.centers - mean) / scale)
+        self.inertia += float((distances ** 2).sum())
+        
+        sums = np.zeros_like(self.centers)
+        np.add.at(sums, labels, values)
+        added = np.bincount(labels, minlength=len(self.centers)).astype(np.float64)
+        total = self.cluster_counts + added
+        moved = total > 0
+        self.centers[moved] = (self.centers[moved] * self.cluster_counts[moved, None] + sums[moved]) / total[moved, None]
+        self.cluster_counts = total
+        return labels
+        
+    def results(self) -> Dict[str, Any]:
+        """
+        Durumdan analiz, kümeleme ve PCA sonuçlarını üretir
+        
+        Returns:
+            Dict[str, Any]: Sonuçlar
+        """
+        columns = self.stats.columns
+        stats = pd.DataFrame(
+            {
+                'count': self.stats.count,
+                'mean': self.stats.mean,
+                'std': self.stats.std,
+                'min': self.stats.min,
+                '25%': self.sketches.quantile(0.25),
+                '50%': self.sketches.quantile(0.5),
+                '75%': self.sketches.quantile(0.75),
+                'max': self.stats.max
+            },
+            index=columns
+        ).T
+        
+        covariance = self.covariance.covariance
+        n = self.covariance.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            std = np.sqrt(np.diag(covariance))
+            corr = covariance / np.outer(std, std)
+            # StandardScaler (ddof=0) ile ölçeklenmiş verinin kovaryansı
+            scaled = covariance / np.outer(std, std) * n / (n - 1) if n > 1 else corr
+        scaled = np.nan_to_num(scaled)
+        eigenvalues, eigenvectors = np.linalg.eigh(scaled)
+        order = np.argsort(eigenvalues)[::-1][:self.n_components]
+        eigenvectors = eigenvectors[:, order]
+        eigenvectors *= np.where(eigenvectors[np.abs(eigenvectors).argmax(axis=0), range(len(order))] < 0, -1.0, 1.0)
+        
+        mean, scale = self._scaling()
+        return {
+            'analysis': {
+                'statistics': stats.to_dict(),
+                'correlation': pd.DataFrame(corr, index=columns, columns=columns).to_dict()
+            },
+            'clustering': {
+                'n_clusters': int((self.cluster_counts > 0).sum()),
+                'method': 'kmeans',
+                'centers': ((self.centers - mean) / scale).tolist(),
+                'cluster_sizes': self.cluster_counts.astype(int).tolist(),
+                # Her satırın atandığı andaki mesafeleriyle biriktirilen yaklaşık değer
+                'inertia': self.inertia
+            },
+            'pca': {
+                'explained_variance': eigenvalues[order].tolist(),
+                'explained_variance_ratio': (eigenvalues[order] / eigenvalues.sum()).tolist(),
+                'loadings': eigenvectors.T.tolist()
+            }
+        }
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Durumu aktarılabilir sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Serileştirilmiş durum
+        """
+        return {
+            'n_clusters': self.n_clusters,
+            'n_components': self.n_components,
+            'quantile_error': self.quantile_error,
+            'drift_threshold': self.drift_threshold,
+            'n_rows': self.n_rows,
+            'stats': self.stats.to_dict(),
+            'sketches': self.sketches.to_dict(),
+            'covariance': self.covariance.to_dict(),
+            'centers': self.centers,
+            'cluster_counts': self.cluster_counts,
+            'inertia': self.inertia,
+            'transformers': self.transformers.to_dict() if self.transformers is not None else None
+        }
+        
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'IncrementalAnalysis':
+        """
+        Sözlükten durum oluşturur
+        
+        Args:
+            state (Dict[str, Any]): to_dict çıktısı
+            
+        Returns:
+            IncrementalAnalysis: Durum
+        """
+        analysis = cls(state['n_clusters'], state['n_components'], state['quantile_error'], state['drift_threshold'])
+        analysis.n_rows = int(state['n_rows'])
+        analysis.stats = OnlineStatistics.from_dict(state['stats'])
+        analysis.sketches = ColumnSketches.from_dict(state['sketches'])
+        analysis.covariance = CovarianceAccumulator.from_dict(state['covariance'])
+        analysis.centers = np.asarray(state['centers'], dtype=np.float64)
+        analysis.cluster_counts = np.asarray(state['cluster_counts'], dtype=np.float64)
+        analysis.inertia = float(state['inertia'])
+        if state['transformers'] is not None:
+            analysis.transformers = FittedTransformer.from_dict(state['transformers'])
+        return analysis
+        
+    def save(self, path: str) -> None:
+        """
+        Durumu JSON manifest ve ikili yan dosya olarak kaydeder
+        
+        Args:
+            path (str): Manifest dosyası yolu
+        """
+        ResultStore().save(self.to_dict(), path)
+        
+    @classmethod
+    def load(cls, path: str) -> Optional['IncrementalAnalysis']:
+        """
+        Kaydedilmiş durumu okur
+        
+        Args:
+            path (str): Manifest dosyası yolu
+            
+        Returns:
+            Optional[IncrementalAnalysis]: Durum, dosya yoksa None
+        """
+        if not Path(path).exists():
+            return None
+        return cls.from_dict(ResultStore.load(path, lazy=False))
@@ -0,0 +1,142 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any, Optional, Union
+import logging
+from pathlib import Path
+import json
+import os
+import struct
+
+class MmapDataset:
+    """
+    Bellek eşlemeli sayısal veri seti.
+    
+    Dosya, sabit boyutlu bir önek, JSON başlık ve ardından art arda yazılmış
+    sütun dizilerinden oluşur. Sütunlar bitişik olduğundan veri bölümü tek
+    bir Fortran sıralı matris olarak kopyasız açılabilir. Dosyayı açan tüm
+    süreçler işletim sisteminin sayfa önbelleğindeki aynı sayfaları paylaşır.
+    """
+    
+    MAGIC = b'PYSMMAP1'
+    PREFIX = struct.Struct('<8sQ')
+    ALIGNMENT = 64
+    
+    def __init__(self, path: str):
+        """
+        Veri setini salt okunur olarak açar
+        
+        Args:
+            path (str): Veri seti dosyası
+        """
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+        
+        with open(self.path, 'rb') as f:
+            magic, header_size = self.PREFIX.unpack(f.read(self.PREFIX.size))
+            if magic != self.MAGIC:
+                raise ValueError(f"Geçersiz bellek eşlemeli veri seti: {path}")
+            header = json.loads(f.read(header_size).decode('utf-8'))
+            
+        self.columns: List[str] = header['columns']
+        self.n_rows: int = header['n_rows']
+        self.dtype = np.dtype(header['dtype'])
+        self.offset: int = header['offset']
+        
+        if self.n_rows and self.columns:
+            self._values = np.memmap(
+                self.path, dtype=self.dtype, mode='r', offset=self.offset,
+                shape=(self.n_rows, len(self.columns)), order='F'
+            )
+        else:
+            self._values = np.empty((self.n_rows, len(self.columns)), dtype=self.dtype, order='F')
+            
+    @property
+    def shape(self) -> tuple:
+        """Veri setinin boyutu (satır, sütun)"""
+        return (self.n_rows, len(self.columns))
+        
+    @property
+    def values(self) -> np.ndarray:
+        """Tüm sütunların kopyasız Fortran sıralı matris görünümü"""
+        return self._values
+        
+    def column(self, name: str) -> np.ndarray:
+        """
+        Tek bir sütunun kopyasız görünümünü döndürür
+        
+        Args:
+            name (str): Sütun adı
+            
+        Returns:
+            np.ndarray: Bitişik sütun dizisi
+        """
+        return self._values[:, self.columns.index(name)]
+        
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Veri setini kopyasız bir DataFrame olarak döndürür
+        
+        Returns:
+            pd.DataFrame: Bellek eşlemeli verinin üzerine kurulu veri çerçevesi
+        """
+        return pd.DataFrame(self._values, columns=self.columns, copy=False)
+        
+    @classmethod
+    def write(
+        cls,
+        data: pd.DataFrame,
+        path: str,
+        dtype: Union[str, np.dtype] = 'float64'
+    ) -> 'MmapDataset':
+        """
+        Veri çerçevesinin sayısal sütunlarını veri seti dosyasına yazar
+        
+        Sütunlar tek tek yazılır; böylece yazma sırasında tüm matrisin ikinci
+        bir kopyası oluşturulmaz. Dosya önce geçici adla yazılıp sonra yerine
+        taşınır, böylece okuyucular yarım yazılmış dosya görmez.
+        
+        Args:
+            data (pd.DataFrame): Yazılacak veri
+            path (str): Veri seti dosyası
+            dtype (Union[str, np.dtype]): Sütunların saklanacağı sayısal tip
+            
+        Returns:
+            MmapDataset: Yazılan veri setinin açılmış hali
+        """
+        logger = logging.getLogger(__name__)
+        dtype = np.dtype(dtype)
+        numeric = data.select_dtypes(include=[np.number, 'bool'])
+        skipped = [col for col in data.columns if col not in numeric.columns]
+        if skipped:
+            logger.warning(f"Sayısal olmayan sütunlar veri setine yazılmadı: {skipped}")
+            
+        header = {
+            'columns': [str(col) for col in numeric.columns],
+            'n_rows': len(numeric),
+            'dtype': dtype.str,
+            'offset': 0
+        }
+        # Başlık boyutu offset değerine bağlı olduğundan hizalı offset iki adımda bulunur
+        encoded = json.dumps(header).encode('utf-8')
+        offset = cls.PREFIX.size + len(encoded) + 32
+        header['offset'] = offset + (-offset) % cls.ALIGNMENT
+        encoded = json.dumps(header).encode('utf-8')
+        encoded += b' ' * (header['offset'] - cls.PREFIX.size - len(encoded))
+        
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(cls.PREFIX.pack(cls.MAGIC, len(encoded)))
+                f.write(encoded)
+                for i in range(numeric.shape[1]):
+                    np.ascontiguousarray(numeric.iloc[:, i].to_numpy(dtype=dtype)).tofile(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+            
+        logger.info(f"Bellek eşlemeli veri seti yazıldı: {path} {numeric.shape}")
+        return cls(str(path))
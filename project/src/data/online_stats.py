@@ -0,0 +1,202 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any, Optional, Iterable
+
+class OnlineStatistics:
+    """
+    Parçalar üzerinde güncellenebilen ve birleştirilebilen sütun istatistikleri.
+    
+    Sayı, ortalama ve kare sapma toplamı Welford/Chan formülleriyle, en küçük
+    ve en büyük değerler ise doğrudan biriktirilir. Farklı işçilerde
+    hesaplanan istatistikler merge ile birleştirilebilir; sonuç tüm veri
+    üzerinde tek seferde hesaplanan değerlerle aynıdır.
+    """
+    
+    def __init__(self, columns: Optional[List[str]] = None):
+        """
+        OnlineStatistics sınıfı başlatıcısı
+        
+        Args:
+            columns (Optional[List[str]]): İzlenecek sütunlar (None ise ilk parçanın sayısal sütunları)
+        """
+        self.columns = list(columns) if columns is not None else None
+        self._count = None
+        self._mean = None
+        self._m2 = None
+        self._min = None
+        self._max = None
+        if self.columns is not None:
+            self._reset(len(self.columns))
+            
+    def _reset(self, n_columns: int) -> None:
+        """Biriktiricileri sıfırlar"""
+        self._count = np.zeros(n_columns)
+        self._mean = np.zeros(n_columns)
+        self._m2 = np.zeros(n_columns)
+        self._min = np.full(n_columns, np.inf)
+        self._max = np.full(n_columns, -np.inf)
+        
+    def update(self, chunk: pd.DataFrame) -> 'OnlineStatistics':
+        """
+        İstatistikleri yeni bir veri parçasıyla günceller
+        
+        Args:
+            chunk (pd.DataFrame): Veri parçası
+            
+        Returns:
+            OnlineStatistics: Güncellenmiş nesne
+        """
+        if self.columns is None:
+            self.columns = list(chunk.select_dtypes(include=[np.number]).columns)
+            self._reset(len(self.columns))
+            
+        values = chunk[self.columns].to_numpy(dtype=np.float64)
+        mask = ~np.isnan(values)
+        count = mask.sum(axis=0).astype(np.float64)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            total = np.where(mask, values, 0.0).sum(axis=0)
+            mean = np.where(count > 0, total / count, 0.0)
+            deviations = np.where(mask, values - mean, 0.0)
+            m2 = (deviations ** 2).sum(axis=0)
+            
+        self._combine(count, mean, m2,
+                      np.where(mask, values, np.inf).min(axis=0, initial=np.inf),
+                      np.where(mask, values, -np.inf).max(axis=0, initial=-np.inf))
+        return self
+        
+    def fit(self, chunks: Iterable[pd.DataFrame]) -> 'OnlineStatistics':
+        """
+        İstatistikleri bir parça dizisi üzerinde hesaplar
+        
+        Args:
+            chunks (Iterable[pd.DataFrame]): Veri parçaları
+            
+        Returns:
+            OnlineStatistics: Güncellenmiş nesne
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+        
+    def merge(self, other: 'OnlineStatistics') -> 'OnlineStatistics':
+        """
+        Başka bir işçide hesaplanan istatistikleri birleştirir
+        
+        Args:
+            other (OnlineStatistics): Birleştirilecek istatistikler
+            
+        Returns:
+            OnlineStatistics: Güncellenmiş nesne
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self._reset(len(self.columns))
+        if list(other.columns) != self.columns:
+            raise ValueError("Birleştirilen istatistiklerin sütunları aynı olmalıdır")
+            
+        self._combine(other._count, other._mean, other._m2, other._min, other._max)
+        return self
+        
+    def _combine(self, count, mean, m2, minimum, maximum) -> None:
+        """Chan formülüyle kısmi istatistikleri birleştirir"""
+        total = self._count + count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weight = np.where(total > 0, count / total, 0.0)
+        delta = mean - self._mean
+        self._mean = self._mean + delta * weight
+        self._m2 = self._m2 + m2 + delta ** 2 * self._count * weight
+        self._count = total
+        self._min = np.minimum(self._min, minimum)
+        self._max = np.maximum(self._max, maximum)
+        
+    def _series(self, values: np.ndarray, valid: np.ndarray) -> pd.Series:
+        """Geçerli olmayan değerleri NaN yaparak seri oluşturur"""
+        return pd.Series(np.where(valid, values, np.nan), index=self.columns)
+        
+    @property
+    def count(self) -> pd.Series:
+        """Sütun başına gözlem sayısı"""
+        return pd.Series(self._count, index=self.columns)
+        
+    @property
+    def mean(self) -> pd.Series:
+        """Sütun ortalamaları"""
+        return self._series(self._mean, self._count > 0)
+        
+    @property
+    def var(self) -> pd.Series:
+        """Örneklem varyansları (ddof=1)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._series(self._m2 / (self._count - 1), self._count > 1)
+            
+    @property
+    def std(self) -> pd.Series:
+        """Örneklem standart sapmaları (ddof=1)"""
+        return np.sqrt(self.var)
+        
+    @property
+    def min(self) -> pd.Series:
+        """Sütun en küçük değerleri"""
+        return self._series(self._min, self._count > 0)
+        
+    @property
+    def max(self) -> pd.Series:
+        """Sütun en büyük değerleri"""
+        return self._series(self._max, self._count > 0)
+        
+    def normalize(self, chunk: pd.DataFrame, method: str = 'minmax') -> pd.DataFrame:
+        """
+        Biriktirilen istatistiklerle bir veri parçasını normalize eder
+        
+        Args:
+            chunk (pd.DataFrame): Normalize edilecek veri parçası
+            method (str): Normalizasyon metodu (minmax, standard)
+            
+        Returns:
+            pd.DataFrame: Normalize edilmiş veri parçası
+        """
+        if method == 'minmax':
+            return (chunk - self.min) / (self.max - self.min)
+        elif method == 'standard':
+            return (chunk - self.mean) / self.std
+        else:
+            raise ValueError(f"Desteklenmeyen normalizasyon metodu: {method}")
+            
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        İstatistikleri işçiler arasında aktarılabilir sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Serileştirilmiş istatistikler
+        """
+        return {
+            'columns': self.columns,
+            'count': self._count.tolist() if self._count is not None else None,
+            'mean': self._mean.tolist() if self._mean is not None else None,
+            'm2': self._m2.tolist() if self._m2 is not None else None,
+            'min': self._min.tolist() if self._min is not None else None,
+            'max': self._max.tolist() if self._max is not None else None
+        }
+        
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'OnlineStatistics':
+        """
+        Sözlükten istatistik nesnesi oluşturur
+        
+        Args:
+            state (Dict[str, Any]): to_dict çıktısı
+            
+        Returns:
+            OnlineStatistics: İstatistik nesnesi
+        """
+        stats = cls(state['columns'])
+        if state['columns'] is not None:
+            stats._count = np.asarray(state['count'], dtype=np.float64)
+            stats._mean = np.asarray(state['mean'], dtype=np.float64)
+            stats._m2 = np.asarray(state['m2'], dtype=np.float64)
+            stats._min = np.asarray(state['min'], dtype=np.float64)
+            stats._max = np.asarray(state['max'], dtype=np.float64)
+        return stats
@@ -0,0 +1,304 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any, Optional, Iterable, Union
+import math
+
+class KLLSketch:
+    """
+    Birleştirilebilir yaklaşık kantil özeti (KLL).
+    
+    Değerler ağırlığı 2^h olan sıkıştırıcı seviyelerinde tutulur. Bir seviye
+    kapasitesini aştığında sıralanır ve elemanlarının yarısı rastgele bir
+    kaydırma ile bir üst seviyeye taşınır. Bellek kullanımı yaklaşık
+    O(k log(n/k)) ile sınırlıdır; sıra hatası yaklaşık 1.7 / k'dır.
+    """
+    
+    CAPACITY_DECAY = 2.0 / 3.0
+    
+    def __init__(self, error: float = 0.01, seed: Optional[int] = None):
+        """
+        KLLSketch sınıfı başlatıcısı
+        
+        Args:
+            error (float): Hedeflenen normalize sıra hatası (ör. 0.01 = %1)
+            seed (Optional[int]): Sıkıştırma için rastgele tohum
+        """
+        self.error = error
+        self.k = max(8, int(math.ceil(1.7 / error)))
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+        
+    def _capacity(self, level: int) -> int:
+        """Seviye kapasitesini döndürür"""
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * self.CAPACITY_DECAY ** depth)))
+        
+    def update(self, values: Union[np.ndarray, pd.Series]) -> 'KLLSketch':
+        """
+        Özeti yeni değerlerle günceller (NaN değerler yok sayılır)
+        
+        Args:
+            values (Union[np.ndarray, pd.Series]): Eklenecek değerler
+            
+        Returns:
+            KLLSketch: Güncellenmiş özet
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+            
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+        
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        Başka bir özetle birleştirir
+        
+        Args:
+            other (KLLSketch): Birleştirilecek özet
+            
+        Returns:
+            KLLSketch: Güncellenmiş özet
+        """
+        if not other.count:
+            return self
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+            
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+        
+    def _compress(self) -> None:
+        """Kapasitesini aşan seviyeleri sıkıştırır"""
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Tek sayıda eleman varsa biri bu seviyede kalır
+                kept, items = (items[:1], items[1:]) if len(items) % 2 else (items[:0], items)
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = kept
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+            
+    def quantile(self, q: Union[float, Iterable[float]]) -> Union[float, np.ndarray]:
+        """
+        Yaklaşık kantil değerlerini döndürür
+        
+        Args:
+            q (Union[float, Iterable[float]]): 0 ile 1 arasındaki kantil(ler)
+            
+        Returns:
+            Union[float, np.ndarray]: Kantil değer(ler)i
+        """
+        scalar = np.isscalar(q)
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if not self.count:
+            result = np.full(len(qs), np.nan)
+            return result[0] if scalar else result
+            
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        values, cumulative = values[order], np.cumsum(weights[order])
+        
+        positions = np.searchsorted(cumulative, qs * cumulative[-1], side='left')
+        result = values[np.minimum(positions, len(values) - 1)]
+        result = np.where(qs <= 0, self.min, np.where(qs >= 1, self.max, result))
+        return float(result[0]) if scalar else result
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Özeti işçiler arasında aktarılabilir sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Serileştirilmiş özet
+        """
+        return {
+            'error': self.error,
+            'count': self.count,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'levels': [items.tolist() for items in self.levels]
+        }
+        
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'KLLSketch':
+        """
+        Sözlükten özet oluşturur
+        
+        Args:
+            state (Dict[str, Any]): to_dict çıktısı
+            
+        Returns:
+            KLLSketch: Özet
+        """
+        sketch = cls(state['error'])
+        sketch.count = state['count']
+        if sketch.count:
+            sketch.min, sketch.max = state['min'], state['max']
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in state['levels']]
+        return sketch
+
+
+class ColumnSketches:
+    """
+    Veri çerçevesinin sayısal sütunları için KLL özetleri.
+    
+    Parçalar üzerinde güncellenebilir, paralel işçilerde hesaplanan özetler
+    merge ile birleştirilebilir.
+    """
+    
+    def __init__(self, error: float = 0.01, columns: Optional[List[str]] = None, seed: Optional[int] = 42):
+        """
+        ColumnSketches sınıfı başlatıcısı
+        
+        Args:
+            error (float): Hedeflenen normalize sıra hatası
+            columns (Optional[List[str]]): İzlenecek sütunlar (None ise ilk parçanın sayısal sütunları)
+            seed (Optional[int]): Rastgele tohum
+        """
+        self.error = error
+        self.seed = seed
+        self.columns = list(columns) if columns is not None else None
+        self.sketches: Dict[str, KLLSketch] = {}
+        if self.columns is not None:
+            self._init_sketches()
+            
+    def _init_sketches(self) -> None:
+        """Sütun özetlerini oluşturur"""
+        self.sketches = {
+            col: KLLSketch(self.error, None if self.seed is None else self.seed + i)
+            for i, col in enumerate(self.columns)
+        }
+        
+    def update(self, chunk: pd.DataFrame) -> 'ColumnSketches':
+        """
+        Özetleri bir veri parçasıyla günceller
+        
+        Args:
+            chunk (pd.DataFrame): Veri parçası
+            
+        Returns:
+            ColumnSketches: Güncellenmiş nesne
+        """
+        if self.columns is None:
+            self.columns = list(chunk.select_dtypes(include=[np.number]).columns)
+            self._init_sketches()
+        for col in self.columns:
+            values = chunk[col]
+            if not pd.api.types.is_numeric_dtype(values):
+                # Parçada tipi farklı çıkarılan sütun: sayı olmayan değerler NaN sayılır
+                values = pd.to_numeric(values, errors='coerce')
+            self.sketches[col].update(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        return self
+        
+    def fit(self, chunks: Iterable[pd.DataFrame]) -> 'ColumnSketches':
+        """
+        Özetleri bir parça dizisi üzerinde hesaplar
+        
+        Args:
+            chunks (Iterable[pd.DataFrame]): Veri parçaları
+            
+        Returns:
+            ColumnSketches: Güncellenmiş nesne
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+        
+    def merge(self, other: 'ColumnSketches') -> 'ColumnSketches':
+        """
+        Başka bir işçide hesaplanan özetleri birleştirir
+        
+        Args:
+            other (ColumnSketches): Birleştirilecek özetler
+            
+        Returns:
+            ColumnSketches: Güncellenmiş nesne
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self._init_sketches()
+        if list(other.columns) != self.columns:
+            raise ValueError("Birleştirilen özetlerin sütunları aynı olmalıdır")
+        for col in self.columns:
+            self.sketches[col].merge(other.sketches[col])
+        return self
+        
+    def quantile(self, q: float) -> pd.Series:
+        """
+        Her sütun için yaklaşık kantil değerini döndürür
+        
+        Args:
+            q (float): 0 ile 1 arasındaki kantil
+            
+        Returns:
+            pd.Series: Sütun başına kantil değerleri
+        """
+        return pd.Series(
+            {col: self.sketches[col].quantile(q) for col in self.columns},
+            index=self.columns,
+            dtype=np.float64
+        )
+        
+    def iqr_bounds(self, factor: float = 1.5) -> Dict[str, pd.Series]:
+        """
+        IQR aykırı değer sınırlarını hesaplar
+        
+        Args:
+            factor (float): IQR çarpanı
+            
+        Returns:
+            Dict[str, pd.Series]: 'lower' ve 'upper' sınırları
+        """
+        q1, q3 = self.quantile(0.25), self.quantile(0.75)
+        iqr = q3 - q1
+        return {'lower': q1 - factor * iqr, 'upper': q3 + factor * iqr}
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Özetleri aktarılabilir sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Serileştirilmiş özetler
+        """
+        return {
+            'error': self.error,
+            'columns': self.columns,
+            'sketches': {col: sketch.to_dict() for col, sketch in self.sketches.items()}
+        }
+        
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> 'ColumnSketches':
+        """
+        Sözlükten özetleri oluşturur
+        
+        Args:
+            state (Dict[str, Any]): to_dict çıktısı
+            
+        Returns:
+            ColumnSketches: Özetler
+        """
+        sketches = cls(state['error'])
+        sketches.columns = state['columns']
+        sketches.sketches = {col: KLLSketch.from_dict(s) for col, s in state['sketches'].items()}
+        return sketches
@@ -1,12 +1,112 @@
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
+from sklearn.linear_model import LinearRegression, Ridge, Lasso, lasso_path as sk_lasso_path
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Iterator, Tuple, List, Optional, Union
 import logging
 from pathlib import Path
 import joblib
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+from .data_chunks import DataChunks
+from .mmap_dataset import MmapDataset
+from .incremental import CovarianceAccumulator
+from .linear_predictor import LinearPredictor
+from .streaming_regression import StreamingRegression, _block_moments
+
+# İşçi süreç başına bir kez bağlanan paylaşımlı eğitim verisi
+_TRAINING_STATE = {}
+
+# Çapraz doğrulamada katlama momentlerinden kapalı formda çözülen eğitim metotları
+_MOMENT_METHODS = ('train_linear_regression', 'train_ridge_regression', 'train_streaming_regression')
+
+def _attach_array(spec: Tuple[str, Tuple[int, ...], str]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Paylaşımlı bellek bloğuna bağlanıp üzerindeki diziyi kopyasız döndürür"""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+def _init_training_worker(
+    x_spec: Tuple[str, Tuple[int, ...], str],
+    y_spec: Tuple[str, Tuple[int, ...], str],
+    columns: Optional[List[Any]]
+) -> None:
+    """İşçi sürecinde paylaşımlı eğitim matrislerine bağlanır"""
+    x_shm, X = _attach_array(x_spec)
+    y_shm, y = _attach_array(y_spec)
+    # Bellek blokları süreç boyunca açık kalmalıdır
+    _TRAINING_STATE['buffers'] = (x_shm, y_shm)
+    _TRAINING_STATE['X'] = pd.DataFrame(X, columns=columns, copy=False) if columns is not None else X
+    _TRAINING_STATE['y'] = y
+    _TRAINING_STATE['regression'] = RegressionAnalysis()
+
+def _timed_training(regression: 'RegressionAnalysis', method: str, X: Any, y: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Bir eğitim metodunu çalıştırıp süresini ölçer"""
+    start = time.perf_counter()
+    model, metrics = getattr(regression, method)(X, y, **params)
+    return {'model': model, 'metrics': metrics, 'seconds': time.perf_counter() - start}
+
+def _train_worker(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """İşçideki paylaşımlı veri üzerinde bir model eğitir"""
+    return _timed_training(_TRAINING_STATE['regression'], method, _TRAINING_STATE['X'], _TRAINING_STATE['y'], params)
+
+def _take_rows(data: Any, positions: np.ndarray) -> Any:
+    """Konumlardaki satırları seçer"""
+    return data.iloc[positions] if isinstance(data, (pd.DataFrame, pd.Series)) else data[positions]
+
+def _fold_scores(
+    regression: 'RegressionAnalysis',
+    method: str,
+    X: Any,
+    y: Any,
+    params: Dict[str, Any],
+    test_index: np.ndarray
+) -> Dict[str, float]:
+    """Modeli katlama dışındaki satırlarda eğitip katlamada değerlendirir"""
+    train_mask = np.ones(len(X), dtype=bool)
+    train_mask[test_index] = False
+    train_index = np.flatnonzero(train_mask)
+    model, _ = getattr(regression, method)(_take_rows(X, train_index), _take_rows(y, train_index), **params)
+    metrics = regression.evaluate_model(model, _take_rows(X, test_index), _take_rows(y, test_index))
+    return {name: float(value) for name, value in metrics.items()}
+
+def _fold_worker(method: str, params: Dict[str, Any], test_index: np.ndarray) -> Dict[str, float]:
+    """İşçideki paylaşımlı veri üzerinde bir katlamayı eğitip değerlendirir"""
+    return _fold_scores(_TRAINING_STATE['regression'], method, _TRAINING_STATE['X'], _TRAINING_STATE['y'], params, test_index)
+
+@contextmanager
+def _shared_training_pool(
+    X_train: Union[pd.DataFrame, np.ndarray],
+    y_train: Union[pd.Series, np.ndarray],
+    max_workers: int
+) -> Iterator[ProcessPoolExecutor]:
+    """Eğitim matrislerini paylaşımlı belleğe bir kez kopyalayıp onlara bağlı bir işçi havuzu açar"""
+    columns = list(X_train.columns) if isinstance(X_train, pd.DataFrame) else None
+    X = X_train.to_numpy() if isinstance(X_train, pd.DataFrame) else np.asarray(X_train)
+    y = np.asarray(y_train)
+    buffers = []
+    try:
+        specs = []
+        for array in (X, y):
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            buffers.append(shm)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            specs.append((shm.name, array.shape, array.dtype.str))
+        del X, y
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_training_worker,
+            initargs=(specs[0], specs[1], columns)
+        ) as executor:
+            yield executor
+    finally:
+        for shm in buffers:
+            shm.close()
+            shm.unlink()
 
 class RegressionAnalysis:
     """
@@ -34,7 +134,7 @@ class RegressionAnalysis:
         
     def prepare_data(
         self,
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, MmapDataset],
         target_column: str,
         test_size: float = 0.2,
         random_state: int = 42
@@ -43,7 +143,7 @@ class RegressionAnalysis:
         Veriyi eğitim ve test setlerine ayırır
         
         Args:
-            data (pd.DataFrame): Veri seti
+            data (Union[pd.DataFrame, MmapDataset]): Veri seti (bellek eşlemeli veri seti kopyasız açılır)
             target_column (str): Hedef değişken adı
             test_size (float): Test seti oranı
             random_state (int): Rastgele durum
@@ -52,6 +152,9 @@ class RegressionAnalysis:
             Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Eğitim ve test setleri
         """
         try:
+            if isinstance(data, MmapDataset):
+                data = data.to_frame()
+                
             X = data.drop(columns=[target_column])
             y = data[target_column]
             
@@ -166,6 +269,475 @@ class RegressionAnalysis:
             self.logger.error(f"Lasso regresyon eğitim hatası: {e}")
             raise
             
+    def train_streaming_regression(
+        self,
+        X_train: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray],
+        y_train: Optional[np.ndarray] = None,
+        alpha: float = 0.0,
+        target_column: Optional[str] = None,
+        n_jobs: int = 1,
+        block_rows: int = 65536
+    ) -> Tuple[Union[LinearRegression, Ridge], Dict[str, Any]]:
+        """
+        Doğrusal (alpha=0) veya ridge regresyonu XᵀX ve Xᵀy toplamlarıyla tek geçişte eğitir
+        
+        Veri belleğe sığmak zorunda değildir: veri parçaları veya bellek
+        eşlemeli veri seti bloklar halinde okunur, yalnızca özellik sayısının
+        karesi kadar bellek kullanılır.
+        
+        Args:
+            X_train (Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]): Eğitim verisi (y_train yoksa hedef sütunu dahil)
+            y_train (Optional[np.ndarray]): Eğitim hedefi
+            alpha (float): Ridge regularizasyon parametresi (0 ise doğrusal regresyon)
+            target_column (Optional[str]): Hedef sütunu (y_train verilmediğinde)
+            n_jobs (int): Paralel süreç sayısı
+            block_rows (int): Bellekteki veri için blok satır sayısı
+            
+        Returns:
+            Tuple[Union[LinearRegression, Ridge], Dict[str, Any]]: Model ve metrikler
+        """
+        try:
+            trainer = StreamingRegression(target_column=target_column, n_jobs=n_jobs, block_rows=block_rows)
+            model, metrics = trainer.fit(X_train, y_train, alpha=alpha)
+            
+            self.logger.info(f"Akışlı {'ridge' if alpha > 0 else 'doğrusal'} regresyon modeli başarıyla eğitildi")
+            return model, metrics
+            
+        except Exception as e:
+            self.logger.error(f"Akışlı regresyon eğitim hatası: {e}")
+            raise
+            
+    def train_models(
+        self,
+        X_train: Union[pd.DataFrame, np.ndarray],
+        y_train: Union[pd.Series, np.ndarray],
+        models: Dict[str, Tuple[str, Dict[str, Any]]],
+        n_jobs: int = 1
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Birden fazla modeli aynı eğitim verisi üzerinde eğitir
+        
+        n_jobs > 1 ise eğitim matrisleri bir kez paylaşımlı belleğe kopyalanır
+        ve modeller bir süreç havuzunda eşzamanlı eğitilir; işçiler veriyi
+        kopyalamadan aynı bellek üzerinden okur. Modeller seri modla aynı
+        veri tipi ve sütun adlarıyla eğitildiğinden sonuçlar aynıdır.
+        
+        Args:
+            X_train (Union[pd.DataFrame, np.ndarray]): Eğitim verisi
+            y_train (Union[pd.Series, np.ndarray]): Eğitim hedefi
+            models (Dict[str, Tuple[str, Dict[str, Any]]]): Model adı -> (eğitim metodu adı, ek parametreler)
+            n_jobs (int): Eşzamanlı eğitilecek en fazla model sayısı
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Model adı -> {'model', 'metrics', 'seconds'}
+        """
+        self._check_methods(models)
+        start = time.perf_counter()
+        if n_jobs <= 1 or len(models) <= 1:
+            trained = {name: _timed_training(self, method, X_train, y_train, params) for name, (method, params) in models.items()}
+        else:
+            with _shared_training_pool(X_train, y_train, min(n_jobs, len(models))) as executor:
+                futures = {
+                    name: executor.submit(_train_worker, method, params)
+                    for name, (method, params) in models.items()
+                }
+                trained = {name: future.result() for name, future in futures.items()}
+                
+        timings = ', '.join(f"{name} {fit['seconds']:.2f} s" for name, fit in trained.items())
+        self.logger.info(f"{len(trained)} model {time.perf_counter() - start:.2f} s içinde eğitildi ({timings})")
+        return trained
+        
+    def _check_methods(self, models: Dict[str, Tuple[str, Dict[str, Any]]]) -> None:
+        """Model tablosundaki eğitim metotlarını doğrular"""
+        for method, _ in models.values():
+            if not method.startswith('train_') or not hasattr(self, method):
+                raise ValueError(f"Desteklenmeyen eğitim metodu: {method}")
+                
+    @staticmethod
+    def fold_indices(
+        n_samples: int,
+        n_splits: int = 5,
+        n_repeats: int = 1,
+        random_state: int = 42
+    ) -> List[List[np.ndarray]]:
+        """
+        Tekrarlı k-katlı çapraz doğrulama için katlama konumlarını üretir
+        
+        Her tekrarda satır konumları karıştırılıp n_splits parçaya bölünür;
+        her satır tekrar başına tam olarak bir katlamada test edilir. Yalnızca
+        konum dizileri üretilir, veri kopyalanmaz.
+        
+        Args:
+            n_samples (int): Satır sayısı
+            n_splits (int): Katlama sayısı
+            n_repeats (int): Tekrar sayısı
+            random_state (int): Rastgele durum
+            
+        Returns:
+            List[List[np.ndarray]]: Tekrar başına katlamaların test konumları
+        """
+        if n_splits < 2 or n_splits > n_samples:
+            raise ValueError(f"Geçersiz katlama sayısı: {n_splits} ({n_samples} satır)")
+        if n_repeats < 1:
+            raise ValueError(f"Geçersiz tekrar sayısı: {n_repeats}")
+        rng = np.random.default_rng(random_state)
+        return [np.array_split(rng.permutation(n_samples), n_splits) for _ in range(n_repeats)]
+        
+    @staticmethod
+    def _moment_scores(coef: np.ndarray, intercept: float, moments: CovarianceAccumulator) -> Dict[str, float]:
+        """
+        Test katlamasının [X, y] momentlerinden tahmin etmeden MSE, RMSE ve R² hesaplar
+        
+        Σ(y - b - Xw)² = Syy - 2wᵀSxy + wᵀSxxw + n (ȳ - b - x̄ᵀw)²; burada S,
+        katlamanın kendi ortalamasına göre merkezlenmiş moment matrisidir.
+        """
+        xx = moments.comoment[:-1, :-1]
+        xy = moments.comoment[:-1, -1]
+        yy = moments.comoment[-1, -1]
+        bias = moments.mean[-1] - intercept - moments.mean[:-1] @ coef
+        sse = max(float(yy - 2 * coef @ xy + coef @ xx @ coef + moments.count * bias ** 2), 0.0)
+        mse = sse / moments.count
+        return {
+            'mse': mse,
+            'rmse': float(np.sqrt(mse)),
+            'r2': float(1 - sse / yy) if yy > 0 else 0.0
+        }
+        
+    @staticmethod
+    def _aggregate_scores(scores: List[Dict[str, float]]) -> Dict[str, Any]:
+        """Katlama metriklerini ortalama, standart sapma ve varyansla özetler"""
+        names = list(scores[0])
+        values = {name: np.array([score[name] for score in scores]) for name in names}
+        ddof = 1 if len(scores) > 1 else 0
+        return {
+            'folds': scores,
+            'n_folds': len(scores),
+            'mean': {name: float(values[name].mean()) for name in names},
+            'std': {name: float(values[name].std(ddof=ddof)) for name in names},
+            'variance': {name: float(values[name].var(ddof=ddof)) for name in names}
+        }
+        
+    def cross_validate(
+        self,
+        X: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray],
+        models: Optional[Dict[str, Tuple[str, Dict[str, Any]]]] = None,
+        n_splits: int = 5,
+        n_repeats: int = 1,
+        n_jobs: int = 1,
+        random_state: int = 42
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Modelleri tekrarlı k-katlı çapraz doğrulamayla değerlendirir
+        
+        Katlamalar yalnızca satır konumlarıyla tanımlanır. Doğrusal ve ridge
+        modellerde veri tekrar başına bir kez okunur: her katlamanın [X, y]
+        momentleri hesaplanır, eğitim momentleri diğer katlamaların
+        birleştirilmesiyle elde edilir ve model kapalı formda çözülür; test
+        metrikleri de katlamanın kendi momentlerinden hesaplanır. Aynı momentler
+        bu türdeki tüm modeller ve alpha değerleri için ortaktır. Diğer modeller
+        (ör. lasso) katlama başına eğitilir; n_jobs > 1 ise veri paylaşımlı
+        belleğe bir kez kopyalanır ve katlamalar bir süreç havuzunda eşzamanlı
+        çalışır.
+        
+        Args:
+            X (Union[pd.DataFrame, np.ndarray]): Özellikler
+            y (Union[pd.Series, np.ndarray]): Hedef
+            models (Optional[Dict[str, Tuple[str, Dict[str, Any]]]]): Model adı -> (eğitim metodu adı, ek parametreler)
+                (None ise doğrusal, ridge ve lasso)
+            n_splits (int): Katlama sayısı
+            n_repeats (int): Tekrar sayısı
+            n_jobs (int): Eşzamanlı çalışacak en fazla katlama sayısı
+            random_state (int): Rastgele durum
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Model adı -> {'folds', 'n_folds', 'mean', 'std', 'variance', 'sufficient_statistics'}
+        """
+        try:
+            if models is None:
+                models = {
+                    'linear': ('train_linear_regression', {}),
+                    'ridge': ('train_ridge_regression', {'alpha': 1.0}),
+                    'lasso': ('train_lasso_regression', {'alpha': 1.0})
+                }
+            self._check_methods(models)
+            if len(X) != len(y):
+                raise ValueError(f"X ve y satır sayıları uyuşmuyor: {len(X)} != {len(y)}")
+                
+            start = time.perf_counter()
+            splits = self.fold_indices(len(X), n_splits, n_repeats, random_state)
+            scores = {name: [] for name in models}
+            
+            # Doğrusal ve ridge: katlama momentleri tüm modeller için bir kez hesaplanır
+            moment_models = {name: spec for name, spec in models.items() if spec[0] in _MOMENT_METHODS}
+            if moment_models:
+                solver = StreamingRegression()
+                X_values = X.to_numpy(dtype=np.float64) if isinstance(X, pd.DataFrame) else np.asarray(X, dtype=np.float64)
+                y_values = np.asarray(y, dtype=np.float64)
+                for folds in splits:
+                    parts = [_block_moments(np.column_stack([X_values[index], y_values[index]])) for index in folds]
+                    for k, test_moments in enumerate(parts):
+                        train_moments = CovarianceAccumulator()
+                        for j, part in enumerate(parts):
+                            if j != k:
+                                train_moments.merge(part)
+                        for name, (method, params) in moment_models.items():
+                            default_alpha = 1.0 if method == 'train_ridge_regression' else 0.0
+                            alpha = 0.0 if method == 'train_linear_regression' else params.get('alpha', default_alpha)
+                            coef, intercept, _ = solver.solve(alpha, train_moments)
+                            scores[name].append(self._moment_scores(coef, intercept, test_moments))
+                            
+            # Diğer modeller katlama başına eğitilir
+            tasks = [
+                (name, method, params, index)
+                for name, (method, params) in models.items() if name not in moment_models
+                for folds in splits
+                for index in folds
+            ]
+            if n_jobs <= 1 or len(tasks) <= 1:
+                for name, method, params, index in tasks:
+                    scores[name].append(_fold_scores(self, method, X, y, params, index))
+            else:
+                with _shared_training_pool(X, y, min(n_jobs, len(tasks))) as executor:
+                    futures = [(name, executor.submit(_fold_worker, method, params, index)) for name, method, params, index in tasks]
+                    for name, future in futures:
+                        scores[name].append(future.result())
+                        
+            results = {}
+            for name, model_scores in scores.items():
+                results[name] = self._aggregate_scores(model_scores)
+                results[name]['sufficient_statistics'] = name in moment_models
+                
+            summary = ', '.join(f"{name} R² {result['mean']['r2']:.4f} ± {result['std']['r2']:.4f}" for name, result in results.items())
+            self.logger.info(
+                f"{n_repeats} x {n_splits} katlı çapraz doğrulama {time.perf_counter() - start:.2f} s içinde tamamlandı ({summary})"
+            )
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Çapraz doğrulama hatası: {e}")
+            raise
+            
+    @staticmethod
+    def _path_metrics(
+        coefs: np.ndarray,
+        intercepts: np.ndarray,
+        X: np.ndarray,
+        y: np.ndarray
+    ) -> Dict[str, List[float]]:
+        """
+        Yol üzerindeki tüm alpha değerleri için hata metriklerini tek matris çarpımıyla hesaplar
+        
+        Args:
+            coefs (np.ndarray): Alpha başına katsayılar (n_alphas x p)
+            intercepts (np.ndarray): Alpha başına sabit terimler
+            X (np.ndarray): Değerlendirme verisi
+            y (np.ndarray): Değerlendirme hedefi
+            
+        Returns:
+            Dict[str, List[float]]: Alpha başına mse, rmse ve r2
+        """
+        residuals = y[:, None] - (X @ coefs.T + intercepts)
+        sse = np.einsum('ij,ij->j', residuals, residuals)
+        sst = ((y - y.mean()) ** 2).sum()
+        mse = sse / len(y)
+        return {
+            'mse': mse.tolist(),
+            'rmse': np.sqrt(mse).tolist(),
+            'r2': (1 - sse / sst).tolist() if sst > 0 else [0.0] * len(sse)
+        }
+        
+    @staticmethod
+    def _with_coefficients(model: Any, coef: np.ndarray, intercept: float, X: Any) -> Any:
+        """Yoldan seçilen katsayıları yeniden eğitmeden scikit-learn modeline yerleştirir"""
+        model.coef_ = np.asarray(coef, dtype=np.float64)
+        model.intercept_ = float(intercept)
+        model.n_features_in_ = len(model.coef_)
+        if isinstance(X, pd.DataFrame) and all(isinstance(col, str) for col in X.columns):
+            model.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        return model
+        
+    def _path_result(
+        self,
+        name: str,
+        model: Any,
+        alphas: np.ndarray,
+        coefs: np.ndarray,
+        intercepts: np.ndarray,
+        X: np.ndarray,
+        y: np.ndarray,
+        X_val: Optional[np.ndarray],
+        y_val: Optional[np.ndarray],
+        X_train: Any
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Yol sonuçlarını toplar ve en düşük doğrulama hatalı modeli hazırlar"""
+        if X_val is not None:
+            metrics = self._path_metrics(coefs, intercepts, np.asarray(X_val, dtype=np.float64), np.asarray(y_val, dtype=np.float64))
+        else:
+            metrics = self._path_metrics(coefs, intercepts, X, y)
+        best = int(np.argmin(metrics['mse']))
+        model.set_params(alpha=float(alphas[best]))
+        model = self._with_coefficients(model, coefs[best], intercepts[best], X_train)
+        
+        path = {
+            'alphas': alphas.tolist(),
+            'coefficients': coefs.tolist(),
+            'intercepts': intercepts.tolist(),
+            'metrics': metrics,
+            'metrics_on': 'validation' if X_val is not None else 'train',
+            'best_index': best,
+            'best_alpha': float(alphas[best])
+        }
+        self.logger.info(f"{name} yolu hesaplandı: {len(alphas)} alpha, en iyi alpha {alphas[best]:.6g}")
+        return model, path
+        
+    def ridge_path(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        alphas: Optional[List[float]] = None,
+        n_alphas: int = 50,
+        X_val: Optional[np.ndarray] = None,
+        y_val: Optional[np.ndarray] = None
+    ) -> Tuple[Ridge, Dict[str, Any]]:
+        """
+        Ridge çözümlerini birçok alpha için tek bir SVD'den hesaplar
+        
+        Merkezlenmiş X = U S Vᵀ ayrışımıyla her alpha için katsayılar
+        V diag(s / (s² + alpha)) Uᵀy olur; ayrışım bir kez yapılır, alpha
+        başına maliyet yalnızca O(p · min(n, p)) kalır. Uzun veride (n >= p)
+        V ve s², Ridge'in tek eğitimindeki gibi XᵀX Gram matrisinin özdeğer
+        ayrışımından alınır; geniş veride X'in ince SVD'si kullanılır.
+        Sonuçlar Ridge(alpha) ile aynıdır.
+        
+        Args:
+            X_train (np.ndarray): Eğitim verisi
+            y_train (np.ndarray): Eğitim hedefi
+            alphas (Optional[List[float]]): Alpha değerleri (None ise tekil değerlere göre logaritmik ızgara)
+            n_alphas (int): Otomatik ızgaradaki alpha sayısı
+            X_val (Optional[np.ndarray]): Doğrulama verisi (None ise metrikler eğitim verisinde)
+            y_val (Optional[np.ndarray]): Doğrulama hedefi
+            
+        Returns:
+            Tuple[Ridge, Dict[str, Any]]: En düşük doğrulama hatalı model ve yol sonuçları
+        """
+        try:
+            X = np.asarray(X_train, dtype=np.float64)
+            y = np.asarray(y_train, dtype=np.float64)
+            x_mean, y_mean = X.mean(axis=0), y.mean()
+            centered = X - x_mean
+            if len(X) >= X.shape[1]:
+                # XᵀX = V S² Vᵀ ve S Uᵀy = Vᵀ Xᵀy
+                squared, V = np.linalg.eigh(centered.T @ centered)
+                squared = np.clip(squared, 0.0, None)
+                projected = V.T @ (centered.T @ (y - y_mean))
+                Vt = V.T
+            else:
+                U, s, Vt = np.linalg.svd(centered, full_matrices=False)
+                squared = s ** 2
+                projected = s * (U.T @ (y - y_mean))
+            del centered
+            
+            if alphas is None:
+                top = squared.max() if len(squared) and squared.max() > 0 else 1.0
+                alphas = np.geomspace(top, top * 1e-6, n_alphas)
+            alphas = np.asarray(alphas, dtype=np.float64)
+            
+            coefs = (projected / (squared + alphas[:, None])) @ Vt
+            intercepts = y_mean - coefs @ x_mean
+            
+            return self._path_result('Ridge', Ridge(), alphas, coefs, intercepts, X, y, X_val, y_val, X_train)
+            
+        except Exception as e:
+            self.logger.error(f"Ridge yolu hatası: {e}")
+            raise
+            
+    def lasso_path(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        alphas: Optional[List[float]] = None,
+        n_alphas: int = 50,
+        eps: float = 1e-3,
+        X_val: Optional[np.ndarray] = None,
+        y_val: Optional[np.ndarray] = None
+    ) -> Tuple[Lasso, Dict[str, Any]]:
+        """
+        Lasso çözümlerini azalan alpha ızgarası boyunca sıcak başlatmalı koordinat inişiyle hesaplar
+        
+        Gram matrisi XᵀX bir kez hesaplanır; her alpha bir öncekinin
+        çözümünden başladığından ek alpha'lar yalnızca birkaç koordinat
+        inişi turuna mal olur. Sonuçlar Lasso(alpha) ile aynıdır.
+        
+        Args:
+            X_train (np.ndarray): Eğitim verisi
+            y_train (np.ndarray): Eğitim hedefi
+            alphas (Optional[List[float]]): Alpha değerleri (None ise alpha_max'tan eps * alpha_max'a ızgara)
+            n_alphas (int): Otomatik ızgaradaki alpha sayısı
+            eps (float): Otomatik ızgarada en küçük / en büyük alpha oranı
+            X_val (Optional[np.ndarray]): Doğrulama verisi (None ise metrikler eğitim verisinde)
+            y_val (Optional[np.ndarray]): Doğrulama hedefi
+            
+        Returns:
+            Tuple[Lasso, Dict[str, Any]]: En düşük doğrulama hatalı model ve yol sonuçları
+        """
+        try:
+            X = np.asarray(X_train, dtype=np.float64)
+            y = np.asarray(y_train, dtype=np.float64)
+            x_mean, y_mean = X.mean(axis=0), y.mean()
+            centered = np.asfortranarray(X - x_mean)
+            gram = centered.T @ centered
+            xy = centered.T @ (y - y_mean)
+            
+            if alphas is None:
+                alpha_max = np.abs(xy).max() / len(y) if len(xy) else 1.0
+                alphas = np.geomspace(alpha_max, alpha_max * eps, n_alphas) if alpha_max > 0 else np.full(1, eps)
+            # Sıcak başlatma için büyükten küçüğe sıralanır
+            alphas = np.sort(np.asarray(alphas, dtype=np.float64))[::-1]
+            
+            _, coefs, _ = sk_lasso_path(centered, y - y_mean, alphas=alphas, precompute=gram, Xy=xy, copy_X=False)
+            coefs = coefs.T
+            intercepts = y_mean - coefs @ x_mean
+            
+            return self._path_result('Lasso', Lasso(), alphas, coefs, intercepts, X, y, X_val, y_val, X_train)
+            
+        except Exception as e:
+            self.logger.error(f"Lasso yolu hatası: {e}")
+            raise
+            
+    def regularization_paths(
+        self,
+        X_train: np.ndarray,
+        y_train: np.ndarray,
+        validation_size: float = 0.2,
+        n_alphas: int = 50,
+        ridge_alphas: Optional[List[float]] = None,
+        lasso_alphas: Optional[List[float]] = None,
+        random_state: int = 42
+    ) -> Dict[str, Tuple[Any, Dict[str, Any]]]:
+        """
+        Eğitim verisinden doğrulama seti ayırıp ridge ve lasso yollarını hesaplar
+        
+        Args:
+            X_train (np.ndarray): Eğitim verisi
+            y_train (np.ndarray): Eğitim hedefi
+            validation_size (float): Doğrulama seti oranı
+            n_alphas (int): Otomatik ızgaralardaki alpha sayısı
+            ridge_alphas (Optional[List[float]]): Ridge alpha değerleri
+            lasso_alphas (Optional[List[float]]): Lasso alpha değerleri
+            random_state (int): Rastgele durum
+            
+        Returns:
+            Dict[str, Tuple[Any, Dict[str, Any]]]: 'ridge' ve 'lasso' için en iyi model ve yol sonuçları
+        """
+        X_fit, X_val, y_fit, y_val = train_test_split(
+            X_train, y_train, test_size=validation_size, random_state=random_state
+        )
+        return {
+            'ridge': self.ridge_path(X_fit, y_fit, ridge_alphas, n_alphas, X_val=X_val, y_val=y_val),
+            'lasso': self.lasso_path(X_fit, y_fit, lasso_alphas, n_alphas, X_val=X_val, y_val=y_val)
+        }
+        
     def evaluate_model(
         self,
         model: Any,
@@ -237,3 +809,32 @@ class RegressionAnalysis:
         except Exception as e:
             self.logger.error(f"Model yükleme hatası: {e}")
             raise
+            
+    def export_predictor(
+        self,
+        model: Any,
+        file_path: Optional[str] = None,
+        columns: Optional[List[Any]] = None,
+        dtype: str = 'float64'
+    ) -> LinearPredictor:
+        """
+        Doğrusal, ridge veya lasso modelini hafif NumPy tahmincisine dönüştürür
+        
+        Args:
+            model (Any): Eğitilmiş model
+            file_path (Optional[str]): Verilirse tahminci JSON olarak kaydedilir
+            columns (Optional[List[Any]]): Özellik sırası (None ise modelin feature_names_in_ değeri)
+            dtype (str): Tahmin tipi (float32, float64)
+            
+        Returns:
+            LinearPredictor: Tahminci
+        """
+        try:
+            predictor = LinearPredictor.from_model(model, columns=columns, dtype=dtype)
+            if file_path is not None:
+                predictor.save(file_path)
+            return predictor
+            
+        except Exception as e:
+            self.logger.error(f"Tahminci dışa aktarma hatası: {e}")
+            raise
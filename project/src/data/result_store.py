@@ -0,0 +1,207 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
+import logging
+from pathlib import Path
+import json
+import os
+
+class LazyArray:
+    """
+    Yan dosyada saklanan ve ilk erişimde okunan dizi.
+    
+    np.asarray(lazy) veya lazy.load() ile diziye dönüşür; şekil ve tip
+    bilgisi dosya okunmadan manifestten gelir.
+    """
+    
+    def __init__(self, path: Path, key: Optional[str], shape: Tuple[int, ...], dtype: str, mmap: bool = False):
+        """
+        LazyArray sınıfı başlatıcısı
+        
+        Args:
+            path (Path): .npz veya .npy yan dosyası
+            key (Optional[str]): .npz içindeki dizi adı (.npy için None)
+            shape (Tuple[int, ...]): Dizi şekli
+            dtype (str): Dizi tipi
+            mmap (bool): .npy dosyasını bellek eşlemeli aç
+        """
+        self.path = Path(path)
+        self.key = key
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.mmap = mmap
+        self._value: Optional[np.ndarray] = None
+        
+    def load(self) -> np.ndarray:
+        """
+        Diziyi okur (sonraki çağrılar aynı diziyi döndürür)
+        
+        Returns:
+            np.ndarray: Dizi
+        """
+        if self._value is None:
+            if self.key is None:
+                self._value = np.load(self.path, mmap_mode='r' if self.mmap else None, allow_pickle=False)
+            else:
+                with np.load(self.path, allow_pickle=False) as archive:
+                    self._value = archive[self.key]
+        return self._value
+        
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.load()
+        return values if dtype is None else values.astype(dtype, copy=False)
+        
+    def __len__(self) -> int:
+        return self.shape[0] if self.shape else 0
+        
+    def __repr__(self) -> str:
+        state = 'yüklü' if self._value is not None else 'yüklenmedi'
+        return f"LazyArray(shape={self.shape}, dtype={self.dtype}, {state})"
+
+
+class ResultStore:
+    """
+    Analiz sonuçları için JSON manifest + ikili yan dosya biçimi.
+    
+    Belirli bir boyutun üzerindeki NumPy dizileri (ve sayısal listeler)
+    sıkıştırılmış tek bir .npz dosyasına veya dizi başına bir .npy dosyasına
+    yazılır; sonuç ağacının geri kalanı küçük bir JSON manifestte, dizilere
+    referanslarla saklanır. Okurken diziler LazyArray olarak döner ve yalnızca
+    erişildiğinde diskten okunur.
+    """
+    
+    ARRAY_KEY = '__array__'
+    
+    def __init__(self, compress: bool = True, min_array_size: int = 1024):
+        """
+        ResultStore sınıfı başlatıcısı
+        
+        Args:
+            compress (bool): Dizileri sıkıştırılmış .npz'ye yaz (False ise bellek eşlemeli açılabilen .npy dosyaları)
+            min_array_size (int): Yan dosyaya yazılacak en küçük eleman sayısı
+        """
+        self.compress = compress
+        self.min_array_size = min_array_size
+        self.logger = logging.getLogger(__name__)
+        
+    @staticmethod
+    def json_default(value: Any) -> Any:
+        """
+        json.dump için NumPy/pandas değerlerini dönüştürür
+        
+        Args:
+            value (Any): JSON'a doğrudan yazılamayan değer
+            
+        Returns:
+            Any: JSON uyumlu değer
+        """
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (pd.Series, pd.Index)):
+            return value.tolist()
+        if isinstance(value, pd.DataFrame):
+            return value.to_dict()
+        if isinstance(value, pd.Timestamp):
+            return value.isoformat()
+        return str(value)
+        
+    def _extract(self, value: Any, arrays: Dict[str, np.ndarray]) -> Any:
+        """Büyük dizileri referansla değiştirerek sonuç ağacını dolaşır"""
+        if isinstance(value, dict):
+            return {str(key): self._extract(item, arrays) for key, item in value.items()}
+        if isinstance(value, (pd.Series, pd.Index)):
+            value = value.to_numpy()
+        if isinstance(value, (list, tuple)) and len(value) >= self.min_array_size:
+            candidate = np.asarray(value)
+            if candidate.dtype.kind in 'biuf':
+                value = candidate
+        if isinstance(value, np.ndarray) and value.size >= self.min_array_size and value.dtype.kind in 'biufc':
+            key = f"array_{len(arrays)}"
+            arrays[key] = value
+            return {self.ARRAY_KEY: key, 'shape': list(value.shape), 'dtype': value.dtype.str}
+        if isinstance(value, (list, tuple)):
+            return [self._extract(item, arrays) for item in value]
+        return value
+        
+    def save(self, results: Dict[str, Any], path: str) -> Path:
+        """
+        Sonuçları manifest ve yan dosya(lar) olarak yazar
+        
+        Yan dosyalar önce, manifest en son ve geçici adla yazılıp yerine
+        taşınır; böylece okuyucular yarım yazılmış sonuç görmez.
+        
+        Args:
+            results (Dict[str, Any]): Sonuçlar
+            path (str): Manifest dosyası yolu (ör. output/results.json)
+            
+        Returns:
+            Path: Manifest dosyası yolu
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays: Dict[str, np.ndarray] = {}
+        tree = self._extract(results, arrays)
+        
+        manifest = {'format': 'npz' if self.compress else 'npy', 'results': tree}
+        if self.compress:
+            sidecar = path.with_suffix('.npz')
+            tmp_path = sidecar.with_name(f".{sidecar.stem}.{os.getpid()}.tmp.npz")
+            np.savez_compressed(tmp_path, **arrays)
+            os.replace(tmp_path, sidecar)
+            manifest['sidecar'] = sidecar.name
+        else:
+            sidecar_dir = path.with_name(f"{path.stem}_arrays")
+            sidecar_dir.mkdir(exist_ok=True)
+            for key, value in arrays.items():
+                tmp_path = sidecar_dir / f".{key}.{os.getpid()}.tmp.npy"
+                np.save(tmp_path, value, allow_pickle=False)
+                os.replace(tmp_path, sidecar_dir / f"{key}.npy")
+            manifest['sidecar'] = sidecar_dir.name
+            
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=4, default=self.json_default)
+        os.replace(tmp_path, path)
+        
+        total = sum(value.nbytes for value in arrays.values())
+        self.logger.info(f"Sonuçlar kaydedildi: {path} ({len(arrays)} dizi, {total / 1024 ** 2:.1f} MiB)")
+        return path
+        
+    @classmethod
+    def load(cls, path: str, lazy: bool = True) -> Dict[str, Any]:
+        """
+        Manifesti okur; dizileri LazyArray (lazy=False ise np.ndarray) olarak döndürür
+        
+        Args:
+            path (str): Manifest dosyası yolu
+            lazy (bool): Dizileri ilk erişime kadar okuma
+            
+        Returns:
+            Dict[str, Any]: Sonuçlar
+        """
+        path = Path(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        sidecar = path.with_name(manifest['sidecar'])
+        compressed = manifest['format'] == 'npz'
+        
+        def resolve(value: Any) -> Any:
+            if isinstance(value, dict):
+                if cls.ARRAY_KEY in value:
+                    key = value[cls.ARRAY_KEY]
+                    array = LazyArray(
+                        sidecar if compressed else sidecar / f"{key}.npy",
+                        key if compressed else None,
+                        value['shape'],
+                        value['dtype'],
+                        mmap=not compressed
+                    )
+                    return array if lazy else array.load()
+                return {key: resolve(item) for key, item in value.items()}
+            if isinstance(value, list):
+                return [resolve(item) for item in value]
+            return value
+            
+        return resolve(manifest['results'])
@@ -0,0 +1,138 @@
+import pandas as pd
+from typing import Dict, Any, Callable, Optional, Tuple
+import logging
+import weakref
+from collections import OrderedDict
+import hashlib
+
+class StatisticsCache:
+    """
+    Veri çerçevesi özetleri için bellek içi önbellek.
+    
+    describe ve corr gibi pahalı özetler, çerçevenin parmak izi ile
+    anahtarlanır. Parmak izi boyut, sütun adları, tipler ve tüm satırların
+    içerik özetinden oluşur; içeriği farklı bir çerçeve hiçbir zaman
+    önbellekten yanıtlanmaz. Özetleme çerçeve nesnesi başına bir kez yapılır
+    ve nesne yaşadığı sürece hatırlanır; böylece aynı veri farklı aşamalara
+    verildiğinde yalnızca ilk arama veri üzerinden geçer. Çerçeveyi yerinde
+    değiştiren aşamalar forget çağırmalıdır. Özetlenemeyen (ör. liste içeren)
+    sütunlarda önbellek atlanır. Döndürülen nesneler paylaşıldığından
+    çağıranlar tarafından değiştirilmemelidir.
+    """
+    
+    def __init__(self, max_frames: int = 4):
+        """
+        StatisticsCache sınıfı başlatıcısı
+        
+        Args:
+            max_frames (int): Özetleri tutulacak en fazla çerçeve sayısı (0 ise önbellek kapalı)
+        """
+        self.max_frames = max_frames
+        self.logger = logging.getLogger(__name__)
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        # id(çerçeve) -> (zayıf referans, parmak izi)
+        self._frame_keys: Dict[int, Tuple[weakref.ref, str]] = {}
+        self.hits = 0
+        self.misses = 0
+        
+    def fingerprint(self, data: pd.DataFrame) -> str:
+        """
+        Veri çerçevesinin tüm içeriğinden parmak izini hesaplar
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            
+        Returns:
+            str: Parmak izi
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((
+            data.shape,
+            [str(col) for col in data.columns],
+            [str(dtype) for dtype in data.dtypes]
+        )).encode('utf-8'))
+        
+        if len(data):
+            digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+        
+    def _key(self, data: pd.DataFrame) -> str:
+        """Parmak izini çerçeve nesnesi başına bir kez hesaplar"""
+        frame_id = id(data)
+        known = self._frame_keys.get(frame_id)
+        if known is not None and known[0]() is data:
+            return known[1]
+            
+        key = self.fingerprint(data)
+        # Çerçeve silindiğinde kaydı kaldırılır, böylece id yeniden kullanıldığında eski anahtar dönmez
+        self._frame_keys[frame_id] = (weakref.ref(data, lambda _: self._frame_keys.pop(frame_id, None)), key)
+        return key
+        
+    def forget(self, data: pd.DataFrame) -> None:
+        """
+        Yerinde değiştirilen çerçevenin hatırlanan parmak izini siler
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+        """
+        self._frame_keys.pop(id(data), None)
+        
+    def get(self, data: pd.DataFrame, name: str, compute: Callable[[pd.DataFrame], Any]) -> Any:
+        """
+        Özeti önbellekten döndürür, yoksa hesaplayıp saklar
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            name (str): Özet adı
+            compute (Callable[[pd.DataFrame], Any]): Özeti hesaplayan fonksiyon
+            
+        Returns:
+            Any: Özet
+        """
+        if self.max_frames <= 0:
+            return compute(data)
+            
+        try:
+            key = self._key(data)
+        except TypeError as e:
+            # hash_pandas_object liste gibi özetlenemeyen değerlerde hata verir
+            self.logger.debug(f"Özet önbelleği atlandı: {e}")
+            return compute(data)
+            
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {}
+            while len(self._entries) > self.max_frames:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(key)
+        
+        if name in entry:
+            self.hits += 1
+            return entry[name]
+            
+        self.misses += 1
+        entry[name] = compute(data)
+        return entry[name]
+        
+    def describe(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Önbellekli data.describe()"""
+        return self.get(data, 'describe', lambda frame: frame.describe())
+        
+    def corr(
+        self,
+        data: pd.DataFrame,
+        compute: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ) -> pd.DataFrame:
+        """Önbellekli korelasyon matrisi (compute verilmezse data.corr())"""
+        return self.get(data, 'corr', compute or (lambda frame: frame.corr()))
+        
+    def missing(self, data: pd.DataFrame) -> pd.Series:
+        """data.isnull().sum() (parmak izinden ucuz olduğundan önbelleğe alınmaz)"""
+        return data.isnull().sum()
+        
+    def clear(self) -> None:
+        """Önbelleği boşaltır"""
+        self._entries.clear()
+        self._frame_keys.clear()
+        self.hits = 0
+        self.misses = 0
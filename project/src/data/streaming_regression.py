@@ -0,0 +1,221 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.linear_model import LinearRegression, Ridge
+from .data_chunks import DataChunks
+from .mmap_dataset import MmapDataset
+from .incremental import CovarianceAccumulator
+
+
+def _block_moments(block: np.ndarray) -> CovarianceAccumulator:
+    """Bir [X, y] bloğunun ortak momentlerini hesaplar"""
+    return CovarianceAccumulator(list(range(block.shape[1]))).update(pd.DataFrame(block, copy=False))
+
+
+def _mmap_block_moments(path: str, start: int, stop: int, positions: List[int]) -> CovarianceAccumulator:
+    """Bellek eşlemeli veri setinin bir satır aralığını işçide doğrudan okuyup momentlerini hesaplar"""
+    values = MmapDataset(path).values
+    return _block_moments(np.asarray(values[start:stop][:, positions], dtype=np.float64))
+
+
+class StreamingRegression:
+    """
+    Yeterli istatistiklerle tek geçişte eğitilen doğrusal ve ridge regresyon.
+    
+    Veri satır blokları halinde okunur ve her blok için [X, y] sütunlarının
+    ortalaması ile ortak moment matrisi (merkezlenmiş XᵀX, Xᵀy ve yᵀy)
+    hesaplanır; kısmi toplamlar Chan formülüyle birleştirilir. Model bu
+    (p+1) x (p+1) matristen kapalı formda çözülür, eğitim R² skoru da ikinci
+    bir geçiş gerekmeden aynı matristen hesaplanır. Bellek kullanımı satır
+    sayısına değil özellik sayısının karesine bağlıdır. n_jobs > 1 ise bloklar
+    işçi süreçlerinde paralel işlenir; bellek eşlemeli veri setlerinde
+    işçiler dosyayı kendileri açar, yalnızca satır aralıkları gönderilir.
+    Eksik değer içeren satırlar atlanır.
+    """
+    
+    def __init__(
+        self,
+        target_column: Optional[str] = None,
+        n_jobs: int = 1,
+        block_rows: int = 65536
+    ):
+        """
+        StreamingRegression sınıfı başlatıcısı
+        
+        Args:
+            target_column (Optional[str]): Hedef sütunu (y ayrıca verilmediğinde)
+            n_jobs (int): Paralel süreç sayısı
+            block_rows (int): Bellekteki veri için blok satır sayısı
+        """
+        self.target_column = target_column
+        self.n_jobs = n_jobs
+        self.block_rows = block_rows
+        self.features: Optional[List[Any]] = None
+        self.moments: Optional[CovarianceAccumulator] = None
+        self.logger = logging.getLogger(__name__)
+        
+    def _split_columns(self, columns: List[Any]) -> List[Any]:
+        """Hedef dışındaki sütunları özellik olarak döndürür"""
+        if self.target_column is None:
+            raise ValueError("y verilmediğinde target_column gereklidir")
+        if self.target_column not in columns:
+            raise ValueError(f"Hedef sütunu bulunamadı: {self.target_column}")
+        return [col for col in columns if col != self.target_column]
+        
+    def _tasks(
+        self,
+        X: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray],
+        y: Optional[Union[pd.Series, np.ndarray]] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Veriyi işçi görevlerine çevirir
+        
+        Returns:
+            Iterator[Tuple[Any, ...]]: (fonksiyon, argümanlar...) görevleri
+        """
+        if isinstance(X, DataChunks):
+            for chunk in X:
+                if self.features is None:
+                    self.features = self._split_columns(list(chunk.select_dtypes(include=[np.number]).columns))
+                yield _block_moments, chunk[self.features + [self.target_column]].to_numpy(dtype=np.float64)
+            return
+            
+        if isinstance(X, MmapDataset):
+            self.features = self._split_columns(list(X.columns))
+            positions = [X.columns.index(col) for col in self.features + [self.target_column]]
+            for start in range(0, X.n_rows, self.block_rows):
+                yield _mmap_block_moments, str(X.path), start, min(start + self.block_rows, X.n_rows), positions
+            return
+            
+        if y is None:
+            if not isinstance(X, pd.DataFrame):
+                raise ValueError("Dizi girdilerinde y gereklidir")
+            self.features = self._split_columns(list(X.columns))
+            y = X[self.target_column]
+            X = X[self.features]
+        else:
+            self.features = list(X.columns) if isinstance(X, pd.DataFrame) else list(range(np.shape(X)[1]))
+            
+        X_values = X.to_numpy(dtype=np.float64) if isinstance(X, pd.DataFrame) else np.asarray(X, dtype=np.float64)
+        y_values = np.asarray(y, dtype=np.float64).reshape(-1, 1)
+        if len(X_values) != len(y_values):
+            raise ValueError(f"X ve y satır sayıları uyuşmuyor: {len(X_values)} != {len(y_values)}")
+        for start in range(0, len(X_values), self.block_rows):
+            stop = start + self.block_rows
+            yield _block_moments, np.hstack([X_values[start:stop], y_values[start:stop]])
+            
+    def accumulate(
+        self,
+        X: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray],
+        y: Optional[Union[pd.Series, np.ndarray]] = None
+    ) -> CovarianceAccumulator:
+        """
+        Veri üzerinden tek geçişte yeterli istatistikleri biriktirir
+        
+        Args:
+            X (Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]): Özellikler (y verilmezse hedef sütunu dahil veri)
+            y (Optional[Union[pd.Series, np.ndarray]]): Hedef
+            
+        Returns:
+            CovarianceAccumulator: [X, y] sütunlarının birleştirilmiş momentleri
+        """
+        self.features = None
+        moments = CovarianceAccumulator()
+        tasks = self._tasks(X, y)
+        if self.n_jobs > 1:
+            # Bellekte aynı anda en fazla 2 * n_jobs blok bekler
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                pending = deque()
+                for task in tasks:
+                    pending.append(executor.submit(*task))
+                    if len(pending) >= 2 * self.n_jobs:
+                        moments.merge(pending.popleft().result())
+                while pending:
+                    moments.merge(pending.popleft().result())
+        else:
+            for func, *args in tasks:
+                moments.merge(func(*args))
+                
+        if not moments.count:
+            raise ValueError("Regresyon için eksiksiz satır bulunamadı")
+        self.moments = moments
+        self.logger.info(f"Yeterli istatistikler biriktirildi: {moments.count} satır, {len(self.features)} özellik")
+        return moments
+        
+    def solve(self, alpha: float = 0.0, moments: Optional[CovarianceAccumulator] = None) -> Tuple[np.ndarray, float, float]:
+        """
+        Biriktirilen momentlerden katsayıları kapalı formda çözer
+        
+        Args:
+            alpha (float): Ridge regularizasyon parametresi (0 ise doğrusal regresyon)
+            moments (Optional[CovarianceAccumulator]): Momentler (None ise son accumulate çıktısı)
+            
+        Returns:
+            Tuple[np.ndarray, float, float]: Katsayılar, sabit terim ve eğitim R² skoru
+        """
+        moments = moments if moments is not None else self.moments
+        if moments is None:
+            raise ValueError("Önce accumulate çağrılmalıdır")
+        xx = moments.comoment[:-1, :-1]
+        xy = moments.comoment[:-1, -1]
+        yy = moments.comoment[-1, -1]
+        
+        if alpha > 0:
+            coef = np.linalg.solve(xx + alpha * np.eye(len(xx)), xy)
+        else:
+            # Tekil XᵀX için en küçük normlu çözüm (LinearRegression ile aynı)
+            coef = np.linalg.lstsq(xx, xy, rcond=None)[0]
+        intercept = float(moments.mean[-1] - moments.mean[:-1] @ coef)
+        
+        residual = yy - 2 * coef @ xy + coef @ xx @ coef
+        score = float(1 - residual / yy) if yy > 0 else 0.0
+        return coef, intercept, score
+        
+    def fit(
+        self,
+        X: Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray],
+        y: Optional[Union[pd.Series, np.ndarray]] = None,
+        alpha: float = 0.0
+    ) -> Tuple[Union[LinearRegression, Ridge], Dict[str, Any]]:
+        """
+        Tek geçişte doğrusal (alpha=0) veya ridge regresyon eğitir
+        
+        Args:
+            X (Union[pd.DataFrame, MmapDataset, DataChunks, np.ndarray]): Özellikler (y verilmezse hedef sütunu dahil veri)
+            y (Optional[Union[pd.Series, np.ndarray]]): Hedef
+            alpha (float): Ridge regularizasyon parametresi
+            
+        Returns:
+            Tuple[Union[LinearRegression, Ridge], Dict[str, Any]]: scikit-learn uyumlu model ve metrikler
+        """
+        self.accumulate(X, y)
+        coef, intercept, score = self.solve(alpha)
+        return self.to_model(coef, intercept, alpha), {
+            'coefficients': coef.tolist(),
+            'intercept': intercept,
+            'score': score,
+            'n_samples': int(self.moments.count)
+        }
+        
+    def to_model(self, coef: np.ndarray, intercept: float, alpha: float = 0.0) -> Union[LinearRegression, Ridge]:
+        """
+        Katsayılardan tahmin, değerlendirme ve kaydetme için scikit-learn modeli oluşturur
+        
+        Args:
+            coef (np.ndarray): Katsayılar
+            intercept (float): Sabit terim
+            alpha (float): Ridge regularizasyon parametresi (0 ise LinearRegression)
+            
+        Returns:
+            Union[LinearRegression, Ridge]: Model
+        """
+        model = Ridge(alpha=alpha) if alpha > 0 else LinearRegression()
+        model.coef_ = np.asarray(coef, dtype=np.float64)
+        model.intercept_ = intercept
+        model.n_features_in_ = len(model.coef_)
+        if self.features is not None and all(isinstance(col, str) for col in self.features):
+            model.feature_names_in_ = np.asarray(self.features, dtype=object)
+        return model
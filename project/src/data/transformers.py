@@ -0,0 +1,573 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Any, Optional, Union
+import json
+from pathlib import Path
+from .data_chunks import DataChunks
+from .online_stats import OnlineStatistics
+from .quantile_sketch import ColumnSketches
+
+class FittedTransformer:
+    """
+    Parametreleri bir kez öğrenilip tekrar kullanılan dönüştürücüler için temel sınıf.
+    
+    fit parametreleri veri çerçevesi veya DataChunks üzerinde tek seferde
+    hesaplar; transform yeni veri parçalarına yeniden uydurma yapmadan uygular.
+    Parametreler JSON uyumlu bir sözlüğe serileştirilir.
+    """
+    
+    def fit(self, data: Union[pd.DataFrame, DataChunks]) -> 'FittedTransformer':
+        """
+        Dönüştürücü parametrelerini öğrenir
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            FittedTransformer: Uydurulmuş dönüştürücü
+        """
+        return self
+        
+    def transform(self, data: Union[pd.DataFrame, DataChunks]) -> Union[pd.DataFrame, DataChunks]:
+        """
+        Öğrenilmiş parametreleri uygular
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Dönüştürülecek veri veya veri parçaları
+            
+        Returns:
+            Union[pd.DataFrame, DataChunks]: Dönüştürülmüş veri veya tembel dönüştürülmüş parçalar
+        """
+        if isinstance(data, DataChunks):
+            return data.map(self._transform)
+        return self._transform(data)
+        
+    def fit_transform(self, data: Union[pd.DataFrame, DataChunks]) -> Union[pd.DataFrame, DataChunks]:
+        """Parametreleri öğrenir ve veriyi dönüştürür"""
+        return self.fit(data).transform(data)
+        
+    def _transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Tek bir veri çerçevesini dönüştürür"""
+        return data
+        
+    def get_state(self) -> Dict[str, Any]:
+        """Serileştirilecek parametreleri döndürür"""
+        return {}
+        
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Serileştirilmiş parametreleri yükler"""
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Dönüştürücüyü JSON uyumlu sözlüğe çevirir
+        
+        Returns:
+            Dict[str, Any]: Tip ve parametreler
+        """
+        return {'type': type(self).__name__, 'state': self.get_state()}
+        
+    @staticmethod
+    def from_dict(payload: Dict[str, Any]) -> 'FittedTransformer':
+        """
+        Sözlükten dönüştürücü oluşturur
+        
+        Args:
+            payload (Dict[str, Any]): to_dict çıktısı
+            
+        Returns:
+            FittedTransformer: Dönüştürücü
+        """
+        transformer_type = TRANSFORMERS.get(payload['type'])
+        if transformer_type is None:
+            raise ValueError(f"Bilinmeyen dönüştürücü tipi: {payload['type']}")
+        transformer = transformer_type.__new__(transformer_type)
+        transformer.set_state(payload['state'])
+        return transformer
+        
+    def save(self, file_path: str) -> None:
+        """
+        Dönüştürücüyü JSON dosyasına kaydeder
+        
+        Args:
+            file_path (str): Kayıt yolu
+        """
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+            
+    @staticmethod
+    def load(file_path: str) -> 'FittedTransformer':
+        """
+        Dönüştürücüyü JSON dosyasından yükler
+        
+        Args:
+            file_path (str): Dosya yolu
+            
+        Returns:
+            FittedTransformer: Dönüştürücü
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return FittedTransformer.from_dict(json.load(f))
+
+
+class Imputer(FittedTransformer):
+    """Eksik değerleri öğrenilmiş değerlerle dolduran dönüştürücü"""
+    
+    def __init__(self, strategy: str = 'mean', quantile_error: float = 0.01):
+        """
+        Imputer sınıfı başlatıcısı
+        
+        Args:
+            strategy (str): Doldurma stratejisi (mean, median, mode, drop)
+            quantile_error (float): Parçalar üzerinde medyan için hedeflenen sıra hatası
+        """
+        if strategy not in ('mean', 'median', 'mode', 'drop'):
+            raise ValueError(f"Desteklenmeyen eksik değer stratejisi: {strategy}")
+        self.strategy = strategy
+        self.quantile_error = quantile_error
+        self.fill_values: Dict[str, Any] = {}
+        
+    def fit(self, data: Union[pd.DataFrame, DataChunks]) -> 'Imputer':
+        """
+        Doldurma değerlerini öğrenir
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            Imputer: Uydurulmuş dönüştürücü
+        """
+        chunked = isinstance(data, DataChunks)
+        if self.strategy == 'mean':
+            stats = OnlineStatistics().fit(data) if chunked else OnlineStatistics().update(data)
+            fills = stats.mean
+        elif self.strategy == 'median':
+            fills = ColumnSketches(self.quantile_error).fit(data).quantile(0.5) if chunked \
+                else data.median(numeric_only=True)
+        elif self.strategy == 'mode':
+            # Parça başına değer sayımları birleştirilir; bellek kardinaliteyle sınırlıdır
+            counts: Dict[str, pd.Series] = {}
+            for chunk in (data if chunked else [data]):
+                for col in chunk.columns:
+                    chunk_counts = chunk[col].value_counts(dropna=True)
+                    counts[col] = chunk_counts if col not in counts else counts[col].add(chunk_counts, fill_value=0)
+            fills = pd.Series({
+                col: values[values == values.max()].sort_index().index[0]
+                for col, values in counts.items() if len(values)
+            }, dtype=object)
+        else:
+            fills = pd.Series(dtype=np.float64)
+            
+        self.fill_values = {col: value for col, value in fills.items() if pd.notna(value)}
+        return self
+        
+    def _transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Eksik değerleri öğrenilmiş değerlerle doldurur (drop stratejisinde eksik satırları atar)
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            
+        Returns:
+            pd.DataFrame: Doldurulmuş veri
+        """
+        if self.strategy == 'drop':
+            return data.dropna()
+        return data.fillna({col: value for col, value in self.fill_values.items() if col in data.columns})
+        
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Strateji ve doldurma değerlerini döndürür
+        
+        Returns:
+            Dict[str, Any]: Serileştirilecek parametreler
+        """
+        return {
+            'strategy': self.strategy,
+            'quantile_error': self.quantile_error,
+            # Sıralı [sütun, değer] çiftleri: JSON nesne anahtarları sütun adlarını metne çevirirdi
+            'fill_values': [[_to_json(col), _to_json(value)] for col, value in self.fill_values.items()]
+        }
+        
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Strateji ve doldurma değerlerini yükler
+        
+        Args:
+            state (Dict[str, Any]): get_state çıktısı
+        """
+        self.strategy = state['strategy']
+        self.quantile_error = state['quantile_error']
+        self.fill_values = {col: value for col, value in state['fill_values']}
+
+
+class OutlierFilter(FittedTransformer):
+    """Öğrenilmiş z-skor veya IQR sınırlarıyla aykırı satırları eleyen dönüştürücü"""
+    
+    def __init__(self, method: str = 'zscore', threshold: float = 3, quantiles: str = 'exact',
+                 quantile_error: float = 0.01):
+        """
+        OutlierFilter sınıfı başlatıcısı
+        
+        Args:
+            method (str): Aykırı değer metodu (zscore, iqr)
+            threshold (float): z-skor eşiği
+            quantiles (str): IQR kantil hesabı (exact, approx); parçalarda her zaman approx
+            quantile_error (float): approx modunda hedeflenen sıra hatası
+        """
+        if method not in ('zscore', 'iqr'):
+            raise ValueError(f"Desteklenmeyen aykırı değer metodu: {method}")
+        self.method = method
+        self.threshold = threshold
+        self.quantiles = quantiles
+        self.quantile_error = quantile_error
+        # zscore için ortalama/standart sapma, iqr için alt/üst sınır
+        self.lower: Optional[pd.Series] = None
+        self.upper: Optional[pd.Series] = None
+        
+    def fit(self, data: Union[pd.DataFrame, DataChunks]) -> 'OutlierFilter':
+        """
+        Sütun bazında z-skor parametrelerini veya IQR sınırlarını öğrenir
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            OutlierFilter: Uydurulmuş dönüştürücü
+        """
+        chunked = isinstance(data, DataChunks)
+        if self.method == 'zscore':
+            stats = OnlineStatistics().fit(data) if chunked else OnlineStatistics().update(data)
+            self.lower, self.upper = stats.mean, stats.std
+        elif chunked or self.quantiles == 'approx':
+            sketches = ColumnSketches(self.quantile_error)
+            bounds = (sketches.fit(data) if chunked else sketches.update(data)).iqr_bounds()
+            self.lower, self.upper = bounds['lower'], bounds['upper']
+        else:
+            numeric = data.select_dtypes(include=[np.number])
+            q1, q3 = numeric.quantile(0.25), numeric.quantile(0.75)
+            self.lower, self.upper = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+        return self
+        
+    def _transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Öğrenilmiş sınırların dışında kalan satırları eler
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            
+        Returns:
+            pd.DataFrame: Aykırı satırları atılmış veri
+        """
+        numeric = data[self.lower.index]
+        if self.method == 'zscore':
+            keep = (np.abs((numeric - self.lower) / self.upper) < self.threshold).all(axis=1)
+        else:
+            keep = ~((numeric < self.lower) | (numeric > self.upper)).any(axis=1)
+        return data[keep]
+        
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Metot, eşik ve sınırları döndürür
+        
+        Returns:
+            Dict[str, Any]: Serileştirilecek parametreler
+        """
+        return {
+            'method': self.method,
+            'threshold': self.threshold,
+            'quantiles': self.quantiles,
+            'quantile_error': self.quantile_error,
+            'columns': [_to_json(col) for col in self.lower.index],
+            'lower': self.lower.tolist(),
+            'upper': self.upper.tolist()
+        }
+        
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Metot, eşik ve sınırları yükler
+        
+        Args:
+            state (Dict[str, Any]): get_state çıktısı
+        """
+        self.method = state['method']
+        self.threshold = state['threshold']
+        self.quantiles = state['quantiles']
+        self.quantile_error = state['quantile_error']
+        self.lower = pd.Series(state['lower'], index=state['columns'], dtype=np.float64)
+        self.upper = pd.Series(state['upper'], index=state['columns'], dtype=np.float64)
+
+
+class CategoricalEncoder(FittedTransformer):
+    """Öğrenilmiş kategorilerle tutarlı one-hot veya etiket kodlaması yapan dönüştürücü"""
+    
+    def __init__(self, method: str = 'onehot', columns: Optional[List[str]] = None):
+        """
+        CategoricalEncoder sınıfı başlatıcısı
+        
+        Args:
+            method (str): Kodlama metodu (onehot, label)
+            columns (Optional[List[str]]): Kodlanacak sütunlar
+        """
+        if method not in ('onehot', 'label'):
+            raise ValueError(f"Desteklenmeyen kodlama metodu: {method}")
+        self.method = method
+        self.columns = list(columns or [])
+        self.categories: Dict[str, List[Any]] = {}
+        
+    def fit(self, data: Union[pd.DataFrame, DataChunks]) -> 'CategoricalEncoder':
+        """
+        Kodlanacak sütunların kategorilerini öğrenir
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            CategoricalEncoder: Uydurulmuş dönüştürücü
+        """
+        categories = {col: set() for col in self.columns}
+        if self.columns:
+            for chunk in (data if isinstance(data, DataChunks) else [data]):
+                for col in self.columns:
+                    categories[col].update(chunk[col].dropna().unique())
+        self.categories = {col: sorted(values) for col, values in categories.items()}
+        return self
+        
+    def _transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sütunları öğrenilmiş kategorilerle kodlar; görülmemiş kategoriler eksik sayılır
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            
+        Returns:
+            pd.DataFrame: Kodlanmış veri
+        """
+        data = data.copy(deep=False)
+        for col in self.columns:
+            categorical = pd.Categorical(data[col], categories=self.categories[col])
+            data[col] = categorical if self.method == 'onehot' else categorical.codes
+        if self.method == 'onehot':
+            return pd.get_dummies(data, columns=self.columns)
+        return data
+        
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Metot, sütunlar ve kategorileri döndürür
+        
+        Returns:
+            Dict[str, Any]: Serileştirilecek parametreler
+        """
+        return {
+            'method': self.method,
+            'columns': [_to_json(col) for col in self.columns],
+            'categories': [[_to_json(col), [_to_json(value) for value in values]] for col, values in self.categories.items()]
+        }
+        
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Metot, sütunlar ve kategorileri yükler
+        
+        Args:
+            state (Dict[str, Any]): get_state çıktısı
+        """
+        self.method = state['method']
+        self.columns = state['columns']
+        self.categories = {col: values for col, values in state['categories']}
+
+
+class Normalizer(FittedTransformer):
+    """Öğrenilmiş öteleme ve ölçekle minmax veya standart normalizasyon yapan dönüştürücü"""
+    
+    def __init__(self, method: str = 'minmax'):
+        """
+        Normalizer sınıfı başlatıcısı
+        
+        Args:
+            method (str): Normalizasyon metodu (minmax, standard)
+        """
+        if method not in ('minmax', 'standard'):
+            raise ValueError(f"Desteklenmeyen normalizasyon metodu: {method}")
+        self.method = method
+        self.offset: Optional[pd.Series] = None
+        self.scale: Optional[pd.Series] = None
+        
+    def fit(self, data: Union[pd.DataFrame, DataChunks]) -> 'Normalizer':
+        """
+        Sayısal sütunların öteleme ve ölçeğini öğrenir
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            Normalizer: Uydurulmuş dönüştürücü
+        """
+        stats = OnlineStatistics().fit(data) if isinstance(data, DataChunks) else OnlineStatistics().update(data)
+        if self.method == 'minmax':
+            self.offset, self.scale = stats.min, stats.max - stats.min
+        else:
+            self.offset, self.scale = stats.mean, stats.std
+        return self
+        
+    def _transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Yalnızca uydurulmuş sütunları normalize eder; diğer sütunlar değişmeden kalır
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            
+        Returns:
+            pd.DataFrame: Normalize edilmiş veri
+        """
+        columns = [col for col in self.offset.index if col in data.columns]
+        data = data.copy(deep=False)
+        data[columns] = (data[columns] - self.offset[columns]) / self.scale[columns]
+        return data
+        
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Metot, öteleme ve ölçeği döndürür
+        
+        Returns:
+            Dict[str, Any]: Serileştirilecek parametreler
+        """
+        return {
+            'method': self.method,
+            'columns': [_to_json(col) for col in self.offset.index],
+            'offset': self.offset.tolist(),
+            'scale': self.scale.tolist()
+        }
+        
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Metot, öteleme ve ölçeği yükler
+        
+        Args:
+            state (Dict[str, Any]): get_state çıktısı
+        """
+        self.method = state['method']
+        self.offset = pd.Series(state['offset'], index=state['columns'], dtype=np.float64)
+        self.scale = pd.Series(state['scale'], index=state['columns'], dtype=np.float64)
+
+
+class TransformerPipeline(FittedTransformer):
+    """
+    Dönüştürücüleri sırayla uygulayan zincir.
+    
+    Her adım, önceki adımların çıktısı üzerinde uydurulur.
+    """
+    
+    def __init__(self, steps: Optional[List[FittedTransformer]] = None):
+        """
+        TransformerPipeline sınıfı başlatıcısı
+        
+        Args:
+            steps (Optional[List[FittedTransformer]]): Dönüştürücü adımları
+        """
+        self.steps = list(steps or [])
+        
+    @classmethod
+    def from_config(cls, cleaning: Dict[str, Any], normalization: Optional[str] = None) -> 'TransformerPipeline':
+        """
+        Pipeline yapılandırmasından uydurulmamış bir zincir oluşturur
+        
+        Args:
+            cleaning (Dict[str, Any]): BASE_CONFIG['cleaning'] biçiminde temizleme ayarları
+            normalization (Optional[str]): Normalizasyon metodu (None ise normalizasyon yapılmaz)
+            
+        Returns:
+            TransformerPipeline: Dönüştürücü zinciri
+        """
+        steps: List[FittedTransformer] = []
+        if 'missing_values' in cleaning:
+            steps.append(Imputer(
+                cleaning['missing_values'].get('strategy', 'mean'),
+                cleaning['missing_values'].get('quantile_error', 0.01)
+            ))
+        if 'outliers' in cleaning:
+            steps.append(OutlierFilter(
+                cleaning['outliers'].get('method', 'zscore'),
+                cleaning['outliers'].get('threshold', 3),
+                cleaning['outliers'].get('quantiles', 'exact'),
+                cleaning['outliers'].get('quantile_error', 0.01)
+            ))
+        if 'categorical' in cleaning:
+            steps.append(CategoricalEncoder(
+                cleaning['categorical'].get('method', 'onehot'),
+                cleaning['categorical'].get('columns', [])
+            ))
+        if normalization is not None:
+            steps.append(Normalizer(normalization))
+        return cls(steps)
+        
+    def fit(self, data: Union[pd.DataFrame, DataChunks]) -> 'TransformerPipeline':
+        """
+        Adımları sırayla, her birini öncekilerin çıktısı üzerinde uydurur
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            TransformerPipeline: Uydurulmuş zincir
+        """
+        for step in self.steps:
+            step.fit(data)
+            data = step.transform(data)
+        return self
+        
+    def fit_transform(self, data: Union[pd.DataFrame, DataChunks]) -> Union[pd.DataFrame, DataChunks]:
+        """
+        Adımları sırayla uydurup uygular
+        
+        Args:
+            data (Union[pd.DataFrame, DataChunks]): Eğitim verisi veya veri parçaları
+            
+        Returns:
+            Union[pd.DataFrame, DataChunks]: Dönüştürülmüş veri veya tembel dönüştürülmüş parçalar
+        """
+        for step in self.steps:
+            data = step.fit(data).transform(data)
+        return data
+        
+    def _transform(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adımları tek bir veri çerçevesine sırayla uygular
+        
+        Args:
+            data (pd.DataFrame): Veri çerçevesi
+            
+        Returns:
+            pd.DataFrame: Dönüştürülmüş veri
+        """
+        for step in self.steps:
+            data = step._transform(data)
+        return data
+        
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Adımların serileştirilmiş hallerini döndürür
+        
+        Returns:
+            Dict[str, Any]: Serileştirilecek parametreler
+        """
+        return {'steps': [step.to_dict() for step in self.steps]}
+        
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """
+        Adımları serileştirilmiş hallerinden oluşturur
+        
+        Args:
+            state (Dict[str, Any]): get_state çıktısı
+        """
+        self.steps = [FittedTransformer.from_dict(step) for step in state['steps']]
+
+
+def _to_json(value: Any) -> Any:
+    """NumPy skalerlerini JSON uyumlu Python değerlerine çevirir"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+TRANSFORMERS = {
+    transformer.__name__: transformer
+    for transformer in (Imputer, OutlierFilter, CategoricalEncoder, Normalizer, TransformerPipeline)
+}